@@ -0,0 +1,88 @@
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+
+
+async def measure(send: Callable[[int], Awaitable[httpx.Response]], concurrency: int, total_requests: int) -> dict:
+    """
+    Calls `send(index)` `total_requests` times, keeping `concurrency` calls in flight, and times each call.
+
+    Args:
+        send (Callable[[int], Awaitable[httpx.Response]]): Sends the request number `index`.
+        concurrency (int): The number of requests kept in flight at any time.
+        total_requests (int): The number of requests to send.
+
+    Returns:
+        dict: The throughput in requests per second, the latency percentiles in milliseconds and the
+        number of failed requests (HTTP status 400 or above).
+    """
+    latencies = []
+    failures = 0
+    next_request = iter(range(total_requests))
+
+    async def client_loop():
+        nonlocal failures
+        for index in next_request:
+            started = time.perf_counter()
+            response = await send(index)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "failures": failures,
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": percentiles[49] * 1000,
+        "p95_ms": percentiles[94] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+    }
+
+
+async def run_benchmark(base_url: str, paths: List[str], concurrency: int, total_requests: int) -> dict:
+    """
+    Sends `total_requests` GET requests to a running server from `concurrency` concurrent clients.
+
+    The requests cycle through `paths`. Because the server handles all clients on one event loop per
+    worker, the throughput measured here drops sharply when a repository blocks the loop, which makes this
+    benchmark suitable for comparing a synchronous and an asynchronous data-access layer: run it once
+    against each version of the application with the same data and flags.
+
+    Args:
+        base_url (str): The URL the application is served on, e.g. `http://127.0.0.1:8000`.
+        paths (List[str]): The request paths to cycle through.
+        concurrency (int): The number of requests kept in flight at any time.
+        total_requests (int): The number of requests to send.
+
+    Returns:
+        dict: The throughput in requests per second, the latency percentiles in milliseconds and the
+        number of failed requests.
+
+    Example:
+        python -m benchmarks.concurrent_requests_benchmark --concurrency 64 --requests 5000 --path "/product/?limit=50"
+    """
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        return await measure(lambda index: client.get(paths[index % len(paths)]), concurrency, total_requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure concurrent request throughput of a running server.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", action="append", dest="paths", help="Request path, may be repeated.")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    result = asyncio.run(run_benchmark(args.base_url, args.paths or ["/product/?limit=50"], args.concurrency, args.requests))
+    for key, value in result.items():
+        print(f"{key}: {value:.2f}" if isinstance(value, float) else f"{key}: {value}")
@@ -0,0 +1,81 @@
+import argparse
+import json
+import timeit
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from core.document.dtos.document_dto import DocumentDto
+from core.document.entities.document import Document
+from core.product.dtos.product_dto import ProductDto
+from core.product.entities.product import Product
+
+
+def _raw_product() -> dict:
+    return {'_id': ObjectId(), 'code': 'P001', 'name': 'Sample Product', 'price': 19.99, 'description': 'A sample product'}
+
+
+def _raw_document(items: int) -> dict:
+    return {
+        '_id': ObjectId(),
+        'reference': 'DOC-001',
+        'consecutive': 1,
+        'datetime': datetime.now(timezone.utc),
+        'concept': 'sale',
+        'description': 'Sale of office supplies',
+        'items': [
+            {'product': {'id': ObjectId(), 'code': f'P{index:03}', 'name': 'Sample Product', 'description': None, 'price': 9.5},
+             'quantity': 2, 'price': 9.5}
+            for index in range(items)
+        ],
+    }
+
+
+def _entity_chain(entity_class, dto_class, raw: dict) -> bytes:
+    # Mirrors the former read path: hydrate the entity, validate the DTO, then let FastAPI dump it and
+    # validate it again against the response model before encoding.
+    dto = dto_class.from_entity(entity_class._from_son(raw))
+    validated = dto_class.model_validate(dto.model_dump())
+    return json.dumps(validated.model_dump(mode="json")).encode()
+
+
+def _raw_path(dto_class, raw: dict) -> bytes:
+    return dto_class.from_raw(raw).model_dump_json().encode()
+
+
+def run_benchmark(iterations: int, items: int) -> dict:
+    """
+    Measures the per-item CPU cost of serializing products and documents through the entity chain
+    (`_from_son` + `from_entity` + response model revalidation) and through the raw-dict fast path
+    (`from_raw` + compiled `model_dump_json`).
+
+    No database is needed: the raw BSON dictionaries are synthesized in memory.
+
+    Args:
+        iterations (int): How many times each path is run.
+        items (int): The number of items of the synthetic document.
+
+    Returns:
+        dict: Microseconds per call of each path, for products and for documents.
+
+    Example:
+        python -m benchmarks.dto_serialization_benchmark --iterations 20000 --items 20
+    """
+    product, document = _raw_product(), _raw_document(items)
+    cases = {
+        "product_entity_chain_us": lambda: _entity_chain(Product, ProductDto, product),
+        "product_raw_path_us": lambda: _raw_path(ProductDto, product),
+        "document_entity_chain_us": lambda: _entity_chain(Document, DocumentDto, document),
+        "document_raw_path_us": lambda: _raw_path(DocumentDto, document),
+    }
+    return {name: timeit.timeit(case, number=iterations) / iterations * 1e6 for name, case in cases.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the entity and raw-dict serialization paths.")
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--items", type=int, default=20, help="Items in the synthetic document.")
+    args = parser.parse_args()
+
+    for name, value in run_benchmark(args.iterations, args.items).items():
+        print(f"{name}: {value:.2f}")
@@ -0,0 +1,108 @@
+import random
+from collections import defaultdict
+from datetime import datetime, timezone, timedelta
+from typing import List, NamedTuple
+
+from pymongo.asynchronous.database import AsyncDatabase
+
+from core.counter.entities.counter import Counter
+from core.document.entities.document import Document
+from core.document.entities.document_item import DocumentItem
+from core.document.entities.product_snapshot import ProductSnapshot
+from core.product.entities.product import Product
+from core.stock.entities.stock_balance import StockBalance
+from infrastructure.settings import settings
+
+SEED_CONCEPTS = ("purchase", "sale")
+
+
+class SeedData(NamedTuple):
+    """
+    Identifiers of the synthetic data inserted by `seed`, used to build realistic requests.
+
+    Attributes:
+        product_ids (List[str]): The ids of the seeded products.
+        references (List[str]): The references of the seeded documents.
+    """
+    product_ids: List[str]
+    references: List[str]
+
+
+async def seed(database: AsyncDatabase, products: int, documents: int, items_per_document: int,
+               chunk_size: int = 5000, random_seed: int = 0) -> SeedData:
+    """
+    Fills an empty database with a synthetic catalog and document history.
+
+    The data is generated deterministically from `random_seed` and written through the entities' `to_mongo`,
+    so it has the same shape as data created through the API: products with unique codes, documents spread
+    over the last 90 days with embedded product snapshots, the matching counters and stock balances.
+
+    Args:
+        database (AsyncDatabase): The database to fill. It is expected to be empty.
+        products (int): The number of products to create.
+        documents (int): The number of documents to create.
+        items_per_document (int): The number of items of each document.
+        chunk_size (int): The number of records per `insert_many`. Defaults to 5000.
+        random_seed (int): The seed of the data generator. Defaults to 0.
+
+    Returns:
+        SeedData: The product ids and document references that were created.
+
+    Example:
+        data = await seed(client["inventory_benchmark"], products=10000, documents=50000, items_per_document=5)
+    """
+    generator = random.Random(random_seed)
+
+    catalog = []
+    for index in range(products):
+        product = Product(
+            code=f"BENCH-{index:07}",
+            name=f"Benchmark product {index}",
+            price=round(generator.uniform(1, 500), 2),
+            description=f"Synthetic product number {index}",
+        )
+        catalog.append(product.to_mongo().to_dict())
+    for start in range(0, len(catalog), chunk_size):
+        await database[Product._get_collection_name()].insert_many(catalog[start:start + chunk_size])
+    snapshots = [ProductSnapshot.from_product(Product._from_son(raw)) for raw in catalog]
+
+    now = datetime.now(timezone.utc)
+    consecutives = defaultdict(int)
+    stock = defaultdict(int)
+    references = []
+    batch = []
+    for index in range(documents):
+        concept = SEED_CONCEPTS[index % len(SEED_CONCEPTS)]
+        consecutives[concept] += 1
+        items = []
+        for snapshot in generator.sample(snapshots, min(items_per_document, len(snapshots))):
+            quantity = generator.randint(1, 20)
+            items.append(DocumentItem(product=snapshot, quantity=quantity, price=snapshot.price))
+            stock[snapshot.id] += settings.stock_sign(concept) * quantity
+
+        reference = f"BENCH-DOC-{index:08}"
+        references.append(reference)
+        batch.append(Document(
+            reference=reference,
+            consecutive=consecutives[concept],
+            datetime=now - timedelta(seconds=generator.uniform(0, 90 * 24 * 3600)),
+            concept=concept,
+            description="Synthetic document",
+            items=items,
+        ).to_mongo().to_dict())
+        if len(batch) >= chunk_size:
+            await database[Document._get_collection_name()].insert_many(batch)
+            batch = []
+    if batch:
+        await database[Document._get_collection_name()].insert_many(batch)
+
+    if consecutives:
+        await database[Counter._get_collection_name()].insert_many(
+            [{'name': concept, 'value': value} for concept, value in consecutives.items()]
+        )
+    if stock:
+        await database[StockBalance._get_collection_name()].insert_many(
+            [{'_id': product_id, 'quantity': quantity} for product_id, quantity in stock.items()]
+        )
+
+    return SeedData(product_ids=[str(raw['_id']) for raw in catalog], references=references)
@@ -0,0 +1,73 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+import httpx
+
+IMPORT_SNIPPET = "import time; started = time.perf_counter(); import main; print(time.perf_counter() - started)"
+
+
+def _environment(discovery: str) -> dict:
+    # Index builds and other startup I/O are disabled so only the application's own start is measured; the
+    # MongoDB client connects lazily, so no server is needed.
+    return {**os.environ, "ENDPOINT_DISCOVERY": discovery, "INDEX_BUILD_MODE": "off", "DEBUG": "false"}
+
+
+def measure_import(discovery: str, runs: int) -> List[float]:
+    """
+    Imports `main` in `runs` fresh interpreters and returns the import times in seconds.
+    """
+    return [
+        float(subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET], env=_environment(discovery), capture_output=True, text=True, check=True,
+        ).stdout.strip())
+        for _ in range(runs)
+    ]
+
+
+def measure_first_request(discovery: str, runs: int, port: int, path: str) -> List[float]:
+    """
+    Starts `uvicorn main:app` `runs` times and returns, for each start, the seconds elapsed from spawning the
+    process until `path` first answered successfully.
+    """
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+            env=_environment(discovery),
+        )
+        try:
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError("The application exited during startup")
+                try:
+                    if httpx.get(f"http://127.0.0.1:{port}{path}").status_code < 400:
+                        break
+                except httpx.TransportError:
+                    time.sleep(0.005)
+            times.append(time.perf_counter() - started)
+        finally:
+            server.terminate()
+            server.wait()
+    return times
+
+
+def _summary(times: List[float]) -> str:
+    return f"median {statistics.median(times) * 1000:8.1f} ms  min {min(times) * 1000:8.1f} ms"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the import time and time to first request of main:app.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--path", default="/product/cache/stats", help="A route that does not need MongoDB.")
+    args = parser.parse_args()
+
+    for discovery in ("manifest", "discovery"):
+        print(f"{discovery:<10} import             {_summary(measure_import(discovery, args.runs))}")
+        print(f"{discovery:<10} first request      {_summary(measure_first_request(discovery, args.runs, args.port, args.path))}")
@@ -0,0 +1,293 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, List, NamedTuple, Optional
+
+import httpx
+from pymongo import AsyncMongoClient
+
+from benchmarks.concurrent_requests_benchmark import measure
+from benchmarks.seed import SeedData, seed
+
+
+class Scenario(NamedTuple):
+    """
+    One route driven by the benchmark suite.
+
+    Attributes:
+        name (str): The name the results are reported and saved under.
+        send (Callable): Sends request number `index` with the given client, seed data and random generator.
+        weight (float): The fraction of `--requests` sent for this scenario, for routes that are much more
+            expensive per request (e.g. streaming the whole catalog).
+    """
+    name: str
+    send: Callable[[httpx.AsyncClient, SeedData, int, random.Random], Awaitable[httpx.Response]]
+    weight: float = 1.0
+
+
+RUN_ID = uuid.uuid4().hex[:8]
+
+
+def _new_document(data: SeedData, generator: random.Random, reference: str) -> dict:
+    items = [{"product_id": product_id, "quantity": generator.randint(1, 5)}
+             for product_id in generator.sample(data.product_ids, min(5, len(data.product_ids)))]
+    return {"reference": reference, "concept": generator.choice(("purchase", "sale")), "items": items}
+
+
+def _new_product(index: int, prefix: str) -> dict:
+    return {"code": f"{prefix}-{RUN_ID}-{index}", "name": "Benchmark product", "price": 9.99}
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario("product.create", lambda client, data, index, generator: client.post("/product/", json=_new_product(index, "CREATE"))),
+    Scenario("product.list_page", lambda client, data, index, generator: client.get("/product/", params={"limit": 50})),
+    Scenario("product.list_ndjson", lambda client, data, index, generator: client.get("/product/", params={"format": "ndjson"}), 0.01),
+    Scenario("product.get_by_id", lambda client, data, index, generator: client.get(f"/product/{generator.choice(data.product_ids)}")),
+    Scenario("product.update", lambda client, data, index, generator: client.put(
+        f"/product/{generator.choice(data.product_ids)}",
+        json={"code": f"UPDATE-{RUN_ID}-{index}", "name": "Updated product", "price": 19.99},
+    )),
+    Scenario("product.bulk_import", lambda client, data, index, generator: client.post(
+        "/product/bulk",
+        content="\n".join(json.dumps(_new_product(index * 100 + row, "BULK")) for row in range(100)),
+        headers={"Content-Type": "application/x-ndjson"},
+    ), 0.1),
+    Scenario("product.search", lambda client, data, index, generator: client.get(
+        "/product/search", params={"q": f"benchmark product {generator.randint(1, 99)}", "limit": 10},
+    )),
+    Scenario("product.cache_stats", lambda client, data, index, generator: client.get("/product/cache/stats")),
+    Scenario("product.stock", lambda client, data, index, generator: client.get(f"/product/{generator.choice(data.product_ids)}/stock")),
+    Scenario("product.stock_at", lambda client, data, index, generator: client.get(
+        f"/product/{generator.choice(data.product_ids)}/stock",
+        params={"at": (datetime.now(timezone.utc) - timedelta(days=generator.randint(1, 90))).isoformat()},
+    )),
+    Scenario("product.stock_many", lambda client, data, index, generator: client.get(
+        "/product/stock", params={"ids": generator.sample(data.product_ids, min(50, len(data.product_ids)))},
+    )),
+    Scenario("document.create", lambda client, data, index, generator: client.post(
+        "/document/", json=_new_document(data, generator, f"CREATE-{RUN_ID}-{index}"),
+    )),
+    Scenario("document.search", lambda client, data, index, generator: client.get(
+        "/document/", params={"concept": generator.choice(("purchase", "sale")), "limit": 50},
+    )),
+    Scenario("document.search_by_product", lambda client, data, index, generator: client.get(
+        "/document/", params={"product_id": generator.choice(data.product_ids), "include_items": "true", "limit": 20},
+    )),
+    Scenario("document.get_by_reference", lambda client, data, index, generator: client.get(f"/document/{generator.choice(data.references)}")),
+    Scenario("document.export_csv", lambda client, data, index, generator: client.get(
+        "/document/export", params={"concept": generator.choice(("purchase", "sale"))},
+    ), 0.005),
+    Scenario("document.cache_stats", lambda client, data, index, generator: client.get("/document/cache/stats")),
+    Scenario("document.bulk_create", lambda client, data, index, generator: client.post(
+        "/document/bulk", json=[_new_document(data, generator, f"BULK-{RUN_ID}-{index}-{row}") for row in range(50)],
+    ), 0.1),
+]
+"""
+The routes driven by the suite, one scenario per endpoint module in `core/product/endpoints` and
+`core/document/endpoints` (plus variants for routes with distinct modes).
+"""
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def _wait_until_ready(base_url: str, server: subprocess.Popen, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise RuntimeError("The application exited during startup")
+            try:
+                if (await client.get("/product/", params={"limit": 1})).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError("The application did not become ready in time")
+
+
+async def measure_export(http: httpx.AsyncClient, format: str) -> Optional[dict]:
+    """
+    Downloads the whole `GET /document/export` once in the given format and measures how long it takes.
+
+    Returns:
+        Optional[dict]: The `bytes` received, the `seconds` taken, the largest chunk received
+        (`max_chunk_bytes`) and, for CSV, the number of `rows`. None if the format is not available (e.g.
+        pyarrow is not installed).
+    """
+    started = time.perf_counter()
+    result = {"bytes": 0, "max_chunk_bytes": 0}
+    lines = 0
+    async with http.stream("GET", "/document/export", params={"format": format}) as response:
+        if response.status_code != 200:
+            return None
+        async for chunk in response.aiter_bytes():
+            result["bytes"] += len(chunk)
+            result["max_chunk_bytes"] = max(result["max_chunk_bytes"], len(chunk))
+            lines += chunk.count(b"\n")
+    result["seconds"] = time.perf_counter() - started
+    if format == "csv":
+        result["rows"] = lines - 1
+    return result
+
+
+async def run_suite(args: argparse.Namespace) -> dict:
+    """
+    Seeds a benchmark database, boots `main:app` against it and measures every scenario in `SCENARIOS`.
+
+    The database named by `--database` is dropped and re-seeded first, so every run starts from the same
+    data. The application runs in a separate `uvicorn` process, with indexes built before it starts serving.
+    After the scenarios, the whole document export is downloaded once per format to measure its rows/sec.
+
+    Returns:
+        dict: The commit, the configuration of the run, the results of each scenario and of each export.
+    """
+    if "bench" not in args.database:
+        raise SystemExit("Refusing to drop a database whose name does not contain 'bench'")
+
+    client = AsyncMongoClient(args.mongo_uri)
+    try:
+        await client.drop_database(args.database)
+        started = time.perf_counter()
+        data = await seed(client[args.database], args.products, args.documents, args.items_per_document)
+        print(f"Seeded {args.products} products and {args.documents} documents in {time.perf_counter() - started:.1f}s")
+    finally:
+        await client.close()
+
+    env = {**os.environ, "MONGO_URI": args.mongo_uri, "MONGO_DATABASE": args.database, "INDEX_BUILD_MODE": "blocking"}
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(args.port), "--workers", str(args.workers), "--log-level", "warning"],
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = {}
+    exports = {}
+    try:
+        await _wait_until_ready(base_url, server)
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as http:
+            for scenario in SCENARIOS:
+                if args.only and not any(scenario.name.startswith(prefix) for prefix in args.only):
+                    continue
+                generator = random.Random(scenario.name)
+                total = max(1, int(args.requests * scenario.weight))
+                results[scenario.name] = await measure(
+                    lambda index, scenario=scenario: scenario.send(http, data, index, generator),
+                    min(args.concurrency, total),
+                    total,
+                )
+                print(_format_result(scenario.name, results[scenario.name]))
+
+            if not args.only or any("export".startswith(prefix) for prefix in args.only):
+                csv_export = await measure_export(http, "csv")
+                for format, export in (("csv", csv_export), ("parquet", await measure_export(http, "parquet"))):
+                    if export is None or csv_export is None:
+                        print(f"export.{format:<21} unavailable")
+                        continue
+                    export["rows"] = csv_export["rows"]
+                    export["rows_per_second"] = export["rows"] / export["seconds"]
+                    exports[format] = export
+                    print(_format_export(format, export))
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {
+        "commit": _git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "config": {key: getattr(args, key) for key in ("products", "documents", "items_per_document", "concurrency", "requests", "workers")},
+        "scenarios": results,
+        "exports": exports,
+    }
+
+
+def _format_export(format: str, export: dict) -> str:
+    return (f"{'export.' + format:<28} {export['rows_per_second']:>9.0f} rows/s  {export['rows']} rows  "
+            f"{export['bytes'] / 1e6:.1f} MB in {export['seconds']:.2f} s")
+
+
+def _format_result(name: str, result: dict) -> str:
+    return (f"{name:<28} {result['throughput_rps']:>9.1f} req/s  p50 {result['p50_ms']:>8.2f} ms  "
+            f"p95 {result['p95_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  failures {result['failures']}")
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> List[str]:
+    """
+    Compares two suite results and returns the scenarios that regressed.
+
+    A scenario regresses when its throughput drops, or its p95 latency grows, by more than `tolerance`
+    (a fraction, e.g. 0.1 for 10%) relative to the baseline. An export regresses when its rows per second
+    drop by more than `tolerance`.
+
+    Args:
+        baseline (dict): A result previously saved by the suite.
+        current (dict): The result of the current run.
+        tolerance (float): The relative change tolerated before a scenario counts as regressed.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    print(f"\nCompared with {baseline.get('commit', 'baseline')}:")
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        throughput = result["throughput_rps"] / before["throughput_rps"] - 1
+        p95 = result["p95_ms"] / before["p95_ms"] - 1
+        print(f"{name:<28} throughput {throughput:+7.1%}  p95 {p95:+7.1%}")
+        if throughput < -tolerance or p95 > tolerance:
+            regressions.append(f"{name}: throughput {throughput:+.1%}, p95 {p95:+.1%}")
+    for format, export in current.get("exports", {}).items():
+        before = baseline.get("exports", {}).get(format)
+        if before is None:
+            continue
+        throughput = export["rows_per_second"] / before["rows_per_second"] - 1
+        print(f"{'export.' + format:<28} rows/s {throughput:+7.1%}")
+        if throughput < -tolerance:
+            regressions.append(f"export.{format}: rows/s {throughput:+.1%}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed a benchmark database and measure every route of main:app.")
+    parser.add_argument("--mongo-uri", default=os.getenv("BENCHMARK_MONGO_URI", "mongodb://localhost:27017"))
+    parser.add_argument("--database", default="inventory_benchmark", help="Dropped and re-seeded on every run.")
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--items-per-document", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per scenario, scaled by its weight.")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--only", action="append",
+                        help="Only run scenarios whose name starts with this prefix (`export` for the export throughput).")
+    parser.add_argument("--output", help="Where to save the results (default: benchmarks/results/<commit>.json).")
+    parser.add_argument("--compare", help="A previously saved result to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative change tolerated when comparing.")
+    args = parser.parse_args()
+
+    result = asyncio.run(run_suite(args))
+
+    output = Path(args.output or f"benchmarks/results/{result['commit']}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"\nSaved results to {output}")
+
+    if args.compare:
+        regressions = compare(json.loads(Path(args.compare).read_text()), result, args.tolerance)
+        if regressions:
+            print("\nRegressions:\n" + "\n".join(regressions))
+            sys.exit(1)
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class CacheStatsDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for representing the counters of a cache: its in-process tier and, when a
+    shared cache backend is configured, its shared tier.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that found no (fresh) entry.
+        evictions (int): Number of entries dropped to respect the size bounds.
+        expirations (int): Number of entries dropped because their time-to-live elapsed.
+        entries (int): Number of entries currently cached.
+        bytes (int): Approximate size of the cached entries, in bytes.
+        max_entries (Optional[int]): The configured entry bound, if any.
+        max_bytes (Optional[int]): The configured size bound in bytes, if any.
+        shared_hits (Optional[int]): Number of in-process misses answered by the shared cache.
+        shared_misses (Optional[int]): Number of in-process misses not found in the shared cache either.
+        shared_errors (Optional[int]): Number of failed shared cache operations, treated as misses.
+
+    Example:
+        stats = CacheStatsDto(**product_cache.stats())
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    bytes: int
+    max_entries: Optional[int] = None
+    max_bytes: Optional[int] = None
+    shared_hits: Optional[int] = None
+    shared_misses: Optional[int] = None
+    shared_errors: Optional[int] = None
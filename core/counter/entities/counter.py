@@ -11,21 +11,23 @@ class Counter(Document):
 
     Attributes:
         name (str): The name of the counter, which must be unique.
-        value (int): The current value of the counter, starting from 0 by default.
+        value (int): The last value handed out (or reserved, when values are allocated in blocks) by the
+            counter, starting from 0 by default.
 
     Meta:
         collection (str): The name of the MongoDB collection where the counter is stored.
         db_alias (str): The alias of the database where the counter collection resides.
 
     Example:
-        counter = Counter.objects(name="invoice_number").first()
+        counter = await get_collection(Counter).find_one({"name": "invoice_number"})
         if counter:
-            print(counter.value)  # Output: current counter value
+            print(counter["value"])  # Output: current counter value
     """
 
     meta = {
         'collection': 'counters',
-        'db_alias': 'inventory'
+        'db_alias': 'inventory',
+        'auto_create_index': False
     }
 
     name = StringField(required=True, unique=True)
@@ -1,13 +1,33 @@
-from core.counter.entities.counter import Counter
+import asyncio
+from typing import Dict
+
+from core.counter.repositories.reserve_sequence_block_repo import reserve_sequence_block_repo
+from infrastructure.settings import settings
+
+
+class _SequenceBlock:
+    """
+    A block of consecutive values reserved by this worker process for a single counter.
+    """
+
+    def __init__(self):
+        self.next = 1
+        self.last = 0
+        self.lock = asyncio.Lock()
+
+
+_blocks: Dict[str, _SequenceBlock] = {}
 
 
 async def get_next_sequence_repo(name: str) -> int:
     """
     Retrieves the next sequential value for a given counter. If the counter does not exist, it is created.
 
-    This function fetches the counter by its name from the database. If the counter is not found, a new
-    counter is created with an initial value of 1. After retrieving or creating the counter, the value
-    is incremented by 1 and returned.
+    When the counter's block size is 1 (the default), every call performs a single atomic
+    `find_one_and_update` on the counter, so concurrent callers never receive the same value. When a larger
+    block size is configured (see `Settings.counter_block_size`), the worker reserves that many values with one
+    update and hands them out from memory until the block is exhausted (hi/lo allocation), trading gap-free,
+    globally ordered numbering for one database write per block.
 
     Args:
         name (str): The name of the counter for which to get the next sequential value.
@@ -22,10 +42,16 @@ async def get_next_sequence_repo(name: str) -> int:
         next_value = await get_next_sequence_repo("invoice_number")
         print(next_value)  # Output: next sequential value for "invoice_number" counter
     """
-    counter = await Counter.objects(name=name).first()
-    if not counter:
-        counter = Counter(name=name, value=1)
-        await counter.save()
-
-    await counter.update(inc__value=1)
-    return counter.value
+    block_size = settings.counter_block_size(name)
+    if block_size == 1:
+        return await reserve_sequence_block_repo(name)
+
+    block = _blocks.setdefault(name, _SequenceBlock())
+    async with block.lock:
+        if block.next > block.last:
+            block.last = await reserve_sequence_block_repo(name, block_size)
+            block.next = block.last - block_size + 1
+
+        value = block.next
+        block.next += 1
+        return value
@@ -0,0 +1,34 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from core.counter.entities.counter import Counter
+from infrastructure.database import get_collection
+
+
+async def reserve_sequence_block_repo(name: str, size: int = 1) -> int:
+    """
+    Atomically reserves a block of `size` consecutive values for a given counter.
+
+    The counter is incremented by `size` with a single `find_one_and_update` (upserting the counter if it does
+    not exist yet) and the updated value is returned. The reserved block is therefore the range
+    `[last - size + 1, last]`, which no other caller can receive. If two callers race to create the same
+    counter, the loser of the unique index race retries once against the now existing counter.
+
+    Args:
+        name (str): The name of the counter to reserve values from.
+        size (int): The number of consecutive values to reserve. Defaults to 1.
+
+    Returns:
+        int: The last value of the reserved block.
+
+    Example:
+        last = await reserve_sequence_block_repo("sale", 100)
+        block = range(last - 99, last + 1)
+    """
+    counters = get_collection(Counter)
+    query, update = {'name': name}, {'$inc': {'value': size}}
+    try:
+        counter = await counters.find_one_and_update(query, update, upsert=True, return_document=ReturnDocument.AFTER)
+    except DuplicateKeyError:
+        counter = await counters.find_one_and_update(query, update, upsert=True, return_document=ReturnDocument.AFTER)
+    return counter['value']
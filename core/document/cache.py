@@ -0,0 +1,44 @@
+from core.document.dtos.document_dto import DocumentDto, stored_datetime
+from infrastructure.lru_cache import LruCache
+from infrastructure.settings import settings
+from infrastructure.shared_cache import TieredCache
+
+document_cache = TieredCache(
+    "document",
+    LruCache(
+        max_entries=settings.document_cache_max_entries,
+        max_bytes=settings.document_cache_max_bytes,
+        sizeof=len,
+    ),
+    encode=bytes,
+    decode=bytes,
+)
+"""
+Process-wide cache of serialized documents (the JSON body of `GET /document/{reference}`), keyed by reference.
+
+Documents are never modified once created, so entries have no time-to-live: they stay until evicted by the
+size bounds. The cache is filled when a document is created (`cache_document`) and on the first read of a
+document created by another worker, so repeated reads skip both the database and the serialization. With a
+shared cache backend, the serialized documents are shared by every worker as they are.
+"""
+
+
+async def cache_document(document: DocumentDto) -> bytes:
+    """
+    Serializes a document and caches it under its reference.
+
+    The datetime is first rounded the way MongoDB stores it (see `stored_datetime`), so a document
+    cached right after its creation serializes exactly as it does when read back from the database.
+
+    Args:
+        document (DocumentDto): The document, with its items.
+
+    Returns:
+        bytes: The serialized document.
+
+    Example:
+        content = await cache_document(DocumentDto.from_raw(raw))
+    """
+    content = document.model_copy(update={'datetime': stored_datetime(document.datetime)}).model_dump_json().encode()
+    await document_cache.fill(document.reference, content)
+    return content
@@ -0,0 +1,97 @@
+import argparse
+
+from pymongo import UpdateOne
+
+from core.document.entities.document import Document
+from core.document.entities.product_snapshot import ProductSnapshot
+from core.product.entities.product import Product
+from infrastructure.command import run_with_mongo
+from infrastructure.database import get_collection
+
+DELETED_PRODUCT_CODE = "DELETED"
+DELETED_PRODUCT_NAME = "Deleted product"
+
+
+def _deleted_product_snapshot(product_id, price: float) -> dict:
+    return ProductSnapshot(id=product_id, code=DELETED_PRODUCT_CODE, name=DELETED_PRODUCT_NAME,
+                           price=price).to_mongo().to_dict()
+
+
+async def backfill_product_snapshots(batch_size: int = 500) -> int:
+    """
+    Replaces product references in existing document items with embedded `ProductSnapshot`s.
+
+    Documents created before items embedded a product snapshot store only the product's ObjectId in
+    `items.product`. This command walks those documents in `_id` order, `batch_size` documents at a time,
+    resolves all products referenced by a batch with a single `$in` query and rewrites the batch with one
+    unordered bulk write. The command is idempotent: already migrated documents are never selected again,
+    so it can be interrupted and re-run safely.
+
+    Items whose product no longer exists get a placeholder snapshot holding the product's id, the code
+    `DELETED`, the name "Deleted product" and the item's price, so every item has the shape the read paths
+    expect. The documents with such items are counted separately and their product ids reported at the end.
+
+    Args:
+        batch_size (int): The number of documents to migrate per batch. Defaults to 500.
+
+    Returns:
+        int: The number of documents migrated, including those with deleted products.
+
+    Example:
+        python -m core.document.commands.backfill_product_snapshots_command --batch-size 1000
+    """
+    documents = get_collection(Document)
+    products = get_collection(Product)
+
+    migrated = 0
+    with_deleted_products = 0
+    missing_product_ids = set()
+    last_id = None
+    while True:
+        query = {"items.product": {"$type": "objectId"}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+
+        batch = await documents.find(query, {"items": 1}).sort("_id", 1).limit(batch_size).to_list()
+        if not batch:
+            break
+        last_id = batch[-1]["_id"]
+
+        product_ids = {item["product"] for raw in batch for item in raw["items"] if not isinstance(item["product"], dict)}
+        snapshots = {
+            raw["_id"]: ProductSnapshot.from_product(Product._from_son(raw)).to_mongo().to_dict()
+            async for raw in products.find({"_id": {"$in": list(product_ids)}})
+        }
+        missing_product_ids.update(product_ids - snapshots.keys())
+
+        operations = []
+        for raw in batch:
+            items = []
+            has_deleted_products = False
+            for item in raw["items"]:
+                if not isinstance(item["product"], dict):
+                    snapshot = snapshots.get(item["product"])
+                    if snapshot is None:
+                        snapshot = _deleted_product_snapshot(item["product"], item["price"])
+                        has_deleted_products = True
+                    item = {**item, "product": snapshot}
+                items.append(item)
+            with_deleted_products += has_deleted_products
+            operations.append(UpdateOne({"_id": raw["_id"]}, {"$set": {"items": items}}))
+
+        await documents.bulk_write(operations, ordered=False)
+        migrated += len(operations)
+        print(f"Migrated {migrated} documents ({with_deleted_products} with deleted products)")
+
+    if missing_product_ids:
+        print(f"Products not found, items given a placeholder snapshot: {', '.join(map(str, sorted(missing_product_ids)))}")
+
+    return migrated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Embed product snapshots into existing document items.")
+    parser.add_argument("--batch-size", type=int, default=500, help="Documents migrated per batch.")
+    args = parser.parse_args()
+
+    run_with_mongo(lambda: backfill_product_snapshots(args.batch_size))
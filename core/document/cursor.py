@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta, timezone
+from typing import Tuple
+
+from bson import ObjectId
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_document_cursor(raw: dict) -> str:
+    """
+    Builds the keyset pagination cursor pointing at a raw document: its `datetime` (in epoch milliseconds,
+    the precision MongoDB stores) and its `_id`, which breaks ties between documents created in the same
+    millisecond.
+
+    Example:
+        encode_document_cursor(raw)  # Output: "1732096800000_60c72b2f9b1d8f7c6d0f1a2d"
+    """
+    moment = raw['datetime'] if raw['datetime'].tzinfo else raw['datetime'].replace(tzinfo=timezone.utc)
+    milliseconds = (moment - _EPOCH) // timedelta(milliseconds=1)
+    return f"{milliseconds}_{raw['_id']}"
+
+
+def decode_document_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """
+    Parses a cursor built by `encode_document_cursor` back into the `datetime` and `_id` it points at.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    milliseconds, _, document_id = cursor.partition("_")
+    if not milliseconds.lstrip("-").isdigit() or not ObjectId.is_valid(document_id):
+        raise ValueError("Invalid cursor")
+    return _EPOCH + timedelta(milliseconds=int(milliseconds)), ObjectId(document_id)
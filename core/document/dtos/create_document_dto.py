@@ -1,6 +1,6 @@
 from typing import Optional, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from core.document.dtos.create_document_item_dto import CreateDocumentItemDto
 
@@ -17,7 +17,8 @@ class CreateDocumentDto(BaseModel):
         reference (str): The unique reference identifier for the document.
         concept (str): The concept or purpose of the document.
         description (Optional[str]): An optional description providing more details about the document.
-        items (List[CreateDocumentItemDto]): A list of items that are part of the document.
+        items (List[CreateDocumentItemDto]): A list of items that are part of the document. At least one
+            item is required.
 
     Usage:
         To create a document, an instance of `CreateDocumentDto` is used to encapsulate the data.
@@ -39,7 +40,7 @@ class CreateDocumentDto(BaseModel):
     reference: str
     concept: str
     description: Optional[str] = None
-    items: List[CreateDocumentItemDto]
+    items: List[CreateDocumentItemDto] = Field(min_length=1)
 
     class Config:
         from_orm = True
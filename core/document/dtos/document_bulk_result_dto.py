@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from core.document.dtos.document_dto import DocumentDto
+
+
+class DocumentBulkResultDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for the outcome of one document in a bulk creation.
+
+    Attributes:
+        reference (str): The reference of the document, as submitted.
+        document (Optional[DocumentDto]): The created document, or None if it could not be created.
+        error (Optional[str]): Why the document could not be created, or None on success.
+
+    Example:
+        result = DocumentBulkResultDto(reference="DOC-001", error="Products with IDs 123 not found")
+    """
+    reference: str
+    document: Optional[DocumentDto] = None
+    error: Optional[str] = None
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List
 
 from pydantic import BaseModel
@@ -6,6 +6,30 @@ from pydantic import BaseModel
 from core.document.dtos.document_item_dto import DocumentItemDto
 from core.document.entities.document import Document
 
+DOCUMENT_PROJECTION = {'reference': 1, 'consecutive': 1, 'datetime': 1, 'concept': 1, 'description': 1, 'items': 1}
+"""
+The document fields read by `DocumentDto.from_raw`, for use as a query projection.
+"""
+
+DOCUMENT_SUMMARY_PROJECTION = {field: 1 for field in DOCUMENT_PROJECTION if field != 'items'}
+"""
+`DOCUMENT_PROJECTION` without the items, for listings that do not need them.
+"""
+
+
+
+def stored_datetime(value: datetime) -> datetime:
+    """
+    Rounds a datetime the way MongoDB stores it: naive UTC, at millisecond precision.
+
+    Example:
+        stored_datetime(datetime(2024, 5, 1, 10, 0, 0, 123456, tzinfo=timezone.utc))
+        # Output: datetime(2024, 5, 1, 10, 0, 0, 123000)
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
 
 class DocumentDto(BaseModel):
     """
@@ -21,11 +45,13 @@ class DocumentDto(BaseModel):
         datetime (datetime): The date and time when the document was created.
         concept (str): A description or concept of the document.
         description (Optional[str]): An optional description for the document.
-        items (List[DocumentItemDto]): A list of items (DocumentItemDto) associated with the document.
+        items (Optional[List[DocumentItemDto]]): A list of items (DocumentItemDto) associated with the document,
+            or None when they were left out of a search result.
 
     Usage:
         This class is used to represent a document in a format suitable for data transfer. The `from_entity` method
-        is used to convert an actual document entity (usually a database model) into an instance of this DTO.
+        is used to convert an actual document entity (usually a database model) into an instance of this DTO, and
+        the `from_raw` method builds it straight from a raw MongoDB document on read paths.
 
     Example:
         document_dto = DocumentDto.from_entity(document)
@@ -40,7 +66,7 @@ class DocumentDto(BaseModel):
     datetime: datetime
     concept: str
     description: Optional[str] = None
-    items: List[DocumentItemDto]
+    items: Optional[List[DocumentItemDto]] = None
 
     @classmethod
     def from_entity(cls, document: Document) -> "DocumentDto":
@@ -54,14 +80,57 @@ class DocumentDto(BaseModel):
             DocumentDto: The corresponding DTO instance.
         """
         return cls(
-            id=document.id,
+            id=str(document.id),
             reference=document.reference,
-            consecutive=document.consecutive,
+            consecutive=str(document.consecutive),
             datetime=document.datetime,
             concept=document.concept,
             description=document.description,
             items=[DocumentItemDto.from_entity(item) for item in document.items],
         )
 
+    @classmethod
+    def from_raw(cls, raw: dict) -> "DocumentDto":
+        """
+        Builds a DocumentDto directly from a raw document, without validation.
+
+        The document is trusted, as it was written through the `Document` entity, so the DTO is built with
+        `model_construct`, skipping both the entity hydration and the Pydantic validation of `from_entity`.
+        If the items were not projected, `items` is None.
+
+        Args:
+            raw (dict): The document as read from MongoDB.
+
+        Returns:
+            DocumentDto: The corresponding DTO instance.
+        """
+        return cls.model_construct(
+            id=str(raw['_id']),
+            reference=raw['reference'],
+            consecutive=str(raw['consecutive']),
+            datetime=raw['datetime'],
+            concept=raw['concept'],
+            description=raw.get('description'),
+            items=[DocumentItemDto.from_raw(item) for item in raw['items']] if 'items' in raw else None,
+        )
+
+    @classmethod
+    def from_stored(cls, document: Document) -> "DocumentDto":
+        """
+        Builds a DocumentDto from a document just written to MongoDB, as it reads back from the database.
+
+        Unlike `from_entity`, the datetime is rounded with `stored_datetime`, so the DTO is identical to the
+        one `from_raw` builds when the document is read later, e.g. when a request is retried.
+
+        Args:
+            document (Document): The inserted document entity, with its id.
+
+        Returns:
+            DocumentDto: The corresponding DTO instance.
+        """
+        raw = document.to_mongo().to_dict()
+        raw['datetime'] = stored_datetime(raw['datetime'])
+        return cls.from_raw(raw)
+
     class Config:
         from_orm = True
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+from pydantic import BaseModel
+
+DOCUMENT_EXPORT_COLUMNS = (
+    "reference", "concept", "consecutive", "datetime", "description",
+    "product_id", "product_code", "product_name", "quantity", "price", "total",
+)
+"""
+The columns of a document export, one row per document item.
+"""
+
+
+class DocumentExportDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for the filters of a document export.
+
+    Both filters are optional and combined with AND. The date range is inclusive of its lower bound and
+    exclusive of its upper bound, so month-end exports can be chained without overlaps.
+
+    Attributes:
+        concept (Optional[str]): Only documents of this concept.
+        datetime_from (Optional[datetime]): Only documents created at or after this moment.
+        datetime_to (Optional[datetime]): Only documents created before this moment.
+
+    Example:
+        export = DocumentExportDto(concept="sale", datetime_from=datetime(2024, 11, 1), datetime_to=datetime(2024, 12, 1))
+    """
+
+    concept: Optional[str] = None
+    datetime_from: Optional[datetime] = None
+    datetime_to: Optional[datetime] = None
+
+
+def document_export_rows(raw: dict) -> Iterator[tuple]:
+    """
+    Flattens a raw document into one row per item, with the values of `DOCUMENT_EXPORT_COLUMNS`.
+
+    The datetime is made timezone-aware: MongoDB stores UTC, but PyMongo returns it as a naive datetime.
+
+    Example:
+        rows = list(document_export_rows(raw))  # Output: [("DOC-001", "sale", 42, datetime(...), None, ...), ...]
+    """
+    moment = raw['datetime'] if raw['datetime'].tzinfo else raw['datetime'].replace(tzinfo=timezone.utc)
+    for item in raw['items']:
+        product = item['product']
+        yield (
+            raw['reference'], raw['concept'], raw['consecutive'], moment, raw.get('description'),
+            str(product['id']), product['code'], product['name'], item['quantity'], item['price'],
+            item['quantity'] * item['price'],
+        )
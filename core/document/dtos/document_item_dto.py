@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 from core.document.entities.document_item import DocumentItem
@@ -8,19 +10,21 @@ class DocumentItemDto(BaseModel):
     Data Transfer Object (DTO) for representing a document item.
 
     This DTO is used to transfer data for an individual item in a document. Each item contains information about
-    a product, its quantity, price, and total value.
+    a product, its quantity, price, and total value. The product fields come from the snapshot embedded in the
+    item, so building this DTO never queries the `products` collection.
 
     Attributes:
         product_id (str): The unique identifier for the product.
         product_code (str): The code of the product.
         product_name (str): The name of the product.
-        product_description (str): A description of the product.
+        product_description (Optional[str]): A description of the product.
         quantity (int): The quantity of the product in the document item.
         price (float): The price of a single unit of the product.
         total (float): The total cost for the quantity of the product in this item (quantity * price).
 
     Methods:
         from_entity: Converts a `DocumentItem` entity into a `DocumentItemDto` instance.
+        from_raw: Builds a `DocumentItemDto` from a raw document item without validation.
 
     Example:
         document_item_dto = DocumentItemDto.from_entity(document_item)
@@ -32,7 +36,7 @@ class DocumentItemDto(BaseModel):
     product_id: str
     product_code: str
     product_name: str
-    product_description: str
+    product_description: Optional[str] = None
     quantity: int
     price: float
     total: float
@@ -49,7 +53,7 @@ class DocumentItemDto(BaseModel):
             DocumentItemDto: The corresponding DTO instance.
         """
         return cls(
-            product_id=document_item.product.id,
+            product_id=str(document_item.product.id),
             product_code=document_item.product.code,
             product_name=document_item.product.name,
             product_description=document_item.product.description,
@@ -58,5 +62,27 @@ class DocumentItemDto(BaseModel):
             total=document_item.quantity * document_item.price,
         )
 
+    @classmethod
+    def from_raw(cls, raw: dict) -> "DocumentItemDto":
+        """
+        Builds a DocumentItemDto directly from a raw document item, without validation.
+
+        Args:
+            raw (dict): The document item as read from MongoDB, with its embedded product snapshot.
+
+        Returns:
+            DocumentItemDto: The corresponding DTO instance.
+        """
+        product = raw['product']
+        return cls.model_construct(
+            product_id=str(product['id']),
+            product_code=product['code'],
+            product_name=product['name'],
+            product_description=product.get('description'),
+            quantity=raw['quantity'],
+            price=raw['price'],
+            total=raw['quantity'] * raw['price'],
+        )
+
     class Config:
         from_orm = True
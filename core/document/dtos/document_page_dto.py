@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from core.document.dtos.document_dto import DocumentDto
+
+
+class DocumentPageDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for representing a page of documents.
+
+    This class is returned by the document search. Documents are ordered from the newest to the oldest, and
+    the `next_after` cursor points at the last document in `items`; it is passed back as the `after` query
+    parameter, together with the same filters, to fetch the following page.
+
+    Attributes:
+        items (List[DocumentDto]): The documents in this page, newest first.
+        next_after (Optional[str]): The cursor for the next page, or None if this is the last page.
+
+    Example:
+        page = DocumentPageDto(items=[document_dto], next_after=None)
+    """
+
+    items: List[DocumentDto]
+    next_after: Optional[str] = None
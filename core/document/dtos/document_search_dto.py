@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class DocumentSearchDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for the filters of a document search.
+
+    Every filter is optional and they are combined with AND. Ranges are inclusive of their lower bound and
+    exclusive of their upper bound, so consecutive ranges can be chained without overlaps.
+
+    Attributes:
+        concept (Optional[str]): Only documents of this concept.
+        datetime_from (Optional[datetime]): Only documents created at or after this moment.
+        datetime_to (Optional[datetime]): Only documents created before this moment.
+        consecutive_from (Optional[int]): Only documents with a consecutive at least this. Requires `concept`.
+        consecutive_to (Optional[int]): Only documents with a consecutive below this. Requires `concept`.
+        product_id (Optional[str]): Only documents with at least one item of this product.
+        include_items (bool): Whether to return the items of each document. Defaults to False.
+
+    Example:
+        search = DocumentSearchDto(concept="sale", datetime_from=datetime(2024, 11, 1), datetime_to=datetime(2024, 12, 1))
+    """
+
+    concept: Optional[str] = None
+    datetime_from: Optional[datetime] = None
+    datetime_to: Optional[datetime] = None
+    consecutive_from: Optional[int] = None
+    consecutive_to: Optional[int] = None
+    product_id: Optional[str] = None
+    include_items: bool = False
@@ -1,13 +1,22 @@
-from fastapi import HTTPException
+import hashlib
+from typing import Optional
+
+from fastapi import Header, HTTPException
 
 from core.document.dtos.create_document_dto import CreateDocumentDto
 from core.document.dtos.document_dto import DocumentDto
 from core.document.router import document_router
+from core.document.services.create_document_idempotently_service import (
+    IdempotencyKeyInProgressError, IdempotencyKeyReusedError, create_document_idempotently_service,
+)
 from core.document.services.create_document_service import create_document_service
 
 
 @document_router.post("/", response_model=DocumentDto)
-async def create_document_endpoint(document: CreateDocumentDto):
+async def create_document_endpoint(
+        document: CreateDocumentDto,
+        idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", min_length=1, max_length=255),
+):
     """
     Endpoint for creating a new document.
 
@@ -15,14 +24,22 @@ async def create_document_endpoint(document: CreateDocumentDto):
     description, and items. The items are passed as a list of `CreateDocumentItemDto` instances, each representing
     a product with its quantity.
 
+    Clients that may retry the request (e.g. after a timeout) should send a unique `Idempotency-Key` header.
+    A retry with the same key and body returns the document created by the first request instead of creating
+    a duplicate, until the key expires (`IDEMPOTENCY_KEY_TTL_SECONDS`).
+
     Args:
         document (CreateDocumentDto): The DTO containing information about the document and its items.
+        idempotency_key (Optional[str]): The `Idempotency-Key` header, if sent.
 
     Returns:
         DocumentDto: The DTO representing the created document.
 
     Raises:
-        HTTPException: If the document creation fails or if the document is not found, a 404 error is raised.
+        HTTPException: If any referenced product does not exist, a 400 error listing every missing product ID
+        is raised. If the document creation fails or if the document is not found, a 404 error is raised.
+        A 409 error is raised if a request with the same `Idempotency-Key` is still being processed, and a 422
+        error if the key was already used with a different body.
 
     Example:
         Create a document:
@@ -51,8 +68,21 @@ async def create_document_endpoint(document: CreateDocumentDto):
             ]
         }
     """
-    items = [item.to_dict() for item in document.items]
-    product = await create_document_service(document.reference, document.concept, items, document.description)
+    items = [item.model_dump() for item in document.items]
+    try:
+        if idempotency_key is None:
+            product = await create_document_service(document.reference, document.concept, items, document.description)
+        else:
+            request_hash = hashlib.sha256(document.model_dump_json().encode()).hexdigest()
+            product = await create_document_idempotently_service(
+                idempotency_key, request_hash, document.reference, document.concept, items, document.description,
+            )
+    except IdempotencyKeyInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if product is None:
         raise HTTPException(status_code=404, detail="Document not found")
     return product
@@ -0,0 +1,40 @@
+from typing import List
+
+from core.document.dtos.create_document_dto import CreateDocumentDto
+from core.document.dtos.document_bulk_result_dto import DocumentBulkResultDto
+from core.document.router import document_router
+from core.document.services.create_documents_service import create_documents_service
+
+
+@document_router.post("/bulk", response_model=List[DocumentBulkResultDto])
+async def create_documents_endpoint(documents: List[CreateDocumentDto]) -> List[DocumentBulkResultDto]:
+    """
+    Endpoint for creating many documents in a single request.
+
+    This endpoint accepts a list of documents, in the same format as `POST /document/`, and creates them with
+    a constant number of database round trips: one product lookup for the whole batch, one counter update per
+    concept and one bulk insert. Each document succeeds or fails independently; a document referencing a
+    missing product or reusing an existing reference is reported in its result without affecting the others.
+
+    Args:
+        documents (List[CreateDocumentDto]): The documents to create.
+
+    Returns:
+        List[DocumentBulkResultDto]: One result per submitted document, in the same order.
+
+    Example:
+        POST /document/bulk
+
+        Request Body:
+        [
+            {"reference": "DOC-001", "concept": "sale", "items": [{"product_id": "123", "quantity": 10}]},
+            {"reference": "DOC-002", "concept": "sale", "items": [{"product_id": "999", "quantity": 1}]}
+        ]
+
+        Response:
+        [
+            {"reference": "DOC-001", "document": {"id": "60b91b5e64e2a9f024f5b051", ...}, "error": null},
+            {"reference": "DOC-002", "document": null, "error": "Products with IDs 999 not found"}
+        ]
+    """
+    return await create_documents_service(documents)
@@ -0,0 +1,59 @@
+from typing import Annotated, Literal
+
+from fastapi import HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from core.document.dtos.document_export_dto import DocumentExportDto
+from core.document.router import document_router
+from core.document.services.export_documents_csv_service import export_documents_csv_service
+from core.document.services.export_documents_parquet_service import export_documents_parquet_service
+from infrastructure.settings import settings
+
+
+@document_router.get("/export", response_class=StreamingResponse)
+async def export_documents_endpoint(
+        export: Annotated[DocumentExportDto, Query()],
+        format: Literal["csv", "parquet"] = "csv",
+):
+    """
+    Endpoint to download the items of the documents matching the filters, one row per item.
+
+    Documents can be filtered by `concept` and by a `datetime_from`/`datetime_to` range, and are exported
+    from the oldest to the newest. The file is streamed straight from a database cursor, in batches of
+    `DOCUMENT_EXPORT_BATCH_SIZE` documents, so memory usage stays constant however many documents are
+    exported. With `format=parquet` the file is written in row groups of `DOCUMENT_EXPORT_ROW_GROUP_SIZE`
+    rows, which requires pyarrow.
+
+    Args:
+        export (DocumentExportDto): The filters, read from the query string.
+        format (str): `csv` (default) or `parquet`.
+
+    Returns:
+        StreamingResponse: The exported file, with the columns of `DOCUMENT_EXPORT_COLUMNS`.
+
+    Raises:
+        HTTPException: A 501 error if a Parquet export is requested but pyarrow is not installed.
+
+    Example:
+        GET /document/export?concept=sale&datetime_from=2024-11-01T00:00:00Z&datetime_to=2024-12-01T00:00:00Z
+
+        Response:
+        reference,concept,consecutive,datetime,description,product_id,product_code,product_name,quantity,price,total
+        DOC-001,sale,42,2024-11-20T10:00:00,Sale of office supplies,60b8fbd6b6a05a001f3db9d2,P001,Pen,10,1.5,15.0
+    """
+    if format == "parquet":
+        try:
+            chunks = export_documents_parquet_service(
+                export, settings.document_export_row_group_size, settings.document_export_batch_size,
+            )
+        except RuntimeError as e:
+            raise HTTPException(status_code=501, detail=str(e))
+        media_type = "application/vnd.apache.parquet"
+    else:
+        chunks = export_documents_csv_service(export, settings.document_export_batch_size)
+        media_type = "text/csv; charset=utf-8"
+
+    return StreamingResponse(
+        chunks, media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="documents.{format}"'},
+    )
@@ -1,8 +1,11 @@
 from fastapi import HTTPException
+from starlette.responses import Response
 
 from core.document.dtos.document_dto import DocumentDto
 from core.document.router import document_router
-from core.document.services.get_document_by_reference_service import get_document_by_reference_service
+from core.document.services.get_serialized_document_by_reference_service import (
+    get_serialized_document_by_reference_service,
+)
 
 
 @document_router.get("/{reference}", response_model=DocumentDto)
@@ -11,7 +14,8 @@ async def get_document_by_reference_endpoint(reference: str):
     Endpoint for retrieving a document by its reference.
 
     This endpoint allows for fetching a document by its unique reference. If the document with the provided
-    reference exists, it will return the document details. Otherwise, a 404 error is raised.
+    reference exists, it will return the document details. Otherwise, a 404 error is raised. Documents are
+    immutable, so the serialized response is cached by reference (see `GET /document/cache/stats`).
 
     Args:
         reference (str): The reference of the document to be retrieved.
@@ -38,7 +42,7 @@ async def get_document_by_reference_endpoint(reference: str):
             ]
         }
     """
-    product = await get_document_by_reference_service(reference)
-    if product is None:
+    content = await get_serialized_document_by_reference_service(reference)
+    if content is None:
         raise HTTPException(status_code=404, detail="Document not found")
-    return product
+    return Response(content=content, media_type="application/json")
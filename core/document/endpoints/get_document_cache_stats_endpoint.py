@@ -0,0 +1,38 @@
+from common.dtos.cache_stats_dto import CacheStatsDto
+from core.document.cache import document_cache
+from core.document.router import document_router
+
+
+@document_router.get("/cache/stats", response_model=CacheStatsDto)
+async def get_document_cache_stats_endpoint() -> CacheStatsDto:
+    """
+    Endpoint to retrieve the counters of this worker's document cache.
+
+    Each worker process has its own in-process cache, so the counters describe only the worker that served the
+    request. The `shared_*` counters describe this worker's use of the shared cache, and are null when no
+    shared cache backend is configured.
+    Documents never expire, so `expirations` stays at 0; `evictions` counts documents dropped to respect
+    `DOCUMENT_CACHE_MAX_ENTRIES` and `DOCUMENT_CACHE_MAX_BYTES`.
+
+    Returns:
+        CacheStatsDto: The hit, miss and eviction counters and the current size of the cache.
+
+    Example:
+        GET /document/cache/stats
+
+        Response:
+        {
+            "hits": 8410,
+            "misses": 392,
+            "evictions": 0,
+            "expirations": 0,
+            "entries": 392,
+            "bytes": 512704,
+            "max_entries": null,
+            "max_bytes": 67108864,
+            "shared_hits": null,
+            "shared_misses": null,
+            "shared_errors": null
+        }
+    """
+    return CacheStatsDto(**document_cache.stats())
@@ -0,0 +1,62 @@
+from typing import Annotated, Optional
+
+from fastapi import HTTPException, Query
+
+from core.document.dtos.document_page_dto import DocumentPageDto
+from core.document.dtos.document_search_dto import DocumentSearchDto
+from core.document.router import document_router
+from core.document.services.search_documents_service import search_documents_service
+from infrastructure.responses import model_response
+
+
+@document_router.get("/", response_model=DocumentPageDto)
+async def search_documents_endpoint(
+        search: Annotated[DocumentSearchDto, Query()],
+        limit: int = Query(100, ge=1, le=1000),
+        after: Optional[str] = None,
+):
+    """
+    Endpoint to search documents, one page at a time, from the newest to the oldest.
+
+    Documents can be filtered by `concept`, by a `datetime_from`/`datetime_to` range, by a
+    `consecutive_from`/`consecutive_to` range (together with `concept`) and by a `product_id` they contain.
+    Every filter combination is served by an index. Pages are keyset-paginated: pass the returned
+    `next_after` cursor as the `after` query parameter, with the same filters, to fetch the next page.
+    Items are left out unless `include_items=true`, which keeps listings small.
+
+    Args:
+        search (DocumentSearchDto): The filters, read from the query string.
+        limit (int): The maximum number of documents per page (1-1000). Defaults to 100.
+        after (Optional[str]): The cursor of the previous page.
+
+    Returns:
+        DocumentPageDto: A page of `DocumentDto` instances and the cursor of the next page.
+
+    Raises:
+        HTTPException: A 400 error if the cursor or product id is malformed, or a consecutive range is given
+        without a concept.
+
+    Example:
+        GET /document/?concept=sale&datetime_from=2024-11-01T00:00:00Z&datetime_to=2024-12-01T00:00:00Z&limit=1
+
+        Response:
+        {
+            "items": [
+                {
+                    "id": "60c72b2f9b1d8f7c6d0f1a2d",
+                    "reference": "DOC-001",
+                    "consecutive": "42",
+                    "datetime": "2024-11-20T10:00:00",
+                    "concept": "sale",
+                    "description": "Sale of office supplies",
+                    "items": null
+                }
+            ],
+            "next_after": "1732096800000_60c72b2f9b1d8f7c6d0f1a2d"
+        }
+    """
+    try:
+        page = await search_documents_service(search, limit, after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return model_response(page)
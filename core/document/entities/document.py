@@ -11,13 +11,21 @@ class Document(MongoDocument):
     document's reference, consecutive number, datetime, concept, description, and a list of items.
 
     Attributes:
-        reference (str): The unique reference of the document.
+        reference (str): The unique reference of the document, backed by a unique index.
         consecutive (int): The consecutive number of the document.
         datetime (datetime): The date and time when the document was created.
         concept (str): The concept or purpose of the document.
         description (str, optional): A description of the document (optional).
         items (List[DocumentItem]): A list of items associated with the document.
 
+    Indexes:
+        - `reference` (unique), for lookups by reference.
+        - `concept` + `consecutive`, for lookups by consecutive number within a concept.
+        - `concept` + `datetime` + `_id`, to search the documents of a concept by date, newest first.
+        - `datetime` + `_id`, for date range queries and keyset pagination by date.
+        - `items.product.id` + `datetime` + `_id` (multikey), to replay or search the documents of a product
+          within a date range.
+
     Methods:
         to_dict: Converts the Document instance to a dictionary representation.
 
@@ -28,10 +36,17 @@ class Document(MongoDocument):
     """
     meta = {
         'collection': 'documents',
-        'db_alias': 'inventory'
+        'db_alias': 'inventory',
+        'auto_create_index': False,
+        'indexes': [
+            ('concept', 'consecutive'),
+            ('concept', 'datetime', '_id'),
+            ('datetime', '_id'),
+            ('items.product.id', 'datetime', '_id'),
+        ]
     }
 
-    reference = StringField(required=True)
+    reference = StringField(required=True, unique=True)
     consecutive = IntField(required=True)
     datetime = DateTimeField(required=True)
     concept = StringField(required=True)
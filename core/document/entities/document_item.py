@@ -1,17 +1,18 @@
-from mongoengine import EmbeddedDocument, IntField, FloatField, ReferenceField
+from mongoengine import EmbeddedDocument, IntField, FloatField, EmbeddedDocumentField
 
-from core.product.entities.product import Product
+from core.document.entities.product_snapshot import ProductSnapshot
 
 
 class DocumentItem(EmbeddedDocument):
     """
-    Represents an item in a document, including a reference to a product and its associated quantity and price.
+    Represents an item in a document, including a snapshot of a product and its associated quantity and price.
 
     This class is embedded within the `Document` class and represents an item in the document,
-    storing details about the product, quantity, and price.
+    storing details about the product, quantity, and price. The product data is embedded as a
+    `ProductSnapshot` rather than referenced, so reading a document needs no additional queries.
 
     Attributes:
-        product (Product): A reference to the `Product` entity associated with this item.
+        product (ProductSnapshot): A snapshot of the product associated with this item, taken at creation time.
         quantity (int): The quantity of the product in the document item.
         price (float): The price of a single unit of the product.
 
@@ -19,11 +20,11 @@ class DocumentItem(EmbeddedDocument):
         to_dict: Converts the DocumentItem instance to a dictionary representation.
 
     Example:
-        document_item = DocumentItem(product=product_instance, quantity=10, price=5.0)
+        document_item = DocumentItem(product=ProductSnapshot.from_product(product), quantity=10, price=5.0)
         document_item_dict = document_item.to_dict()
 
     """
-    product = ReferenceField(Product)
+    product = EmbeddedDocumentField(ProductSnapshot, required=True)
     quantity = IntField(required=True)
     price = FloatField(required=True)
 
@@ -39,7 +40,7 @@ class DocumentItem(EmbeddedDocument):
 
         Example:
             {
-                "product": {...},  # Product data in dictionary format
+                "product": {...},  # Product snapshot in dictionary format
                 "quantity": 10,
                 "price": 5.0
             }
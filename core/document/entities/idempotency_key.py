@@ -0,0 +1,44 @@
+from mongoengine import Document, StringField, ObjectIdField, DateTimeField
+
+from infrastructure.settings import settings
+
+
+class IdempotencyKey(Document):
+    """
+    Records the document created by a request carrying an `Idempotency-Key` header.
+
+    A key is claimed (inserted without a document) before the document is created and completed with the id
+    of the document afterwards, so a retry of the same request finds the original document instead of
+    creating a duplicate and burning another consecutive. The key is the primary key, so looking it up is a
+    single `_id` lookup, and a TTL index on `created_at` removes keys after `IDEMPOTENCY_KEY_TTL_SECONDS`.
+
+    Attributes:
+        key (str): The client-supplied idempotency key, stored as the record's `_id`.
+        request_hash (str): A hash of the request body, so a key reused for a different request is rejected.
+        document (Optional[ObjectId]): The id of the created document, None while the request is in progress.
+        created_at (datetime): When the key was claimed.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the keys are stored.
+        db_alias (str): The alias of the database where the key collection resides.
+        indexes (list): The TTL index that expires keys. Changing its TTL on an existing collection requires
+            dropping the index (or a `collMod`) before it is rebuilt.
+
+    Example:
+        record = await get_collection(IdempotencyKey).find_one({"_id": "4f7c2a9e-retry-safe"})
+        print(record["document"])
+    """
+
+    meta = {
+        'collection': 'idempotency_keys',
+        'db_alias': 'inventory',
+        'auto_create_index': False,
+        'indexes': [
+            {'fields': ['created_at'], 'expireAfterSeconds': settings.idempotency_key_ttl_seconds},
+        ]
+    }
+
+    key = StringField(primary_key=True)
+    request_hash = StringField(required=True)
+    document = ObjectIdField()
+    created_at = DateTimeField(required=True)
@@ -0,0 +1,76 @@
+from mongoengine import EmbeddedDocument, ObjectIdField, StringField, FloatField
+
+from core.product.entities.product import Product
+
+
+class ProductSnapshot(EmbeddedDocument):
+    """
+    Represents a copy of a product's data, captured when a document item is created.
+
+    This class is embedded within `DocumentItem` so that reading a document never has to dereference the
+    `products` collection. The snapshot is written once and never updated, so later changes to the product
+    (e.g. a new price) do not alter documents that were already issued.
+
+    Attributes:
+        id (ObjectId): The identifier of the product the snapshot was taken from.
+        code (str): The product code at creation time.
+        name (str): The product name at creation time.
+        description (str, optional): The product description at creation time.
+        price (float): The unit price of the product at creation time.
+
+    Methods:
+        from_product: Captures a snapshot of a `Product` entity.
+        to_dict: Converts the ProductSnapshot instance to a dictionary representation.
+
+    Example:
+        snapshot = ProductSnapshot.from_product(product)
+        print(snapshot.code)
+    """
+    id = ObjectIdField(required=True)
+    code = StringField(required=True)
+    name = StringField(required=True)
+    description = StringField(required=False)
+    price = FloatField(required=True)
+
+    @classmethod
+    def from_product(cls, product: Product) -> "ProductSnapshot":
+        """
+        Captures a snapshot of the given product.
+
+        Args:
+            product (Product): The product entity to copy.
+
+        Returns:
+            ProductSnapshot: A snapshot holding the product's current id, code, name, description and price.
+        """
+        return cls(
+            id=product.id,
+            code=product.code,
+            name=product.name,
+            description=product.description,
+            price=product.price,
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Converts the ProductSnapshot instance to a dictionary representation.
+
+        Returns:
+            dict: A dictionary containing the snapshot's id, code, name, description and price.
+
+        Example:
+            {
+                "id": "60b8d2950d5b5b6f1015fd4a",
+                "code": "P001",
+                "name": "Laptop",
+                "description": "A high-performance laptop.",
+                "price": 1200.99
+            }
+        """
+        return {
+            "id": str(self.id),
+            "code": self.code,
+            "name": self.name,
+            "description": self.description,
+            "price": self.price,
+        }
@@ -0,0 +1,19 @@
+from core.document.repositories.create_documents_repo import create_documents_repo
+from infrastructure.group_commit import GroupCommit
+from infrastructure.settings import settings
+
+document_group_commit = GroupCommit(
+    "documents",
+    # Looked up on every flush so the repository instrumentation (metrics, tracing) applies to it.
+    lambda documents: create_documents_repo(documents),
+    window_seconds=settings.document_group_commit_window_ms / 1000,
+    max_batch_size=settings.document_group_commit_max_batch_size,
+)
+"""
+Process-wide group commit stage for single document creations.
+
+When `DOCUMENT_GROUP_COMMIT_WINDOW_MS` is set, `create_document_repo` submits each document to this stage
+instead of inserting it on its own, and the documents created concurrently by one worker are written by a
+single `create_documents_repo` call: one product lookup, one counter update per concept, one `insert_many`
+and one stock update for the whole batch.
+"""
@@ -0,0 +1,36 @@
+from datetime import datetime, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+from core.document.entities.idempotency_key import IdempotencyKey
+from infrastructure.database import get_collection
+
+
+async def claim_idempotency_key_repo(key: str, request_hash: str) -> bool:
+    """
+    Claims an idempotency key for a request that is about to create a document.
+
+    The claim is an insert on the key's `_id`, so when several requests with the same key race, exactly one
+    of them wins; the others must look the key up again.
+
+    Args:
+        key (str): The idempotency key.
+        request_hash (str): A hash of the request body, stored so the key cannot be reused for another request.
+
+    Returns:
+        bool: True if the key was claimed, False if it had already been claimed.
+
+    Example:
+        if await claim_idempotency_key_repo("4f7c2a9e-retry-safe", request_hash):
+            document = await create_document_repo(...)
+    """
+    try:
+        await get_collection(IdempotencyKey).insert_one({
+            '_id': key,
+            'request_hash': request_hash,
+            'document': None,
+            'created_at': datetime.now(timezone.utc),
+        })
+    except DuplicateKeyError:
+        return False
+    return True
@@ -0,0 +1,18 @@
+from bson import ObjectId
+
+from core.document.entities.idempotency_key import IdempotencyKey
+from infrastructure.database import get_collection
+
+
+async def complete_idempotency_key_repo(key: str, document_id: ObjectId):
+    """
+    Records the document created for a claimed idempotency key, so retries of the request return it.
+
+    Args:
+        key (str): The idempotency key claimed with `claim_idempotency_key_repo`.
+        document_id (ObjectId): The id of the created document.
+
+    Example:
+        await complete_idempotency_key_repo("4f7c2a9e-retry-safe", document.id)
+    """
+    await get_collection(IdempotencyKey).update_one({'_id': key}, {'$set': {'document': document_id}})
@@ -1,19 +1,36 @@
 from datetime import datetime, timezone
 from typing import List
 
+from mongoengine import ValidationError
+from pymongo.errors import DuplicateKeyError
+
 from core.counter.repositories.get_next_sequence_repo import get_next_sequence_repo
 from core.document.entities.document import Document
 from core.document.entities.document_item import DocumentItem
-from core.product.entities.product import Product
+from core.document.entities.product_snapshot import ProductSnapshot
+from core.document.group_commit import document_group_commit
+from core.product.repositories.get_products_by_ids_repo import get_products_by_ids_repo
+from core.stock.repositories.apply_document_stock_repo import apply_document_stock_repo
+from infrastructure.database import get_collection
 
 
 async def create_document_repo(reference: str, concept: str, items: List[dict], description: str = None) -> Document:
     """
     Creates a new document with the provided reference, concept, items, and an optional description.
 
-    This function creates a `Document` object by validating the items and associating each item with a
-    `Product`. It then generates a consecutive number using a counter sequence, sets the document's
-    datetime, and saves it to the database.
+    This function creates a `Document` object by validating the items and embedding a snapshot of each item's
+    `Product`. All referenced products are resolved with a single `$in` query (repeated product IDs are
+    only fetched once), so the number of round trips does not depend on the number of items. It then
+    generates a consecutive number using a counter sequence, sets the document's datetime, saves it
+    to the database and applies its quantities to the stock balances of its products.
+
+    If group commit is enabled (`DOCUMENT_GROUP_COMMIT_WINDOW_MS`), the document is instead queued on
+    `document_group_commit` and created together with the documents submitted concurrently, with
+    `create_documents_repo`. Its consecutive is then reserved with the rest of the batch.
+
+    On both paths, a document that fails validation (e.g. has no items) or whose reference already exists is
+    reported as a `ValueError`, and with group commit it does not affect the other documents of its batch.
+    The consecutive reserved for the rejected document is not reused.
 
     Args:
         reference (str): The reference code for the document.
@@ -24,7 +41,10 @@ async def create_document_repo(reference: str, concept: str, items: List[dict],
         description (str, optional): A description of the document. Defaults to None.
 
     Raises:
-        ValueError: If any product in the items list cannot be found by its ID.
+        ValueError: If any product in the items list cannot be found by its ID (the message lists every
+            missing ID, not only the first one), if the document fails validation, or if a document with the
+            same reference already exists.
+            With group commit enabled, also if the insert fails for any other reason.
 
     Returns:
         Document: The created document instance.
@@ -37,13 +57,24 @@ async def create_document_repo(reference: str, concept: str, items: List[dict],
         document = await create_document_repo("INV-12345", "sale", items)
 
     """
+    if document_group_commit.enabled:
+        result = await document_group_commit.submit(
+            {'reference': reference, 'concept': concept, 'description': description, 'items': items}
+        )
+        if result.error is not None:
+            raise ValueError(result.error)
+        return result.document
+
+    products = await get_products_by_ids_repo(item['product_id'] for item in items)
+
     document_items = []
     for item in items:
-        product = await Product.objects(id=item['product_id']).first()
-        if not product:
-            raise ValueError(f"Product with ID {item['product_id']} not found")
-
-        document_item = DocumentItem(product=product, quantity=item['quantity'], price=product.price)
+        product = products[item['product_id']]
+        document_item = DocumentItem(
+            product=ProductSnapshot.from_product(product),
+            quantity=item['quantity'],
+            price=product.price
+        )
         document_items.append(document_item)
 
     document = Document(
@@ -55,6 +86,16 @@ async def create_document_repo(reference: str, concept: str, items: List[dict],
 
     document.consecutive = await get_next_sequence_repo(concept)
     document.datetime = datetime.now(timezone.utc)
-    await document.save()
+    try:
+        document.validate()
+    except ValidationError as e:
+        raise ValueError(str(e))
+    try:
+        result = await get_collection(Document).insert_one(document.to_mongo())
+    except DuplicateKeyError:
+        raise ValueError(f"A document with reference {reference} already exists")
+    document.id = result.inserted_id
+    await apply_document_stock_repo([document])
 
     return document
+
@@ -0,0 +1,123 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import List, NamedTuple, Optional
+
+from mongoengine import ValidationError
+from pymongo.errors import BulkWriteError
+
+from core.counter.repositories.reserve_sequence_block_repo import reserve_sequence_block_repo
+from core.document.entities.document import Document
+from core.document.entities.document_item import DocumentItem
+from core.document.entities.product_snapshot import ProductSnapshot
+from core.product.repositories.find_products_by_ids_repo import find_products_by_ids_repo
+from core.stock.repositories.apply_document_stock_repo import apply_document_stock_repo
+from infrastructure.database import get_collection
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+class CreateDocumentResult(NamedTuple):
+    """
+    Outcome of creating one document in a `create_documents_repo` batch.
+
+    Attributes:
+        document (Optional[Document]): The created document, or None if it could not be created.
+        error (Optional[str]): Why the document could not be created, or None on success.
+    """
+    document: Optional[Document]
+    error: Optional[str] = None
+
+
+async def create_documents_repo(documents: List[dict]) -> List[CreateDocumentResult]:
+    """
+    Creates many documents with a constant number of round trips, independently of the batch size.
+
+    The products referenced by all the documents are resolved with a single `$in` query, each concept's
+    consecutives are reserved as one contiguous range with a single counter update, and all the documents are
+    inserted with one unordered `insert_many`, after which the stock balances of all inserted documents are
+    updated with one bulk write. A document that references a missing product, fails validation (e.g. has no
+    items), or whose insert fails (e.g. because its reference already exists), is reported without affecting
+    the rest of the batch. Consecutives reserved for documents that fail validation or insertion are not reused.
+
+    Args:
+        documents (List[dict]): The documents to create. Each one should contain:
+            - 'reference' (str): The reference code of the document.
+            - 'concept' (str): The concept or category of the document (e.g., sale, purchase).
+            - 'description' (str, optional): A description of the document.
+            - 'items' (List[dict]): The items, each with a 'product_id' (str) and a 'quantity' (int).
+
+    Returns:
+        List[CreateDocumentResult]: One result per input document, in the same order.
+
+    Example:
+        results = await create_documents_repo([
+            {"reference": "INV-1", "concept": "sale", "items": [{"product_id": "60b8fbd6b6a05a001f3db9d2", "quantity": 5}]},
+            {"reference": "INV-2", "concept": "sale", "items": [{"product_id": "60b8fbd6b6a05a001f3db9d3", "quantity": 1}]},
+        ])
+        print([result.error for result in results])
+    """
+    products = await find_products_by_ids_repo(item['product_id'] for document in documents for item in document['items'])
+
+    results: List[CreateDocumentResult] = []
+    pending_by_concept = defaultdict(list)
+    now = datetime.now(timezone.utc)
+    for data in documents:
+        missing_ids = list(dict.fromkeys(item['product_id'] for item in data['items'] if item['product_id'] not in products))
+        if missing_ids:
+            results.append(CreateDocumentResult(None, f"Products with IDs {', '.join(missing_ids)} not found"))
+            continue
+
+        document = Document(
+            reference=data['reference'],
+            concept=data['concept'],
+            description=data.get('description'),
+            datetime=now,
+            items=[
+                DocumentItem(
+                    product=ProductSnapshot.from_product(products[item['product_id']]),
+                    quantity=item['quantity'],
+                    price=products[item['product_id']].price
+                )
+                for item in data['items']
+            ]
+        )
+        pending_by_concept[document.concept].append(document)
+        results.append(CreateDocumentResult(document))
+
+    for concept, pending in pending_by_concept.items():
+        last = await reserve_sequence_block_repo(concept, len(pending))
+        for consecutive, document in enumerate(pending, start=last - len(pending) + 1):
+            document.consecutive = consecutive
+
+    pending = []
+    raws = []
+    for position, result in enumerate(results):
+        if result.document is None:
+            continue
+        try:
+            result.document.validate()
+        except ValidationError as e:
+            results[position] = CreateDocumentResult(None, str(e))
+            continue
+        pending.append((position, result.document))
+        raws.append(result.document.to_mongo().to_dict())
+    if not pending:
+        return results
+
+    try:
+        await get_collection(Document).insert_many(raws, ordered=False)
+        write_errors = []
+    except BulkWriteError as e:
+        write_errors = e.details['writeErrors']
+
+    for (_, document), raw in zip(pending, raws):
+        document.id = raw['_id']
+    for error in write_errors:
+        position, document = pending[error['index']]
+        message = error['errmsg']
+        if error['code'] == DUPLICATE_KEY_ERROR:
+            message = f"A document with reference {document.reference} already exists"
+        results[position] = CreateDocumentResult(None, message)
+
+    await apply_document_stock_repo(result.document for result in results if result.document is not None)
+    return results
@@ -1,26 +1,33 @@
 from typing import Optional
 
+from core.document.dtos.document_dto import DOCUMENT_PROJECTION
 from core.document.entities.document import Document
+from infrastructure.database import get_collection
 
 
-async def get_document_by_reference_repo(reference: str) -> Optional[Document]:
+async def get_document_by_reference_repo(reference: str, read_only: bool = True) -> Optional[dict]:
     """
     Retrieves a document from the database by its reference.
 
     This function queries the `Document` collection using the provided reference to fetch the first
-    document that matches the reference. If no matching document is found, it returns None.
+    document that matches the reference. The document is returned as a raw dictionary restricted to
+    `DOCUMENT_PROJECTION`, ready for `DocumentDto.from_raw`. If no matching document is found, it returns None.
+    Documents are immutable once created, so the lookup is routed by the configured read preference and may be
+    served by a secondary, unless `read_only` is False.
 
     Args:
         reference (str): The reference code of the document to be fetched.
+        read_only (bool): Whether the lookup tolerates replication lag. Pass False to read from the primary,
+            e.g. to find a document that was just created. Defaults to True.
 
     Returns:
-        Optional[Document]: The document matching the provided reference, or None if no such document is found.
+        Optional[dict]: The raw document matching the provided reference, or None if no such document is found.
 
     Example:
-        document = get_document_by_reference_repo("INV-12345")
+        document = await get_document_by_reference_repo("INV-12345")
         if document is not None:
-            print(document.reference)
+            print(document['reference'])
         else:
             print("Document not found.")
     """
-    return await Document.objects(reference=reference).first()
+    return await get_collection(Document, read_only=read_only).find_one({'reference': reference}, DOCUMENT_PROJECTION)
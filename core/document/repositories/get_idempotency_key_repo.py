@@ -0,0 +1,55 @@
+from typing import Optional
+
+from core.document.dtos.document_dto import DOCUMENT_PROJECTION
+from core.document.entities.document import Document
+from core.document.entities.idempotency_key import IdempotencyKey
+from infrastructure.database import get_collection
+
+
+async def get_idempotency_key_repo(key: str) -> Optional[dict]:
+    """
+    Retrieves an idempotency key together with the document it created, in a single round trip.
+
+    The key is looked up by `_id` and joined with its document (also by `_id`) with `$lookup`, so a retried
+    request is answered with one indexed lookup. Both reads go to the primary, so a key completed a moment
+    ago by another worker is always seen.
+
+    Args:
+        key (str): The idempotency key.
+
+    Returns:
+        Optional[dict]: None if the key was never claimed (or has expired). Otherwise the raw key record, whose
+        `document` field is the raw document restricted to `DOCUMENT_PROJECTION`, or None while the request
+        that claimed the key is still in progress.
+
+    Example:
+        record = await get_idempotency_key_repo("4f7c2a9e-retry-safe")
+        if record is not None and record['document'] is not None:
+            print(record['document']['reference'])
+    """
+    pipeline = [
+        {'$match': {'_id': key}},
+        {'$lookup': {
+            'from': Document._get_collection_name(),
+            'localField': 'document',
+            'foreignField': '_id',
+            'as': 'documents',
+        }},
+        {'$project': {
+            'request_hash': 1,
+            'created_at': 1,
+            'document': {'$arrayElemAt': ['$documents', 0]},
+        }},
+        {'$project': {
+            'request_hash': 1,
+            'created_at': 1,
+            'document._id': 1,
+            **{f'document.{field}': 1 for field in DOCUMENT_PROJECTION},
+        }},
+    ]
+    records = await (await get_collection(IdempotencyKey).aggregate(pipeline)).to_list()
+    if not records:
+        return None
+    record = records[0]
+    record['document'] = record.get('document') or None
+    return record
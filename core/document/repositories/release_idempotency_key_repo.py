@@ -0,0 +1,17 @@
+from core.document.entities.idempotency_key import IdempotencyKey
+from infrastructure.database import get_collection
+
+
+async def release_idempotency_key_repo(key: str):
+    """
+    Releases a claimed idempotency key whose request failed, so the client can retry it.
+
+    Only a key that has not been completed is deleted, so a key that already maps to a document is kept.
+
+    Args:
+        key (str): The idempotency key claimed with `claim_idempotency_key_repo`.
+
+    Example:
+        await release_idempotency_key_repo("4f7c2a9e-retry-safe")
+    """
+    await get_collection(IdempotencyKey).delete_one({'_id': key, 'document': None})
@@ -0,0 +1,73 @@
+from typing import List, Optional
+
+from bson import ObjectId
+
+from core.document.cursor import decode_document_cursor
+from core.document.dtos.document_dto import DOCUMENT_PROJECTION, DOCUMENT_SUMMARY_PROJECTION
+from core.document.dtos.document_search_dto import DocumentSearchDto
+from core.document.entities.document import Document
+from infrastructure.database import get_collection
+
+
+def _range(lower, upper) -> Optional[dict]:
+    bounds = {}
+    if lower is not None:
+        bounds['$gte'] = lower
+    if upper is not None:
+        bounds['$lt'] = upper
+    return bounds or None
+
+
+async def search_documents_repo(search: DocumentSearchDto, limit: int, after: Optional[str] = None) -> List[dict]:
+    """
+    Retrieves a page of the documents matching a search, from the newest to the oldest.
+
+    Documents are sorted by (`datetime`, `_id`) descending and paginated by keyset: `after` is the cursor of
+    the last document of the previous page (see `encode_document_cursor`), and the query seeks past it
+    through the index, so deep pages cost the same as the first one. Each combination of filters is served
+    by one of the compound indexes of `Document`: `concept` + `datetime`, `items.product.id` + `datetime`
+    (multikey) or `datetime` alone, all ending in `_id` for the sort. A consecutive range is served by
+    `concept` + `consecutive`, which is why it requires a concept.
+
+    Documents are returned as raw dictionaries restricted to `DOCUMENT_SUMMARY_PROJECTION`, or to
+    `DOCUMENT_PROJECTION` if `search.include_items` is set, ready for `DocumentDto.from_raw`.
+
+    Args:
+        search (DocumentSearchDto): The filters of the search.
+        limit (int): The maximum number of documents to return.
+        after (Optional[str]): The cursor of the previous page, or None for the first page.
+
+    Returns:
+        List[dict]: Up to `limit` raw documents, newest first.
+
+    Raises:
+        ValueError: If the cursor or the product id is malformed, or a consecutive range is given without a
+            concept.
+
+    Example:
+        documents = await search_documents_repo(DocumentSearchDto(concept="sale"), 100)
+    """
+    conditions = []
+    if search.concept is not None:
+        conditions.append({'concept': search.concept})
+    if (consecutive := _range(search.consecutive_from, search.consecutive_to)) is not None:
+        if search.concept is None:
+            raise ValueError("Filtering by consecutive requires a concept")
+        conditions.append({'consecutive': consecutive})
+    if (moment := _range(search.datetime_from, search.datetime_to)) is not None:
+        conditions.append({'datetime': moment})
+    if search.product_id is not None:
+        if not ObjectId.is_valid(search.product_id):
+            raise ValueError("Invalid product id")
+        conditions.append({'items.product.id': ObjectId(search.product_id)})
+    if after is not None:
+        after_datetime, after_id = decode_document_cursor(after)
+        conditions.append({'$or': [
+            {'datetime': {'$lt': after_datetime}},
+            {'datetime': after_datetime, '_id': {'$lt': after_id}},
+        ]})
+
+    query = {'$and': conditions} if conditions else {}
+    projection = DOCUMENT_PROJECTION if search.include_items else DOCUMENT_SUMMARY_PROJECTION
+    cursor = get_collection(Document, read_only=True).find(query, projection)
+    return await cursor.sort([('datetime', -1), ('_id', -1)]).limit(limit).to_list()
@@ -0,0 +1,45 @@
+from typing import AsyncIterator
+
+from core.document.dtos.document_dto import DOCUMENT_PROJECTION
+from core.document.dtos.document_export_dto import DocumentExportDto
+from core.document.entities.document import Document
+from infrastructure.database import get_collection
+
+
+async def stream_documents_repo(export: DocumentExportDto, batch_size: int = 1000) -> AsyncIterator[dict]:
+    """
+    Iterates over the documents matching an export's filters, from the oldest to the newest, with a single
+    server-side cursor.
+
+    Documents are fetched from MongoDB `batch_size` at a time and yielded one by one as the cursor advances,
+    so memory usage stays bounded by the batch size whatever the size of the date range. The sort on
+    (`datetime`, `_id`) is served by the `concept` + `datetime` + `_id` index when a concept is given, and by
+    the `datetime` + `_id` index otherwise. Documents are yielded as raw dictionaries restricted to
+    `DOCUMENT_PROJECTION`. The cursor follows the configured read preference, so a long export does not load
+    the primary.
+
+    Args:
+        export (DocumentExportDto): The filters of the export.
+        batch_size (int): The number of documents fetched per round trip. Defaults to 1000.
+
+    Yields:
+        dict: Each raw document, oldest first.
+
+    Example:
+        async for document in stream_documents_repo(DocumentExportDto(concept="sale")):
+            print(document['reference'])
+    """
+    query = {}
+    if export.concept is not None:
+        query['concept'] = export.concept
+    moment = {}
+    if export.datetime_from is not None:
+        moment['$gte'] = export.datetime_from
+    if export.datetime_to is not None:
+        moment['$lt'] = export.datetime_to
+    if moment:
+        query['datetime'] = moment
+
+    cursor = get_collection(Document, read_only=True).find(query, DOCUMENT_PROJECTION)
+    async for raw in cursor.sort([('datetime', 1), ('_id', 1)]).batch_size(batch_size):
+        yield raw
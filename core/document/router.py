@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-from infrastructure.auto_import import auto_import_endpoints
+from infrastructure.auto_import import auto_import_endpoints, prioritize_static_routes
 
 document_router = APIRouter(prefix="/document", tags=["Document"])
 
 auto_import_endpoints("core.document.endpoints")
+prioritize_static_routes(document_router)
@@ -0,0 +1,93 @@
+import logging
+from typing import List
+
+from core.document.cache import cache_document
+from core.document.dtos.document_dto import DocumentDto
+from core.document.repositories.claim_idempotency_key_repo import claim_idempotency_key_repo
+from core.document.repositories.complete_idempotency_key_repo import complete_idempotency_key_repo
+from core.document.repositories.create_document_repo import create_document_repo
+from core.document.repositories.get_document_by_reference_repo import get_document_by_reference_repo
+from core.document.repositories.get_idempotency_key_repo import get_idempotency_key_repo
+from core.document.repositories.release_idempotency_key_repo import release_idempotency_key_repo
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyKeyReusedError(Exception):
+    """
+    Raised when an idempotency key is sent again with a request body different from the one that claimed it.
+    """
+
+
+class IdempotencyKeyInProgressError(Exception):
+    """
+    Raised when an idempotency key is sent again while the request that claimed it is still being processed.
+    """
+
+
+async def create_document_idempotently_service(idempotency_key: str, request_hash: str, ref: str, concept: str,
+                                               items: List[dict], description: str = None) -> DocumentDto:
+    """
+    Creates a document at most once per idempotency key, returning the original document on retries.
+
+    The key is looked up first, so a retry of a request that already succeeded costs a single indexed lookup
+    and creates nothing. Otherwise the key is claimed, the document is created with `create_document_repo`,
+    and the key is completed with the document's id; the new document is put in `document_cache`. If creating
+    the document fails, the claim is released so the client can retry.
+
+    If the document was created but the key could not be completed (the completion failed, or the worker
+    crashed in between), a retry finds the key still claimed; since the retry carries the same body, the
+    document is then looked up by its reference on the primary, and if it exists the key is completed with it
+    and it is returned. A claim left behind by a request that never created its document expires with the
+    key's TTL.
+
+    Args:
+        idempotency_key (str): The client-supplied `Idempotency-Key`.
+        request_hash (str): A hash of the request body, to detect a key reused for a different request.
+        ref (str): The reference code for the new document.
+        concept (str): The concept for the document, such as "sale" or "purchase."
+        items (List[dict]): The items of the document, each with a `product_id` and a `quantity`.
+        description (str, optional): An optional description of the document.
+
+    Returns:
+        DocumentDto: The created document, or the document created by the first request with this key.
+
+    Raises:
+        IdempotencyKeyReusedError: If the key was first used with a different request body.
+        IdempotencyKeyInProgressError: If the request that claimed the key has not finished yet.
+        ValueError: If any of the referenced products does not exist.
+
+    Example:
+        document = await create_document_idempotently_service("4f7c2a9e-retry-safe", request_hash, "INV-12345",
+                                                              "sale", items)
+    """
+    record = await get_idempotency_key_repo(idempotency_key)
+    if record is None:
+        if await claim_idempotency_key_repo(idempotency_key, request_hash):
+            try:
+                document = await create_document_repo(ref, concept, items, description)
+            except BaseException:
+                await release_idempotency_key_repo(idempotency_key)
+                raise
+            try:
+                await complete_idempotency_key_repo(idempotency_key, document.id)
+            except Exception:
+                logger.warning("Completing idempotency key %s failed, a retry will complete it", idempotency_key,
+                               exc_info=True)
+            created = DocumentDto.from_stored(document)
+            await cache_document(created)
+            return created
+        record = await get_idempotency_key_repo(idempotency_key)
+        if record is None:
+            raise IdempotencyKeyInProgressError(f"Idempotency key {idempotency_key} is being processed")
+
+    if record['request_hash'] != request_hash:
+        raise IdempotencyKeyReusedError(f"Idempotency key {idempotency_key} was already used for a different request")
+    if record['document'] is not None:
+        return DocumentDto.from_raw(record['document'])
+
+    document = await get_document_by_reference_repo(ref, read_only=False)
+    if document is None:
+        raise IdempotencyKeyInProgressError(f"Idempotency key {idempotency_key} is being processed")
+    await complete_idempotency_key_repo(idempotency_key, document['_id'])
+    return DocumentDto.from_raw(document)
@@ -1,5 +1,6 @@
 from typing import List
 
+from core.document.cache import cache_document
 from core.document.dtos.document_dto import DocumentDto
 from core.document.repositories.create_document_repo import create_document_repo
 
@@ -9,7 +10,8 @@ async def create_document_service(ref: str, concept: str, items: List[dict], des
     Creates a new document in the database with the provided reference, concept, items, and optional description.
 
     This function calls the repository method to create a document and then returns a `DocumentDto` object
-    containing the details of the newly created document.
+    containing the details of the newly created document. The document is also put in `document_cache`, so
+    reading it back by reference does not touch the database.
 
     Args:
         ref (str): The reference code for the new document.
@@ -29,5 +31,6 @@ async def create_document_service(ref: str, concept: str, items: List[dict], des
         document = await create_document_service("INV-12345", "sale", items, "Sale of office supplies")
         print(document.reference)  # Output: "INV-12345"
     """
-    document = await create_document_repo(ref, concept, items, description)
-    return DocumentDto.from_entity(document)
+    document = DocumentDto.from_entity(await create_document_repo(ref, concept, items, description))
+    await cache_document(document)
+    return document
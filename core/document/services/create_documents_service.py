@@ -0,0 +1,34 @@
+from typing import List
+
+from core.document.cache import cache_document
+from core.document.dtos.create_document_dto import CreateDocumentDto
+from core.document.dtos.document_bulk_result_dto import DocumentBulkResultDto
+from core.document.dtos.document_dto import DocumentDto
+from core.document.repositories.create_documents_repo import create_documents_repo
+
+
+async def create_documents_service(documents: List[CreateDocumentDto]) -> List[DocumentBulkResultDto]:
+    """
+    Creates many documents in one batch and reports the outcome of each one.
+
+    This function calls the repository method that creates the whole batch with grouped writes, and converts
+    each outcome into a `DocumentBulkResultDto`. Created documents are put in `document_cache`.
+
+    Args:
+        documents (List[CreateDocumentDto]): The documents to create.
+
+    Returns:
+        List[DocumentBulkResultDto]: One result per submitted document, in the same order.
+
+    Example:
+        results = await create_documents_service([document_dto_1, document_dto_2])
+        print([result.error for result in results])
+    """
+    results = await create_documents_repo([document.model_dump() for document in documents])
+    outcomes = []
+    for document, result in zip(documents, results):
+        created = DocumentDto.from_entity(result.document) if result.document is not None else None
+        if created is not None:
+            await cache_document(created)
+        outcomes.append(DocumentBulkResultDto(reference=document.reference, document=created, error=result.error))
+    return outcomes
@@ -0,0 +1,41 @@
+import csv
+import io
+from typing import AsyncIterator
+
+from core.document.dtos.document_export_dto import DOCUMENT_EXPORT_COLUMNS, DocumentExportDto, document_export_rows
+from core.document.repositories.stream_documents_repo import stream_documents_repo
+
+CHUNK_BYTES = 64 * 1024
+
+
+async def export_documents_csv_service(export: DocumentExportDto, batch_size: int = 1000) -> AsyncIterator[bytes]:
+    """
+    Service method to stream the items of the documents matching an export as CSV, one row per item.
+
+    Rows are written to a small buffer as the repository cursor advances, and the buffer is sent whenever it
+    holds about 64 KiB, so memory usage does not depend on the number of documents exported. The first row
+    holds the column names (`DOCUMENT_EXPORT_COLUMNS`) and datetimes are written in ISO 8601, in UTC and
+    with their offset (`2024-05-01T10:00:00+00:00`).
+
+    Args:
+        export (DocumentExportDto): The filters of the export.
+        batch_size (int): The number of documents fetched per database round trip. Defaults to 1000.
+
+    Yields:
+        bytes: Chunks of UTF-8 encoded CSV.
+
+    Example:
+        async for chunk in export_documents_csv_service(DocumentExportDto(concept="sale")):
+            response.write(chunk)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(DOCUMENT_EXPORT_COLUMNS)
+    async for raw in stream_documents_repo(export, batch_size):
+        for row in document_export_rows(raw):
+            writer.writerow((*row[:3], row[3].isoformat(), *row[4:]))
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
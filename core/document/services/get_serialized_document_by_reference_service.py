@@ -0,0 +1,31 @@
+from typing import Optional
+
+from core.document.cache import cache_document, document_cache
+from core.document.dtos.document_dto import DocumentDto
+from core.document.repositories.get_document_by_reference_repo import get_document_by_reference_repo
+
+
+async def get_serialized_document_by_reference_service(reference: str) -> Optional[bytes]:
+    """
+    Service method to retrieve a document by its reference, already serialized to JSON.
+
+    The serialized document is served from `document_cache` when possible. Otherwise it is read from the
+    database, serialized and cached, so the next reads of the same reference skip the database and the DTO.
+
+    Args:
+        reference (str): The reference of the document.
+
+    Returns:
+        Optional[bytes]: The document serialized as `DocumentDto` JSON, or None if it does not exist.
+
+    Example:
+        content = await get_serialized_document_by_reference_service("INV-12345")
+    """
+    content = await document_cache.get(reference)
+    if content is not None:
+        return content
+
+    raw = await get_document_by_reference_repo(reference)
+    if raw is None:
+        return None
+    return await cache_document(DocumentDto.from_raw(raw))
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from core.document.cursor import encode_document_cursor
+from core.document.dtos.document_dto import DocumentDto
+from core.document.dtos.document_page_dto import DocumentPageDto
+from core.document.dtos.document_search_dto import DocumentSearchDto
+from core.document.repositories.search_documents_repo import search_documents_repo
+
+
+async def search_documents_service(search: DocumentSearchDto, limit: int, after: Optional[str] = None) -> DocumentPageDto:
+    """
+    Service method to search documents one page at a time.
+
+    This method fetches one document more than `limit` to find out whether another page exists, and
+    returns the page as a `DocumentPageDto` whose `next_after` cursor points at the last returned document.
+
+    Args:
+        search (DocumentSearchDto): The filters of the search.
+        limit (int): The maximum number of documents in the page.
+        after (Optional[str]): The cursor returned with the previous page, or None for the first page.
+
+    Returns:
+        DocumentPageDto: The documents in the page, newest first, and the cursor of the next page, if any.
+
+    Raises:
+        ValueError: If the search or the cursor is invalid (see `search_documents_repo`).
+
+    Example:
+        page = await search_documents_service(DocumentSearchDto(concept="sale"), 100)
+        while page.next_after:
+            page = await search_documents_service(DocumentSearchDto(concept="sale"), 100, page.next_after)
+    """
+    documents = await search_documents_repo(search, limit + 1, after)
+    page = documents[:limit]
+    next_after = encode_document_cursor(page[-1]) if len(documents) > limit else None
+    return DocumentPageDto.model_construct(items=[DocumentDto.from_raw(raw) for raw in page], next_after=next_after)
@@ -0,0 +1,38 @@
+import argparse
+import json
+import sys
+
+from infrastructure.auto_import import PROJECT_ROOT, build_endpoint_manifest
+from infrastructure.settings import settings
+
+ENDPOINT_PACKAGES = [
+    "core.document.endpoints",
+    "core.product.endpoints",
+]
+"""
+Packages whose endpoint modules are listed in the endpoint manifest and imported by their router.
+"""
+
+
+def render_endpoint_manifest() -> str:
+    """
+    Renders the endpoint manifest of `ENDPOINT_PACKAGES` as it is checked in.
+    """
+    return json.dumps(build_endpoint_manifest(ENDPOINT_PACKAGES), indent=2) + "\n"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the endpoint manifest read by the routers at startup.")
+    parser.add_argument("--check", action="store_true", help="Fail if the checked-in manifest is out of date.")
+    args = parser.parse_args()
+
+    path = PROJECT_ROOT / settings.endpoint_manifest_path
+    manifest = render_endpoint_manifest()
+    if args.check:
+        if not path.is_file() or path.read_text(encoding="utf-8") != manifest:
+            print(f"{settings.endpoint_manifest_path} is out of date, run `make endpoints_manifest`")
+            sys.exit(1)
+        print(f"{settings.endpoint_manifest_path} is up to date")
+    else:
+        path.write_text(manifest, encoding="utf-8")
+        print(f"Wrote {settings.endpoint_manifest_path}")
@@ -0,0 +1,81 @@
+import argparse
+from datetime import datetime, timezone
+
+from bson import ObjectId
+
+from core.counter.entities.counter import Counter
+from core.document.entities.document import Document
+from core.document.entities.idempotency_key import IdempotencyKey
+from core.product.entities.product import Product
+from core.stock.entities.stock_balance import StockBalance
+from core.stock.entities.stock_snapshot import StockSnapshot
+from infrastructure.command import run_with_mongo
+from infrastructure.indexes import HotQuery, ensure_indexes, check_query_plans
+
+INDEXED_ENTITIES = [Counter, Document, IdempotencyKey, Product, StockBalance, StockSnapshot]
+"""
+Entities whose declared indexes are built at startup and by `python -m core.indexes`.
+"""
+
+HOT_QUERIES = [
+    HotQuery("product by id", Product, {'_id': ObjectId()}),
+    HotQuery("product by code", Product, {'code': ''}),
+    HotQuery("products by code prefix", Product, {'code': {'$regex': '^P'}}, [('code', 1)]),
+    HotQuery("document by reference", Document, {'reference': ''}),
+    HotQuery("document by concept and consecutive", Document, {'concept': '', 'consecutive': 0}),
+    HotQuery(
+        "documents by datetime range",
+        Document,
+        {'datetime': {'$gte': datetime.min.replace(tzinfo=timezone.utc), '$lt': datetime.now(timezone.utc)}},
+        [('datetime', -1), ('_id', -1)],
+    ),
+    HotQuery(
+        "documents of a concept by datetime range",
+        Document,
+        {'concept': '', 'datetime': {'$gte': datetime.min.replace(tzinfo=timezone.utc)}},
+        [('datetime', -1), ('_id', -1)],
+    ),
+    HotQuery(
+        "documents of a product by datetime range",
+        Document,
+        {'items.product.id': ObjectId(), 'datetime': {'$gt': datetime.min.replace(tzinfo=timezone.utc)}},
+        [('datetime', -1), ('_id', -1)],
+    ),
+    HotQuery(
+        "document export of a concept by datetime range",
+        Document,
+        {'concept': '', 'datetime': {'$gte': datetime.min.replace(tzinfo=timezone.utc), '$lt': datetime.now(timezone.utc)}},
+        [('datetime', 1), ('_id', 1)],
+    ),
+    HotQuery("counter by name", Counter, {'name': ''}),
+    HotQuery("idempotency key", IdempotencyKey, {'_id': ''}),
+    HotQuery("latest stock snapshot", StockSnapshot, {}, [('at', -1)]),
+    HotQuery("latest stock snapshot of a product", StockSnapshot, {'product': ObjectId(), 'at': {'$lte': datetime.now(timezone.utc)}}, [('at', -1)]),
+]
+"""
+Query shapes issued on hot paths. `check_query_plans(HOT_QUERIES)` fails if any of them is planned as a COLLSCAN.
+"""
+
+
+async def build_indexes(check: bool = True):
+    """
+    Builds the indexes of every entity in `INDEXED_ENTITIES` and, optionally, checks the hot query plans.
+
+    Args:
+        check (bool): Whether to verify afterwards that no query in `HOT_QUERIES` needs a collection scan.
+
+    Raises:
+        CollectionScanError: If `check` is set and a hot query is planned as a COLLSCAN.
+    """
+    await ensure_indexes(INDEXED_ENTITIES)
+    if check:
+        await check_query_plans(HOT_QUERIES)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the declared indexes and check the hot query plans.")
+    parser.add_argument("--skip-check", action="store_true", help="Do not check the hot query plans.")
+    args = parser.parse_args()
+
+    run_with_mongo(lambda: build_indexes(check=not args.skip_check))
+    print("Indexes are up to date")
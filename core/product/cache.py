@@ -0,0 +1,27 @@
+import bson
+
+from infrastructure.lru_cache import LruCache
+from infrastructure.settings import settings
+from infrastructure.shared_cache import TieredCache
+
+product_cache = TieredCache(
+    "product",
+    LruCache(
+        max_entries=settings.product_cache_max_entries,
+        max_bytes=settings.product_cache_max_bytes,
+        ttl_seconds=settings.product_cache_ttl_seconds,
+        sizeof=lambda raw: len(bson.encode(raw)),
+    ),
+    encode=bson.encode,
+    decode=bson.decode,
+    ttl_seconds=settings.product_cache_ttl_seconds,
+)
+"""
+Process-wide cache of raw product documents, keyed by the product id as a string.
+
+Repositories read through this cache (`get_product_by_id_repo`, `get_products_by_ids_repo`) and write
+through it (`create_product_repo`, `update_product_repo`, `bulk_upsert_products_repo`), so a worker never
+serves a product older than its own last write. With a shared cache backend, products are also shared between
+workers as BSON, and updates made by other workers are invalidated right away; otherwise they become visible
+once the cached entry's TTL elapses.
+"""
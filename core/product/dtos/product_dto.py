@@ -4,6 +4,11 @@ from pydantic import BaseModel
 
 from core.product.entities.product import Product
 
+PRODUCT_PROJECTION = {'code': 1, 'name': 1, 'price': 1, 'description': 1}
+"""
+The product fields read by `ProductDto.from_raw`, for use as a query projection.
+"""
+
 
 class ProductDto(BaseModel):
     """
@@ -72,3 +77,29 @@ class ProductDto(BaseModel):
             price=entity.price,
             description=entity.description,
         )
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "ProductDto":
+        """
+        Class method to build a ProductDto directly from a raw product document.
+
+        The document is trusted, as it was written through the `Product` entity,
+        so the DTO is built with `model_construct`, skipping both the entity
+        hydration and the Pydantic validation that `from_entity` goes through.
+
+        Args:
+            raw (dict): The product document as read from MongoDB.
+
+        Returns:
+            ProductDto: A DTO representation of the product document.
+
+        Example:
+            product_dto = ProductDto.from_raw(await get_collection(Product).find_one())
+        """
+        return cls.model_construct(
+            id=str(raw['_id']),
+            code=raw['code'],
+            name=raw['name'],
+            price=raw['price'],
+            description=raw.get('description'),
+        )
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class ProductImportErrorDto(BaseModel):
+    """
+    Data Transfer Object (DTO) describing why a row of a product import was rejected.
+
+    Attributes:
+        row (int): The zero-based position of the row in the imported body (excluding a CSV header).
+        error (str): The validation or write error for that row.
+
+    Example:
+        error = ProductImportErrorDto(row=3, error="price: Input should be a valid number")
+    """
+
+    row: int
+    error: str
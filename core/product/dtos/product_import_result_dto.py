@@ -0,0 +1,25 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from core.product.dtos.product_import_error_dto import ProductImportErrorDto
+
+
+class ProductImportResultDto(BaseModel):
+    """
+    Data Transfer Object (DTO) summarizing a bulk product import.
+
+    Attributes:
+        received (int): Number of rows read from the request body.
+        inserted (int): Number of new products created.
+        updated (int): Number of existing products (matched by code) that were overwritten.
+        errors (List[ProductImportErrorDto]): The rows that were rejected, with the reason.
+
+    Example:
+        result = ProductImportResultDto(received=2, inserted=1, updated=0, errors=[ProductImportErrorDto(row=1, error="...")])
+    """
+
+    received: int = 0
+    inserted: int = 0
+    updated: int = 0
+    errors: List[ProductImportErrorDto] = []
@@ -0,0 +1,24 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from core.product.dtos.product_dto import ProductDto
+
+
+class ProductPageDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for representing a page of products.
+
+    This class is returned by the paginated product listing. The `next_after` cursor is the id of the last
+    product in `items`, and is passed back as the `after` query parameter to fetch the following page.
+
+    Attributes:
+        items (List[ProductDto]): The products in this page, in ascending id order.
+        next_after (Optional[str]): The cursor for the next page, or None if this is the last page.
+
+    Example:
+        page = ProductPageDto(items=[product_dto], next_after=None)
+    """
+
+    items: List[ProductDto]
+    next_after: Optional[str] = None
@@ -1,42 +1,77 @@
-from typing import List
+from typing import Literal, Optional
 
-from core.product.dtos.product_dto import ProductDto
+from bson import ObjectId
+from fastapi import HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from core.product.dtos.product_page_dto import ProductPageDto
 from core.product.router import product_router
 from core.product.services.get_all_products_service import get_all_products_service
+from core.product.services.stream_all_products_service import stream_all_products_service
+from infrastructure.responses import model_response
 
 
-@product_router.get("/", response_model=List[ProductDto])
-async def list_products_endpoint() -> List[ProductDto]:
+@product_router.get("/", response_model=ProductPageDto)
+async def list_products_endpoint(
+        limit: int = Query(100, ge=1, le=1000),
+        after: Optional[str] = None,
+        format: Literal["json", "ndjson"] = "json",
+):
     """
-    Endpoint to retrieve a list of all products.
+    Endpoint to retrieve products, either one page at a time or as a stream.
+
+    By default this endpoint returns a page of at most `limit` products as a `ProductPageDto`. To fetch the
+    next page, pass the returned `next_after` cursor as the `after` query parameter. Pages are keyset-paginated
+    on the product id, so every page costs the same regardless of its position in the catalog.
 
-    This endpoint fetches all products from the database using the `get_all_products_service`
-    service method and returns them as a list of `ProductDto` objects. If there are no products,
-    it returns an empty list.
+    With `format=ndjson` the endpoint instead streams every product after `after` as newline-delimited JSON,
+    reading from a server-side cursor so the response uses bounded memory no matter how large the catalog is.
+    `limit` is ignored in this mode.
+
+    Args:
+        limit (int): The maximum number of products per page (1-1000). Defaults to 100.
+        after (Optional[str]): The id of the last product of the previous page.
+        format (str): `json` for a paginated response or `ndjson` for a streamed response.
 
     Returns:
-        List[ProductDto]: A list of `ProductDto` instances representing all products.
+        ProductPageDto: A page of `ProductDto` instances and the cursor of the next page, or a streamed
+        NDJSON response when `format=ndjson`.
+
+    Raises:
+        HTTPException: If `after` is not a valid product id, a 400 error is raised.
 
     Example:
-        List all products:
-        GET /products
+        List the first page of products:
+        GET /product/?limit=2
 
         Response:
-        [
-            {
-                "id": "60b91b5e64e2a9f024f5b04f",
-                "code": "P001",
-                "name": "Sample Product 1",
-                "price": 19.99,
-                "description": "Description of product 1"
-            },
-            {
-                "id": "60b91b5e64e2a9f024f5b050",
-                "code": "P002",
-                "name": "Sample Product 2",
-                "price": 29.99,
-                "description": "Description of product 2"
-            }
-        ]
+        {
+            "items": [
+                {
+                    "id": "60b91b5e64e2a9f024f5b04f",
+                    "code": "P001",
+                    "name": "Sample Product 1",
+                    "price": 19.99,
+                    "description": "Description of product 1"
+                },
+                {
+                    "id": "60b91b5e64e2a9f024f5b050",
+                    "code": "P002",
+                    "name": "Sample Product 2",
+                    "price": 29.99,
+                    "description": "Description of product 2"
+                }
+            ],
+            "next_after": "60b91b5e64e2a9f024f5b050"
+        }
+
+        Stream the whole catalog:
+        GET /product/?format=ndjson
     """
-    return await get_all_products_service()
+    if after is not None and not ObjectId.is_valid(after):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    if format == "ndjson":
+        return StreamingResponse(stream_all_products_service(after), media_type="application/x-ndjson")
+
+    return model_response(await get_all_products_service(limit, after))
@@ -3,6 +3,7 @@ from fastapi import HTTPException
 from core.product.dtos.product_dto import ProductDto
 from core.product.router import product_router
 from core.product.services.get_product_by_id_service import get_product_by_id_service
+from infrastructure.responses import model_response
 
 
 @product_router.get("/{product_id}", response_model=ProductDto)
@@ -41,4 +42,4 @@ async def get_product_by_id_endpoint(product_id: str):
     product = await get_product_by_id_service(product_id)
     if product is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return model_response(product)
@@ -0,0 +1,36 @@
+from common.dtos.cache_stats_dto import CacheStatsDto
+from core.product.cache import product_cache
+from core.product.router import product_router
+
+
+@product_router.get("/cache/stats", response_model=CacheStatsDto)
+async def get_product_cache_stats_endpoint() -> CacheStatsDto:
+    """
+    Endpoint to retrieve the counters of this worker's product cache.
+
+    Each worker process has its own in-process cache, so the counters describe only the worker that served the
+    request. The `shared_*` counters describe this worker's use of the shared cache, and are null when no
+    shared cache backend is configured.
+
+    Returns:
+        CacheStatsDto: The hit, miss, eviction and expiration counters and the current size of the cache.
+
+    Example:
+        GET /product/cache/stats
+
+        Response:
+        {
+            "hits": 1520,
+            "misses": 48,
+            "evictions": 0,
+            "expirations": 12,
+            "entries": 36,
+            "bytes": 4210,
+            "max_entries": 10000,
+            "max_bytes": null,
+            "shared_hits": null,
+            "shared_misses": null,
+            "shared_errors": null
+        }
+    """
+    return CacheStatsDto(**product_cache.stats())
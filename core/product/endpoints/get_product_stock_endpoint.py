@@ -0,0 +1,46 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+
+from core.product.router import product_router
+from core.stock.dtos.stock_balance_dto import StockBalanceDto
+from core.stock.services.get_product_stock_service import get_product_stock_service
+
+
+@product_router.get("/{product_id}/stock", response_model=StockBalanceDto)
+async def get_product_stock_endpoint(product_id: str, at: Optional[datetime] = None):
+    """
+    Endpoint to retrieve the stock on hand of a product, now or as of a past instant.
+
+    The stock is maintained incrementally as documents are created, so this endpoint reads a single balance
+    instead of scanning the document history. With `at`, the stock is computed from the latest stock
+    snapshot before `at` plus the documents created between the snapshot and `at`.
+
+    Args:
+        product_id (str): The ID of the product.
+        at (Optional[datetime]): The instant to compute the stock for (ISO 8601), or None for the current stock.
+
+    Raises:
+        HTTPException: If the product with the given ID does not exist, raises a 404 HTTP
+        exception with the message "Product not found".
+
+    Returns:
+        StockBalanceDto: The stock on hand of the product.
+
+    Example:
+        GET /product/60b91b5e64e2a9f024f5b04f/stock
+
+        Response:
+        {
+            "product_id": "60b91b5e64e2a9f024f5b04f",
+            "quantity": 42,
+            "at": null
+        }
+
+        GET /product/60b91b5e64e2a9f024f5b04f/stock?at=2024-11-20T00:00:00Z
+    """
+    stock = await get_product_stock_service(product_id, at)
+    if stock is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    return stock
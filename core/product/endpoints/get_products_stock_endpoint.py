@@ -0,0 +1,33 @@
+from typing import List
+
+from fastapi import Query
+
+from core.product.router import product_router
+from core.stock.dtos.stock_balance_dto import StockBalanceDto
+from core.stock.services.get_products_stock_service import get_products_stock_service
+
+
+@product_router.get("/stock", response_model=List[StockBalanceDto])
+async def get_products_stock_endpoint(ids: List[str] = Query(..., max_length=1000)) -> List[StockBalanceDto]:
+    """
+    Endpoint to retrieve the stock on hand of many products at once.
+
+    All balances are read with a single query. Products without any stock movement, including unknown
+    ids, are reported with a stock of 0.
+
+    Args:
+        ids (List[str]): The IDs of the products, as repeated `ids` query parameters (at most 1000).
+
+    Returns:
+        List[StockBalanceDto]: The stock on hand of each requested product.
+
+    Example:
+        GET /product/stock?ids=60b91b5e64e2a9f024f5b04f&ids=60b91b5e64e2a9f024f5b050
+
+        Response:
+        [
+            {"product_id": "60b91b5e64e2a9f024f5b04f", "quantity": 42},
+            {"product_id": "60b91b5e64e2a9f024f5b050", "quantity": 0}
+        ]
+    """
+    return await get_products_stock_service(ids)
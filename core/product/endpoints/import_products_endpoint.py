@@ -0,0 +1,51 @@
+from fastapi import Query, Request
+
+from core.product.dtos.product_import_result_dto import ProductImportResultDto
+from core.product.router import product_router
+from core.product.services.import_products_service import import_products_service
+from infrastructure.request_rows import iter_request_rows
+from infrastructure.settings import settings
+
+
+@product_router.post("/bulk", response_model=ProductImportResultDto)
+async def import_products_endpoint(
+        request: Request,
+        chunk_size: int = Query(settings.product_import_chunk_size, ge=1, le=10000),
+) -> ProductImportResultDto:
+    """
+    Endpoint to create or update many products in one request.
+
+    The body can be a JSON array of products (`Content-Type: application/json`), newline-delimited JSON
+    (`application/x-ndjson`) or CSV with a `code,name,price,description` header (`text/csv`). NDJSON and CSV
+    bodies are parsed while they are being uploaded. Rows are validated like `POST /product/` and written
+    with unordered bulk upserts keyed by `code` every `chunk_size` rows: a product whose code already exists
+    is overwritten, otherwise it is created. Invalid rows are reported without aborting the import.
+
+    Args:
+        request (Request): The request whose body holds the products.
+        chunk_size (int): The number of rows written per bulk write (1-10000).
+
+    Returns:
+        ProductImportResultDto: The number of rows received, inserted and updated, and the per-row errors.
+
+    Raises:
+        HTTPException: 415 if the content type is not supported, 400 if a JSON body is not an array.
+
+    Example:
+        Import products from CSV:
+        POST /product/bulk
+        Content-Type: text/csv
+
+        code,name,price,description
+        P001,Pen,1.5,Blue ink pen
+        P002,Notebook,abc,
+
+        Response:
+        {
+            "received": 2,
+            "inserted": 1,
+            "updated": 0,
+            "errors": [{"row": 1, "error": "1 validation error for CreateProductDto ..."}]
+        }
+    """
+    return await import_products_service(iter_request_rows(request), chunk_size)
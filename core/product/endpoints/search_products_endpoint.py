@@ -0,0 +1,43 @@
+from typing import List
+
+from fastapi import Query
+
+from core.product.dtos.product_dto import ProductDto
+from core.product.router import product_router
+from core.product.services.search_products_service import search_products_service
+
+
+@product_router.get("/search", response_model=List[ProductDto])
+async def search_products_endpoint(
+        q: str = Query(..., min_length=1, max_length=100),
+        limit: int = Query(10, ge=1, le=100),
+) -> List[ProductDto]:
+    """
+    Endpoint to find products by a prefix of their code or name, for autocompletion.
+
+    Matches ignore case and accents. Products whose code starts with `q` come first, then those whose name
+    starts with it, then those with any other word of the name starting with it. Searches are answered from an
+    in-memory index, without a database round trip.
+
+    Args:
+        q (str): The prefix typed by the user.
+        limit (int): The maximum number of products to return (1-100). Defaults to 10.
+
+    Returns:
+        List[ProductDto]: The matching products, best matches first.
+
+    Example:
+        GET /product/search?q=blue%20p&limit=5
+
+        Response:
+        [
+            {
+                "id": "60b91b5e64e2a9f024f5b04f",
+                "code": "P001",
+                "name": "Blue Pen",
+                "price": 1.5,
+                "description": null
+            }
+        ]
+    """
+    return await search_products_service(q, limit)
@@ -11,7 +11,7 @@ class Product(Document):
     under the 'products' collection.
 
     Attributes:
-        code (str): The unique identifier for the product.
+        code (str): The unique identifier for the product, backed by a unique index.
         name (str): The name of the product.
         price (float): The price of the product.
         description (str, optional): A description of the product (default is None).
@@ -19,10 +19,11 @@ class Product(Document):
 
     meta = {
         'collection': 'products',
-        'db_alias': 'inventory'
+        'db_alias': 'inventory',
+        'auto_create_index': False
     }
 
-    code = StringField(required=True)
+    code = StringField(required=True, unique=True)
     name = StringField(required=True)
     price = FloatField(required=True)
     description = StringField(required=False)
@@ -0,0 +1,78 @@
+from typing import Dict, List, NamedTuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from core.product.cache import product_cache
+from core.product.dtos.create_product_dto import CreateProductDto
+from core.product.dtos.product_dto import PRODUCT_PROJECTION
+from core.product.entities.product import Product
+from core.product.search_index import product_search_index, product_search_terms
+from infrastructure.database import get_collection
+
+
+class BulkUpsertResult(NamedTuple):
+    """
+    Outcome of a `bulk_upsert_products_repo` call.
+
+    Attributes:
+        inserted (int): Number of products created.
+        updated (int): Number of existing products (matched by code) that were overwritten.
+        errors (Dict[int, str]): Error messages of the failed writes, keyed by position in the input list.
+    """
+    inserted: int
+    updated: int
+    errors: Dict[int, str]
+
+
+async def bulk_upsert_products_repo(dtos: List[CreateProductDto]) -> BulkUpsertResult:
+    """
+    Creates or overwrites many products, keyed by their code, with a single unordered bulk write.
+
+    Each DTO becomes an upsert on `code`: a product with the same code is overwritten, otherwise a new product
+    is inserted. Because the bulk write is unordered, a failing row (e.g. a duplicate code racing with a
+    concurrent insert) does not prevent the other rows from being written; its error is returned instead.
+
+    Upserts do not report the ids of updated products, which key both `product_cache` and
+    `product_search_index`. So when an existing product was overwritten, or once the index has been loaded,
+    the written products are read back with a single `$in` query on their codes. They then replace the cached
+    copies, in every worker when a shared cache backend is configured, and their index entries.
+
+    Args:
+        dtos (List[CreateProductDto]): The validated products to write.
+
+    Returns:
+        BulkUpsertResult: The number of inserted and updated products, and the per-row write errors.
+
+    Example:
+        result = await bulk_upsert_products_repo([CreateProductDto(code="P1", name="Pen", price=1.5)])
+        print(result.inserted, result.updated)
+    """
+    operations = []
+    for dto in dtos:
+        product = Product(code=dto.code, name=dto.name, price=dto.price, description=dto.description)
+        product.validate()
+        operations.append(UpdateOne(
+            {'code': product.code},
+            {'$set': {'name': product.name, 'price': product.price, 'description': product.description}},
+            upsert=True,
+        ))
+
+    try:
+        result = (await get_collection(Product).bulk_write(operations, ordered=False)).bulk_api_result
+        errors = {}
+    except BulkWriteError as e:
+        result = e.details
+        errors = {error['index']: error['errmsg'] for error in e.details['writeErrors']}
+
+    if result['nMatched'] or product_search_index.loaded:
+        codes = [dto.code for position, dto in enumerate(dtos) if position not in errors]
+        cursor = get_collection(Product).find({'code': {'$in': codes}}, PRODUCT_PROJECTION)
+        written = {str(raw['_id']): raw async for raw in cursor}
+        if result['nMatched']:
+            await product_cache.put_many(written)
+        if product_search_index.loaded:
+            for product_id, raw in written.items():
+                product_search_index.put(product_id, product_search_terms(raw), raw)
+
+    return BulkUpsertResult(inserted=result['nUpserted'], updated=result['nMatched'], errors=errors)
@@ -1,5 +1,8 @@
 from core.product.dtos.create_product_dto import CreateProductDto
+from core.product.cache import product_cache
 from core.product.entities.product import Product
+from core.product.search_index import product_search_index, product_search_terms
+from infrastructure.database import get_collection
 
 
 async def create_product_repo(dto: CreateProductDto) -> Product:
@@ -8,7 +11,8 @@ async def create_product_repo(dto: CreateProductDto) -> Product:
 
     This asynchronous function takes a `CreateProductDto` object, extracts
     the product details (code, name, price, description), creates a new
-    product in the database, and returns the created product.
+    product in the database, and returns the created product. The new product
+    is written through to `product_cache` and added to `product_search_index`.
 
     Args:
         dto (CreateProductDto): The data transfer object containing the
@@ -23,5 +27,10 @@ async def create_product_repo(dto: CreateProductDto) -> Product:
         print(new_product.name)
     """
     product = Product(code=dto.code, name=dto.name, price=dto.price, description=dto.description)
-    await product.save()
+    product.validate()
+    raw = product.to_mongo().to_dict()
+    result = await get_collection(Product).insert_one(raw)
+    product.id = result.inserted_id
+    await product_cache.fill(str(product.id), raw)
+    product_search_index.put(str(product.id), product_search_terms(raw), raw)
     return product
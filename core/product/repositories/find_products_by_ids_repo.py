@@ -0,0 +1,39 @@
+from typing import Dict, Iterable
+
+from bson import ObjectId
+
+from core.product.cache import product_cache
+from core.product.entities.product import Product
+from infrastructure.database import get_collection
+
+
+async def find_products_by_ids_repo(product_ids: Iterable[str]) -> Dict[str, Product]:
+    """
+    Looks up a collection of product IDs with a single query, skipping the ones that do not exist.
+
+    Duplicate IDs are collapsed before querying, and products found in `product_cache` are not queried at
+    all, so at most one query is issued. IDs that are not valid ObjectIds or do not match a product are
+    simply absent from the result.
+
+    Args:
+        product_ids (Iterable[str]): The product IDs to look up. May contain duplicates.
+
+    Returns:
+        Dict[str, Product]: A mapping from each found product ID to its `Product` entity.
+
+    Example:
+        products = await find_products_by_ids_repo(["60b8fbd6b6a05a001f3db9d2", "60b8fbd6b6a05a001f3db9d3"])
+        missing = {"60b8fbd6b6a05a001f3db9d2", "60b8fbd6b6a05a001f3db9d3"} - products.keys()
+    """
+    valid_ids = [product_id for product_id in dict.fromkeys(product_ids) if ObjectId.is_valid(product_id)]
+
+    cached = await product_cache.get_many(valid_ids)
+    products = {product_id: Product._from_son(raw) for product_id, raw in cached.items()}
+
+    uncached_ids = [ObjectId(product_id) for product_id in valid_ids if product_id not in cached]
+    if uncached_ids:
+        found = {str(raw['_id']): raw async for raw in get_collection(Product).find({'_id': {'$in': uncached_ids}})}
+        await product_cache.fill_many(found)
+        products.update((product_id, Product._from_son(raw)) for product_id, raw in found.items())
+
+    return products
@@ -1,23 +1,34 @@
-from typing import List
+from typing import List, Optional
 
+from bson import ObjectId
+
+from core.product.dtos.product_dto import PRODUCT_PROJECTION
 from core.product.entities.product import Product
+from infrastructure.database import get_collection
 
 
-async def get_all_products_repo() -> List[Product]:
+async def get_all_products_repo(limit: int, after: Optional[str] = None) -> List[dict]:
     """
-    Retrieves all products from the database.
+    Retrieves a page of products from the database, ordered by id.
+
+    This asynchronous function uses keyset pagination on `_id`: it returns at most `limit` products whose
+    id is greater than `after`. Because the query seeks directly to `after` through the `_id` index, the cost
+    of fetching a page does not grow with how deep into the catalog the page is. Products are returned as raw
+    documents restricted to `PRODUCT_PROJECTION`, ready for `ProductDto.from_raw`. If no products are found,
+    it returns an empty list. The query follows the configured read preference.
 
-    This asynchronous function queries the database and returns a list of
-    all the products in the 'products' collection. If no products are
-    found, it returns an empty list.
+    Args:
+        limit (int): The maximum number of products to return.
+        after (Optional[str]): The id of the last product of the previous page. If None, the first page
+                               is returned.
 
     Returns:
-        List[Product]: A list of all products stored in the database.
+        List[dict]: Up to `limit` raw products with an id greater than `after`, in ascending id order.
                         If no products are found, an empty list is returned.
 
     Example:
-        products = await get_all_products_repo()
-        for product in products:
-            print(product.name)
+        products = await get_all_products_repo(100)
+        next_page = await get_all_products_repo(100, after=str(products[-1]['_id']))
     """
-    return await Product.objects.all()
+    query = {'_id': {'$gt': ObjectId(after)}} if after else {}
+    return await get_collection(Product, read_only=True).find(query, PRODUCT_PROJECTION).sort('_id', 1).limit(limit).to_list()
@@ -1,29 +1,48 @@
 from typing import Optional
 
+from bson import ObjectId
+
+from core.product.cache import product_cache
+from core.product.dtos.product_dto import PRODUCT_PROJECTION
 from core.product.entities.product import Product
+from infrastructure.database import get_collection
 
 
-async def get_product_by_id_repo(product_id: str) -> Optional[Product]:
+async def get_product_by_id_repo(product_id: str) -> Optional[dict]:
     """
     Retrieves a product by its unique identifier.
 
     This asynchronous function queries the database for a product using
     its unique `product_id`. If the product exists, it will return the
-    corresponding `Product` entity. If the product is not found, it will
-    return None.
+    raw product document (restricted to `PRODUCT_PROJECTION`), ready for
+    `ProductDto.from_raw`. If the product is not found, it will
+    return None. Identifiers that are not valid ObjectIds are treated as not found.
+    Products are served from `product_cache` when possible, and cached after
+    being read from the database. Database reads honour the configured read
+    preference, so they may be served by a secondary.
 
     Args:
         product_id (str): The unique identifier of the product to retrieve.
 
     Returns:
-        Optional[Product]: The product object if found, otherwise None
-                            if no product with the given id exists.
+        Optional[dict]: The raw product document if found, otherwise None
+                        if no product with the given id exists. It may be
+                        shared with the cache and must not be modified.
 
     Example:
         product = await get_product_by_id_repo("12345")
         if product:
-            print(product.name)
+            print(product['name'])
         else:
             print("Product not found.")
     """
-    return await Product.objects(id=product_id).first()
+    if not ObjectId.is_valid(product_id):
+        return None
+    raw = await product_cache.get(product_id)
+    if raw is None:
+        raw = await get_collection(Product, read_only=True).find_one({'_id': ObjectId(product_id)}, PRODUCT_PROJECTION)
+        if raw is None:
+            return None
+        await product_cache.fill(product_id, raw)
+
+    return raw
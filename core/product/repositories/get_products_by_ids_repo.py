@@ -0,0 +1,35 @@
+from typing import Dict, Iterable
+
+from core.product.entities.product import Product
+from core.product.repositories.find_products_by_ids_repo import find_products_by_ids_repo
+
+
+async def get_products_by_ids_repo(product_ids: Iterable[str]) -> Dict[str, Product]:
+    """
+    Resolves a collection of product IDs to their `Product` entities with a single query.
+
+    Duplicate IDs are collapsed before querying, and products found in `product_cache` are not queried at
+    all, so at most one query is issued (see `find_products_by_ids_repo`). If one or more IDs do not match an
+    existing product, a single `ValueError` listing all of them is raised.
+
+    Args:
+        product_ids (Iterable[str]): The product IDs to resolve. May contain duplicates.
+
+    Returns:
+        Dict[str, Product]: A mapping from each requested product ID to its `Product` entity.
+
+    Raises:
+        ValueError: If any of the product IDs cannot be found.
+
+    Example:
+        products = await get_products_by_ids_repo(["60b8fbd6b6a05a001f3db9d2", "60b8fbd6b6a05a001f3db9d2"])
+        print(products["60b8fbd6b6a05a001f3db9d2"].name)
+    """
+    unique_ids = list(dict.fromkeys(product_ids))
+    products = await find_products_by_ids_repo(unique_ids)
+
+    missing_ids = [product_id for product_id in unique_ids if product_id not in products]
+    if missing_ids:
+        raise ValueError(f"Products with IDs {', '.join(missing_ids)} not found")
+
+    return products
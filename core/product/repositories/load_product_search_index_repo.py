@@ -0,0 +1,30 @@
+import asyncio
+
+from core.product.dtos.product_dto import PRODUCT_PROJECTION
+from core.product.entities.product import Product
+from core.product.search_index import PRODUCT_SEARCH_FIELDS, product_search_index, product_search_terms
+from infrastructure.database import get_collection
+from infrastructure.prefix_index import PrefixIndex
+
+
+async def load_product_search_index_repo() -> int:
+    """
+    Loads every product into `product_search_index`, replacing its previous content.
+
+    The products are read with a single cursor (following the configured read preference) and the index is
+    built in a worker thread, so the event loop keeps serving requests during a rebuild; searches are answered
+    from the previous content until the new index is swapped in. A product written by this worker while the
+    rebuild is running may be missing from the new index until the next refresh.
+
+    Returns:
+        int: The number of products indexed.
+
+    Example:
+        indexed = await load_product_search_index_repo()
+    """
+    raws = await get_collection(Product, read_only=True).find({}, PRODUCT_PROJECTION).to_list()
+    index = await asyncio.to_thread(
+        PrefixIndex.build, PRODUCT_SEARCH_FIELDS, ((str(raw['_id']), product_search_terms(raw), raw) for raw in raws),
+    )
+    product_search_index.replace_with(index)
+    return len(index)
@@ -0,0 +1,37 @@
+import re
+from typing import List
+
+from core.product.dtos.product_dto import PRODUCT_PROJECTION
+from core.product.entities.product import Product
+from core.product.search_index import product_search_index
+from infrastructure.database import get_collection
+
+
+async def search_products_repo(query: str, limit: int) -> List[dict]:
+    """
+    Finds up to `limit` products whose code, name, or any word of their name starts with `query`.
+
+    Matching ignores case and accents, and is answered from `product_search_index` without touching the
+    database. Products whose code matches rank first, then those whose name matches, then those with a later
+    word of the name matching. Until the index has been loaded (e.g. right after startup), the search falls
+    back to a case-sensitive code prefix query, served by the unique index on `code`.
+
+    Args:
+        query (str): The prefix typed by the user.
+        limit (int): The maximum number of products to return.
+
+    Returns:
+        List[dict]: The matching raw products, best matches first. They may be shared with the index and
+        must not be modified.
+
+    Example:
+        products = await search_products_repo("blue p", 10)
+    """
+    if product_search_index.loaded:
+        return product_search_index.search(query, limit)
+
+    prefix = query.strip()
+    if not prefix:
+        return []
+    cursor = get_collection(Product).find({'code': {'$regex': f'^{re.escape(prefix)}'}}, PRODUCT_PROJECTION)
+    return await cursor.sort('code', 1).limit(limit).to_list()
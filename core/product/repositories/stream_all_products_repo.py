@@ -0,0 +1,32 @@
+from typing import AsyncIterator, Optional
+
+from bson import ObjectId
+
+from core.product.dtos.product_dto import PRODUCT_PROJECTION
+from core.product.entities.product import Product
+from infrastructure.database import get_collection
+
+
+async def stream_all_products_repo(after: Optional[str] = None, batch_size: int = 500) -> AsyncIterator[dict]:
+    """
+    Iterates over all products in ascending id order using a single server-side cursor.
+
+    Products are fetched from MongoDB `batch_size` at a time and yielded one by one as the cursor advances,
+    so memory usage stays bounded by the batch size regardless of the size of the catalog. Products are yielded
+    as raw documents restricted to `PRODUCT_PROJECTION`, ready for `ProductDto.from_raw`. The cursor follows
+    the configured read preference, so a long export does not load the primary.
+
+    Args:
+        after (Optional[str]): If provided, only products with an id greater than `after` are returned.
+        batch_size (int): The number of products fetched per round trip. Defaults to 500.
+
+    Yields:
+        dict: Each raw product in ascending id order.
+
+    Example:
+        async for product in stream_all_products_repo():
+            print(product['name'])
+    """
+    query = {'_id': {'$gt': ObjectId(after)}} if after else {}
+    async for raw in get_collection(Product, read_only=True).find(query, PRODUCT_PROJECTION).sort('_id', 1).batch_size(batch_size):
+        yield raw
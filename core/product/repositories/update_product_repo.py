@@ -1,17 +1,26 @@
 from typing import Optional
 
+from bson import ObjectId
+from pymongo import ReturnDocument
+
 from core.product.dtos.update_product_dto import UpdateProductDto
+from core.product.cache import product_cache
 from core.product.entities.product import Product
+from core.product.search_index import product_search_index, product_search_terms
+from infrastructure.database import get_collection
 
 
 async def update_product_repo(product_id: str, dto: UpdateProductDto) -> Optional[Product]:
     """
     Updates an existing product in the database using the provided data.
 
-    This function retrieves a product by its ID and updates its attributes
-    (code, name, price, description) with the data provided in the
-    `UpdateProductDto`. If the product is found, it will be saved with
-    the updated values. If the product does not exist, it will return None.
+    This function validates the data provided in the `UpdateProductDto` and
+    updates the product's attributes (code, name, price, description) with a
+    single `find_one_and_update`, returning the product as stored after the
+    update. The stored product replaces any copy held in `product_cache`
+    (including the copies of other workers, when a shared cache backend is
+    configured) and its entry in `product_search_index`. If the product does
+    not exist, it will return None.
 
     Args:
         product_id (str): The unique identifier of the product to update.
@@ -31,12 +40,22 @@ async def update_product_repo(product_id: str, dto: UpdateProductDto) -> Optiona
         updated_product = update_product_repo('123', UpdateProductDto(code="ABC123", name="New Product", price=15.99))
         print(updated_product.name)
     """
-    product = await Product.objects(id=product_id).first()
-    if product:
-        product.code = dto.code
-        product.name = dto.name
-        product.price = dto.price
-        product.description = dto.description
-        product.save()
-
-    return product
+    if not ObjectId.is_valid(product_id):
+        return None
+
+    product = Product(code=dto.code, name=dto.name, price=dto.price, description=dto.description)
+    product.validate()
+
+    raw = await get_collection(Product).find_one_and_update(
+        {'_id': ObjectId(product_id)},
+        {'$set': {'code': product.code, 'name': product.name, 'price': product.price, 'description': product.description}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if raw is None:
+        await product_cache.invalidate([product_id])
+        product_search_index.remove(product_id)
+        return None
+
+    await product_cache.put(product_id, raw)
+    product_search_index.put(product_id, product_search_terms(raw), raw)
+    return Product._from_son(raw)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-from infrastructure.auto_import import auto_import_endpoints
+from infrastructure.auto_import import auto_import_endpoints, prioritize_static_routes
 
 product_router = APIRouter(prefix="/product", tags=["Product"])
 
 auto_import_endpoints("core.product.endpoints")
+prioritize_static_routes(product_router)
@@ -0,0 +1,26 @@
+from infrastructure.prefix_index import PrefixIndex
+
+PRODUCT_SEARCH_FIELDS = ("code", "name", "word")
+"""
+The fields of the product search index, in ranking order: code prefixes first, then prefixes of the whole
+name, then prefixes of any later word of the name (so "pen" finds "Blue Pen").
+"""
+
+
+def product_search_terms(raw: dict) -> dict:
+    """
+    Returns the search terms of a raw product for each field of `PRODUCT_SEARCH_FIELDS`.
+    """
+    name = raw.get('name') or ''
+    return {"code": [raw.get('code') or ''], "name": [name], "word": name.split()[1:]}
+
+
+product_search_index = PrefixIndex(PRODUCT_SEARCH_FIELDS)
+"""
+Process-wide prefix index of raw products, keyed by the product id as a string.
+
+It is loaded from the `products` collection at startup and refreshed periodically (see
+`refresh_product_search_index_service`), and the repositories that write products (`create_product_repo`,
+`update_product_repo`, `bulk_upsert_products_repo`) keep it current, so a worker's own writes are searchable
+immediately. Writes made by other workers become searchable at the next refresh.
+"""
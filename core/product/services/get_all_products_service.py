@@ -1,24 +1,31 @@
-from typing import List
+from typing import Optional
 
 from core.product.dtos.product_dto import ProductDto
+from core.product.dtos.product_page_dto import ProductPageDto
 from core.product.repositories.get_all_products_repo import get_all_products_repo
 
 
-async def get_all_products_service() -> List[ProductDto]:
+async def get_all_products_service(limit: int, after: Optional[str] = None) -> ProductPageDto:
     """
-    Service method to retrieve all products.
+    Service method to retrieve a page of products.
 
-    This method fetches all products from the database and returns a list of `ProductDto`
-    instances representing the products.
+    This method fetches one product more than `limit` to find out whether another page exists, and
+    returns the page as a `ProductPageDto` whose `next_after` cursor points at the last returned product.
+    The DTOs are built from the raw documents without revalidating them.
+
+    Args:
+        limit (int): The maximum number of products in the page.
+        after (Optional[str]): The cursor returned with the previous page, or None for the first page.
 
     Returns:
-        List[ProductDto]: A list of `ProductDto` instances, each containing the details
-                           of a product.
+        ProductPageDto: The products in the page and the cursor of the next page, if any.
 
     Example:
-        products_dto = await get_all_products_service()
-        for product in products_dto:
-            print(f"Product: {product.name} - Price: {product.price}")
+        page = await get_all_products_service(100)
+        while page.next_after:
+            page = await get_all_products_service(100, page.next_after)
     """
-    products = await get_all_products_repo()
-    return [ProductDto.from_entity(entity) for entity in products]
+    products = await get_all_products_repo(limit + 1, after)
+    items = [ProductDto.from_raw(raw) for raw in products[:limit]]
+    next_after = items[-1].id if len(products) > limit else None
+    return ProductPageDto.model_construct(items=items, next_after=next_after)
@@ -9,7 +9,8 @@ async def get_product_by_id_service(product_id: str) -> Optional[ProductDto]:
     Service method to retrieve a product by its ID.
 
     This method fetches a product from the database using its unique product ID
-    and returns it as a `ProductDto`. If the product is not found, it returns `None`.
+    and returns it as a `ProductDto`, built without revalidating the stored data.
+    If the product is not found, it returns `None`.
 
     Args:
         product_id (str): The unique identifier of the product to retrieve.
@@ -28,4 +29,4 @@ async def get_product_by_id_service(product_id: str) -> Optional[ProductDto]:
     product = await get_product_by_id_repo(product_id)
     if not product:
         return None
-    return ProductDto.from_entity(product)
+    return ProductDto.from_raw(product)
@@ -0,0 +1,62 @@
+from typing import AsyncIterator, List, Union
+
+from pydantic import ValidationError
+
+from core.product.dtos.create_product_dto import CreateProductDto
+from core.product.dtos.product_import_error_dto import ProductImportErrorDto
+from core.product.dtos.product_import_result_dto import ProductImportResultDto
+from core.product.repositories.bulk_upsert_products_repo import bulk_upsert_products_repo
+
+
+async def import_products_service(rows: AsyncIterator[Union[dict, Exception]], chunk_size: int) -> ProductImportResultDto:
+    """
+    Service method to import many products, creating new ones and overwriting existing ones by code.
+
+    Rows are validated with `CreateProductDto` one at a time as they are read. Valid rows are buffered and
+    written with one bulk upsert every `chunk_size` rows, so memory usage is bounded by the chunk size rather
+    than by the size of the import. Invalid rows and rows whose write fails are reported individually and do
+    not stop the import.
+
+    Args:
+        rows (AsyncIterator[Union[dict, Exception]]): The rows to import. An exception in place of a row marks
+            a row that could not be parsed.
+        chunk_size (int): The number of valid rows written per bulk write.
+
+    Returns:
+        ProductImportResultDto: The number of rows received, inserted and updated, and the per-row errors.
+
+    Example:
+        result = await import_products_service(iter_request_rows(request), 1000)
+        print(result.inserted, len(result.errors))
+    """
+    result = ProductImportResultDto()
+    chunk: List[CreateProductDto] = []
+    chunk_rows: List[int] = []
+
+    async def flush():
+        written = await bulk_upsert_products_repo(chunk)
+        result.inserted += written.inserted
+        result.updated += written.updated
+        result.errors.extend(ProductImportErrorDto(row=chunk_rows[index], error=error) for index, error in written.errors.items())
+        chunk.clear()
+        chunk_rows.clear()
+
+    async for row in rows:
+        index = result.received
+        result.received += 1
+        try:
+            if isinstance(row, Exception):
+                raise row
+            chunk.append(CreateProductDto.model_validate(row))
+            chunk_rows.append(index)
+        except (ValidationError, ValueError) as e:
+            result.errors.append(ProductImportErrorDto(row=index, error=str(e)))
+            continue
+
+        if len(chunk) >= chunk_size:
+            await flush()
+
+    if chunk:
+        await flush()
+
+    return result
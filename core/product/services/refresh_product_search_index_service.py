@@ -0,0 +1,29 @@
+import asyncio
+import logging
+
+from core.product.repositories.load_product_search_index_repo import load_product_search_index_repo
+
+logger = logging.getLogger(__name__)
+
+
+async def refresh_product_search_index_service(interval_seconds: int):
+    """
+    Loads the product search index, then reloads it every `interval_seconds` until cancelled.
+
+    Reloading picks up products written by other workers. A failed load is logged and retried at the next
+    interval (or after a short delay, until the first load succeeds); searches fall back to the database until
+    then.
+
+    Args:
+        interval_seconds (int): The time between two reloads. 0 loads the index once.
+    """
+    while True:
+        try:
+            indexed = await load_product_search_index_repo()
+            logger.info("Loaded %d products into the search index", indexed)
+            if interval_seconds <= 0:
+                return
+            await asyncio.sleep(interval_seconds)
+        except Exception:
+            logger.exception("Loading the product search index failed")
+            await asyncio.sleep(interval_seconds if interval_seconds > 0 else 30)
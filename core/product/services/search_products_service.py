@@ -0,0 +1,21 @@
+from typing import List
+
+from core.product.dtos.product_dto import ProductDto
+from core.product.repositories.search_products_repo import search_products_repo
+
+
+async def search_products_service(query: str, limit: int) -> List[ProductDto]:
+    """
+    Service method to find products by a prefix of their code or name, for autocompletion.
+
+    Args:
+        query (str): The prefix typed by the user.
+        limit (int): The maximum number of products to return.
+
+    Returns:
+        List[ProductDto]: The matching products, best matches first.
+
+    Example:
+        products = await search_products_service("P00", 10)
+    """
+    return [ProductDto.from_raw(raw) for raw in await search_products_repo(query, limit)]
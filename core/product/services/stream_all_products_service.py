@@ -0,0 +1,25 @@
+from typing import AsyncIterator, Optional
+
+from core.product.dtos.product_dto import ProductDto
+from core.product.repositories.stream_all_products_repo import stream_all_products_repo
+
+
+async def stream_all_products_service(after: Optional[str] = None) -> AsyncIterator[bytes]:
+    """
+    Service method to stream all products as newline-delimited JSON (NDJSON).
+
+    Each product read from the repository cursor is serialized to one JSON line as soon as it arrives, so
+    the full catalog is never held in memory.
+
+    Args:
+        after (Optional[str]): If provided, only products with an id greater than `after` are streamed.
+
+    Yields:
+        bytes: One JSON-encoded `ProductDto` followed by a newline per product.
+
+    Example:
+        async for line in stream_all_products_service():
+            response.write(line)
+    """
+    async for raw in stream_all_products_repo(after):
+        yield ProductDto.from_raw(raw).model_dump_json().encode() + b"\n"
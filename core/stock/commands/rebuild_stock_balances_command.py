@@ -0,0 +1,75 @@
+import argparse
+from collections import defaultdict
+from typing import Dict
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from core.document.entities.document import Document
+from core.stock.entities.stock_balance import StockBalance
+from infrastructure.command import run_with_mongo
+from infrastructure.database import get_collection
+from infrastructure.settings import settings
+
+
+async def rebuild_stock_balances(batch_size: int = 1000) -> int:
+    """
+    Recomputes every stock balance from the full document history.
+
+    Documents are read in `_id` order, `batch_size` at a time and projected down to their concept and item
+    quantities, and their movements are netted per product in memory (one counter per product). The
+    balances are then overwritten, `batch_size` products per bulk write, and balances of products that no
+    longer have any movement are reset to 0.
+
+    Documents created while the rebuild runs may or may not be counted, so run it while document creation
+    is paused, e.g. after restoring a backup or changing `STOCK_INBOUND_CONCEPTS`/`STOCK_OUTBOUND_CONCEPTS`.
+
+    Args:
+        batch_size (int): The number of documents read, and balances written, per round trip. Defaults to 1000.
+
+    Returns:
+        int: The number of balances written.
+
+    Example:
+        python -m core.stock.commands.rebuild_stock_balances_command --batch-size 5000
+    """
+    documents = get_collection(Document)
+    balances = get_collection(StockBalance)
+
+    quantities: Dict[ObjectId, int] = defaultdict(int)
+    read = 0
+    last_id = None
+    while True:
+        query = {'_id': {'$gt': last_id}} if last_id is not None else {}
+        projection = {'concept': 1, 'items.product': 1, 'items.quantity': 1}
+        batch = await documents.find(query, projection).sort('_id', 1).limit(batch_size).to_list()
+        if not batch:
+            break
+        last_id = batch[-1]['_id']
+
+        for raw in batch:
+            sign = settings.stock_sign(raw['concept'])
+            if sign:
+                for item in raw['items']:
+                    product = item['product']
+                    quantities[product['id'] if isinstance(product, dict) else product] += sign * item['quantity']
+
+        read += len(batch)
+        print(f"Read {read} documents")
+
+    operations = [UpdateOne({'_id': product_id}, {'$set': {'quantity': quantity}}, upsert=True)
+                  for product_id, quantity in quantities.items()]
+    for start in range(0, len(operations), batch_size):
+        await balances.bulk_write(operations[start:start + batch_size], ordered=False)
+
+    await balances.update_many({'_id': {'$nin': list(quantities)}}, {'$set': {'quantity': 0}})
+    print(f"Rebuilt {len(operations)} stock balances")
+    return len(operations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the stock balances from the document history.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents read and balances written per batch.")
+    args = parser.parse_args()
+
+    run_with_mongo(lambda: rebuild_stock_balances(args.batch_size))
@@ -0,0 +1,13 @@
+import argparse
+
+from core.stock.services.take_stock_snapshot_service import take_stock_snapshot_service
+from infrastructure.command import run_with_mongo
+
+
+if __name__ == "__main__":
+    argparse.ArgumentParser(
+        description="Snapshot the stock on hand of every product whose stock moved since the last snapshot."
+    ).parse_args()
+
+    written = run_with_mongo(take_stock_snapshot_service)
+    print(f"Took {written} stock snapshots")
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class StockBalanceDto(BaseModel):
+    """
+    Data Transfer Object (DTO) for representing the stock on hand of a product.
+
+    Attributes:
+        product_id (str): The unique identifier of the product.
+        quantity (int): The stock on hand, which is negative if more was sold than purchased.
+        at (Optional[datetime]): The instant the stock was computed for, or None for the current stock.
+
+    Example:
+        stock_dto = StockBalanceDto(product_id="60b8fbd6b6a05a001f3db9d2", quantity=42)
+    """
+    product_id: str
+    quantity: int
+    at: Optional[datetime] = None
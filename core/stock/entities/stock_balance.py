@@ -0,0 +1,32 @@
+from mongoengine import Document, ObjectIdField, IntField
+
+
+class StockBalance(Document):
+    """
+    Represents the current stock on hand of a product.
+
+    Balances are maintained incrementally: every time a document is created, the quantities of its items are
+    added to (inbound concepts) or subtracted from (outbound concepts) the balances of their products with an
+    atomic `$inc`. The product id is the primary key, so reading a balance is a single `_id` lookup.
+
+    Attributes:
+        product (ObjectId): The id of the product, stored as the balance's `_id`.
+        quantity (int): The stock on hand, which is negative if more was sold than purchased.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the balances are stored.
+        db_alias (str): The alias of the database where the balance collection resides.
+
+    Example:
+        balance = await get_collection(StockBalance).find_one({"_id": product_id})
+        print(balance["quantity"])
+    """
+
+    meta = {
+        'collection': 'stock_balances',
+        'db_alias': 'inventory',
+        'auto_create_index': False
+    }
+
+    product = ObjectIdField(primary_key=True)
+    quantity = IntField(default=0)
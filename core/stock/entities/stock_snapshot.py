@@ -0,0 +1,39 @@
+from mongoengine import Document, ObjectIdField, IntField, DateTimeField
+
+
+class StockSnapshot(Document):
+    """
+    Represents the stock on hand of a product at a point in time.
+
+    Snapshots are taken periodically (see `take_stock_snapshot_repo`), and only for products whose stock moved
+    since the previous snapshot, so the latest snapshot of a product at or before any instant holds its
+    stock at that snapshot's time. The stock at an arbitrary instant is that snapshot plus the movements of
+    the documents created between the snapshot and the instant.
+
+    Attributes:
+        product (ObjectId): The id of the product.
+        at (datetime): The instant the snapshot describes; documents with a later datetime are not included.
+        quantity (int): The stock on hand of the product at `at`.
+
+    Meta:
+        collection (str): The name of the MongoDB collection where the snapshots are stored.
+        db_alias (str): The alias of the database where the snapshot collection resides.
+        indexes: `product` + `at` (descending), to find the latest snapshot of a product before an instant.
+
+    Example:
+        snapshot = StockSnapshot(product=product_id, at=datetime.now(timezone.utc), quantity=42)
+    """
+
+    meta = {
+        'collection': 'stock_snapshots',
+        'db_alias': 'inventory',
+        'auto_create_index': False,
+        'indexes': [
+            ('product', '-at'),
+            '-at',
+        ]
+    }
+
+    product = ObjectIdField(required=True)
+    at = DateTimeField(required=True)
+    quantity = IntField(required=True)
@@ -0,0 +1,38 @@
+from typing import List
+
+from infrastructure.settings import settings
+
+
+def stock_movements_pipeline(match: dict) -> List[dict]:
+    """
+    Builds an aggregation pipeline that nets the stock movements of the matching documents per product.
+
+    Only documents whose concept moves stock are considered. Each item contributes its quantity, positive for
+    inbound concepts and negative for outbound ones. If `match` filters on `items.product.id`, items of other
+    products in the same documents are discarded as well.
+
+    Args:
+        match (dict): The filter selecting the documents, e.g. a `datetime` range.
+
+    Returns:
+        List[dict]: A pipeline producing one `{"_id": <product id>, "quantity": <net movement>}` per product.
+
+    Example:
+        pipeline = stock_movements_pipeline({"datetime": {"$gt": start, "$lte": end}})
+        movements = await get_collection(Document).aggregate(pipeline)
+    """
+    inbound, outbound = sorted(settings.stock_inbound_concepts), sorted(settings.stock_outbound_concepts)
+    pipeline = [
+        {'$match': {**match, 'concept': {'$in': inbound + outbound}}},
+        {'$unwind': '$items'},
+    ]
+    if 'items.product.id' in match:
+        pipeline.append({'$match': {'items.product.id': match['items.product.id']}})
+    pipeline.append({'$group': {
+        '_id': '$items.product.id',
+        'quantity': {'$sum': {'$multiply': [
+            '$items.quantity',
+            {'$cond': [{'$in': ['$concept', inbound]}, 1, -1]},
+        ]}},
+    }})
+    return pipeline
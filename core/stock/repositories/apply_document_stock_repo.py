@@ -0,0 +1,39 @@
+from collections import defaultdict
+from typing import Dict, Iterable
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from core.document.entities.document import Document
+from core.stock.entities.stock_balance import StockBalance
+from infrastructure.database import get_collection
+from infrastructure.settings import settings
+
+
+async def apply_document_stock_repo(documents: Iterable[Document]):
+    """
+    Adds the stock movements of newly created documents to the stock balances of their products.
+
+    The quantities of all items are netted per product first (documents whose concept neither adds nor
+    removes stock are skipped), then every affected balance is incremented with an atomic, upserting `$inc`
+    in a single unordered bulk write, so concurrent document creations never lose updates.
+
+    Args:
+        documents (Iterable[Document]): The documents that were just inserted.
+
+    Example:
+        await apply_document_stock_repo([document])
+    """
+    deltas: Dict[ObjectId, int] = defaultdict(int)
+    for document in documents:
+        sign = settings.stock_sign(document.concept)
+        if sign:
+            for item in document.items:
+                deltas[item.product.id] += sign * item.quantity
+
+    operations = [
+        UpdateOne({'_id': product_id}, {'$inc': {'quantity': delta}}, upsert=True)
+        for product_id, delta in deltas.items() if delta
+    ]
+    if operations:
+        await get_collection(StockBalance).bulk_write(operations, ordered=False)
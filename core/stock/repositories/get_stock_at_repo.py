@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from core.document.entities.document import Document
+from core.stock.entities.stock_snapshot import StockSnapshot
+from core.stock.pipelines import stock_movements_pipeline
+from infrastructure.database import get_collection
+
+
+async def get_stock_at_repo(product_id: str, at: datetime) -> Optional[int]:
+    """
+    Computes the stock on hand of a product as of a past instant.
+
+    The latest snapshot of the product taken at or before `at` is loaded, and only the documents created
+    between that snapshot and `at` that contain the product are replayed, through the
+    `items.product.id` + `datetime` index. With periodic snapshots, the replay covers at most one snapshot
+    interval of the product's activity, however long the history is.
+
+    Args:
+        product_id (str): The unique identifier of the product.
+        at (datetime): The instant the stock is requested for.
+
+    Returns:
+        Optional[int]: The stock on hand at `at`, or None if `product_id` is not a valid id.
+
+    Example:
+        stock = await get_stock_at_repo("60b8fbd6b6a05a001f3db9d2", datetime(2024, 11, 20, tzinfo=timezone.utc))
+    """
+    if not ObjectId.is_valid(product_id):
+        return None
+    product = ObjectId(product_id)
+
+    snapshot = await get_collection(StockSnapshot).find_one(
+        {'product': product, 'at': {'$lte': at}},
+        sort=[('at', -1)],
+    )
+    window = {'$lte': at}
+    if snapshot is not None:
+        window['$gt'] = snapshot['at']
+
+    pipeline = stock_movements_pipeline({'items.product.id': product, 'datetime': window})
+    movements = await (await get_collection(Document).aggregate(pipeline)).to_list()
+
+    quantity = snapshot['quantity'] if snapshot is not None else 0
+    return quantity + sum(movement['quantity'] for movement in movements)
@@ -0,0 +1,28 @@
+from typing import Dict, Iterable
+
+from bson import ObjectId
+
+from core.stock.entities.stock_balance import StockBalance
+from infrastructure.database import get_collection
+
+
+async def get_stock_balances_repo(product_ids: Iterable[str]) -> Dict[str, int]:
+    """
+    Retrieves the stock on hand of many products with a single `_id` lookup.
+
+    Args:
+        product_ids (Iterable[str]): The ids of the products. Invalid ids are ignored.
+
+    Returns:
+        Dict[str, int]: The stock on hand of each product that has a balance. Products that never appeared in
+        a stock-moving document have no balance and are absent from the result.
+
+    Example:
+        balances = await get_stock_balances_repo(["60b8fbd6b6a05a001f3db9d2"])
+        print(balances.get("60b8fbd6b6a05a001f3db9d2", 0))
+    """
+    ids = [ObjectId(product_id) for product_id in dict.fromkeys(product_ids) if ObjectId.is_valid(product_id)]
+    if not ids:
+        return {}
+    cursor = get_collection(StockBalance).find({'_id': {'$in': ids}})
+    return {str(raw['_id']): raw['quantity'] async for raw in cursor}
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+
+from pymongo import UpdateOne
+
+from core.document.entities.document import Document
+from core.stock.entities.stock_snapshot import StockSnapshot
+from core.stock.pipelines import stock_movements_pipeline
+from infrastructure.database import get_collection
+
+
+async def take_stock_snapshot_repo(at: datetime) -> int:
+    """
+    Records the stock on hand at `at` of every product whose stock moved since the previous snapshot.
+
+    The movements of the documents created after the latest existing snapshot and up to `at` are netted per
+    product with one aggregation (served by the `datetime` index), added to each product's latest snapshot
+    taken at or before the one the window starts from, and written as new snapshots in one bulk write. The
+    work done is therefore proportional to the activity since the previous snapshot, not to the size of the
+    history. The first snapshot replays the whole history once.
+
+    Runs may overlap, e.g. when every worker schedules snapshots or `make stock_snapshot` runs alongside
+    them: the base of each product is never a snapshot newer than the start of the window, so a snapshot
+    written by a concurrent run is not added to again, and a snapshot that already exists for a product at
+    `at` is left as is.
+
+    Args:
+        at (datetime): The instant to snapshot. It should trail the current time slightly, so that documents
+            still being inserted with an earlier datetime are not missed.
+
+    Returns:
+        int: The number of snapshots written.
+
+    Example:
+        written = await take_stock_snapshot_repo(datetime.now(timezone.utc) - timedelta(minutes=1))
+    """
+    snapshots = get_collection(StockSnapshot)
+    # MongoDB stores milliseconds; truncating keeps `(product, at)` comparable with the stored snapshots.
+    at = at.replace(microsecond=at.microsecond // 1000 * 1000)
+
+    previous = await snapshots.find_one({}, {'at': 1}, sort=[('at', -1)])
+    window = {'$lte': at}
+    if previous is not None:
+        if previous['at'] >= at.astimezone(timezone.utc).replace(tzinfo=None):
+            return 0
+        window['$gt'] = previous['at']
+
+    movements = await (await get_collection(Document).aggregate(stock_movements_pipeline({'datetime': window}))).to_list()
+    product_ids = [movement['_id'] for movement in movements]
+    if not product_ids:
+        return 0
+
+    base = {}
+    if previous is not None:
+        latest = await (await snapshots.aggregate([
+            {'$match': {'product': {'$in': product_ids}, 'at': {'$lte': previous['at']}}},
+            {'$sort': {'product': 1, 'at': -1}},
+            {'$group': {'_id': '$product', 'quantity': {'$first': '$quantity'}}},
+        ])).to_list()
+        base = {raw['_id']: raw['quantity'] for raw in latest}
+
+    result = await snapshots.bulk_write([
+        UpdateOne(
+            {'product': movement['_id'], 'at': at},
+            {'$setOnInsert': {'quantity': base.get(movement['_id'], 0) + movement['quantity']}},
+            upsert=True,
+        )
+        for movement in movements
+    ], ordered=False)
+    return result.upserted_count
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+from core.product.repositories.get_product_by_id_repo import get_product_by_id_repo
+from core.stock.dtos.stock_balance_dto import StockBalanceDto
+from core.stock.repositories.get_stock_at_repo import get_stock_at_repo
+from core.stock.repositories.get_stock_balances_repo import get_stock_balances_repo
+
+
+async def get_product_stock_service(product_id: str, at: Optional[datetime] = None) -> Optional[StockBalanceDto]:
+    """
+    Service method to retrieve the stock on hand of a product, now or as of a past instant.
+
+    The current stock is read from the product's balance with a single lookup. The stock as of `at` is
+    computed from the product's latest snapshot before `at` plus the documents created in between. When the
+    product has no balance, or no stock as of `at`, the product itself is looked up (usually from the
+    product cache), to tell a product without movements (stock 0) apart from a product that does not exist.
+
+    Args:
+        product_id (str): The unique identifier of the product.
+        at (Optional[datetime]): The instant to compute the stock for, or None for the current stock.
+
+    Returns:
+        Optional[StockBalanceDto]: The stock on hand of the product, or None if the product does not exist.
+
+    Example:
+        stock = await get_product_stock_service("60b8fbd6b6a05a001f3db9d2")
+        last_year = await get_product_stock_service("60b8fbd6b6a05a001f3db9d2", datetime(2024, 1, 1, tzinfo=timezone.utc))
+    """
+    if at is None:
+        quantity = (await get_stock_balances_repo([product_id])).get(product_id)
+    else:
+        quantity = await get_stock_at_repo(product_id, at)
+
+    if not quantity and await get_product_by_id_repo(product_id) is None:
+        return None
+    return StockBalanceDto(product_id=product_id, quantity=quantity or 0, at=at)
@@ -0,0 +1,25 @@
+from typing import List
+
+from core.stock.dtos.stock_balance_dto import StockBalanceDto
+from core.stock.repositories.get_stock_balances_repo import get_stock_balances_repo
+
+
+async def get_products_stock_service(product_ids: List[str]) -> List[StockBalanceDto]:
+    """
+    Service method to retrieve the stock on hand of many products with a single query.
+
+    Products without a balance, including ids that do not belong to any product, are reported with a stock
+    of 0.
+
+    Args:
+        product_ids (List[str]): The unique identifiers of the products.
+
+    Returns:
+        List[StockBalanceDto]: The stock on hand of each requested product, in request order, without duplicates.
+
+    Example:
+        stock = await get_products_stock_service(["60b8fbd6b6a05a001f3db9d2", "60b8fbd6b6a05a001f3db9d3"])
+    """
+    unique_ids = list(dict.fromkeys(product_ids))
+    balances = await get_stock_balances_repo(unique_ids)
+    return [StockBalanceDto(product_id=product_id, quantity=balances.get(product_id, 0)) for product_id in unique_ids]
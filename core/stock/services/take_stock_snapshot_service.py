@@ -0,0 +1,41 @@
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+
+from core.stock.repositories.take_stock_snapshot_repo import take_stock_snapshot_repo
+from infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def take_stock_snapshot_service() -> int:
+    """
+    Snapshots the stock on hand as of `settings.stock_snapshot_delay_seconds` ago.
+
+    Returns:
+        int: The number of product snapshots written.
+
+    Example:
+        written = await take_stock_snapshot_service()
+    """
+    at = datetime.now(timezone.utc) - timedelta(seconds=settings.stock_snapshot_delay_seconds)
+    return await take_stock_snapshot_repo(at)
+
+
+async def schedule_stock_snapshots_service(interval_seconds: int):
+    """
+    Takes a stock snapshot every `interval_seconds`, until cancelled.
+
+    A failed snapshot is logged and retried at the next interval; since each snapshot covers everything since
+    the previous successful one, no movement is skipped.
+
+    Args:
+        interval_seconds (int): The time between two snapshots.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            written = await take_stock_snapshot_service()
+            logger.info("Took %d stock snapshots", written)
+        except Exception:
+            logger.exception("Taking stock snapshots failed")
@@ -1,8 +1,138 @@
 import importlib
+import inspect
+import json
+import logging
 import pkgutil
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from fastapi import APIRouter
+
+from infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def discover_endpoint_modules(package_name: str) -> List[str]:
+    """
+    Lists the modules of a package, without importing them, in the order `pkgutil` finds them.
+
+    Example:
+        discover_endpoint_modules("core.product.endpoints")  # Output: ["core.product.endpoints.create_product_endpoint", ...]
+    """
+    package = importlib.import_module(package_name)
+    return [f"{package_name}.{module_name}" for _, module_name, _ in pkgutil.iter_modules(package.__path__)]
+
+
+def build_endpoint_manifest(package_names: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Builds the endpoint manifest of the given packages: the modules each of them registers endpoints from.
+    """
+    return {package_name: discover_endpoint_modules(package_name) for package_name in package_names}
+
+
+@lru_cache(maxsize=1)
+def load_endpoint_manifest() -> Optional[Dict[str, List[str]]]:
+    """
+    Reads the endpoint manifest at `ENDPOINT_MANIFEST_PATH`, or returns None if it does not exist.
+    """
+    path = PROJECT_ROOT / settings.endpoint_manifest_path
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _endpoint_modules(package_name: str) -> List[str]:
+    mode = settings.endpoint_discovery
+    if mode == "auto":
+        mode = "discovery" if settings.debug else "manifest"
+
+    if mode == "manifest":
+        manifest = load_endpoint_manifest()
+        if manifest is not None and package_name in manifest:
+            return manifest[package_name]
+        if settings.endpoint_discovery == "manifest":
+            raise RuntimeError(f"{package_name} is not listed in {settings.endpoint_manifest_path}")
+        logger.warning("%s is not listed in the endpoint manifest, discovering its modules", package_name)
+
+    return discover_endpoint_modules(package_name)
 
 
 def auto_import_endpoints(package_name: str):
-    for _, module_name, _ in pkgutil.iter_modules(importlib.import_module(package_name).__path__):
-        full_module_name = f"{package_name}.{module_name}"
-        importlib.import_module(full_module_name)
+    """
+    Imports every endpoint module of a package, so that their route decorators register them on the router.
+
+    The modules are read from the checked-in endpoint manifest (see `python -m core.endpoints_manifest`),
+    which avoids walking the package on every worker start. With `ENDPOINT_DISCOVERY=discovery`, or in debug
+    mode, the package is walked with `pkgutil` instead, so new endpoint modules are picked up without
+    regenerating the manifest. A package missing from the manifest is also discovered, with a warning,
+    unless `ENDPOINT_DISCOVERY=manifest`.
+
+    Args:
+        package_name (str): The endpoints package, e.g. "core.product.endpoints".
+
+    Raises:
+        RuntimeError: With `ENDPOINT_DISCOVERY=manifest`, if the package is not listed in the manifest.
+    """
+    for module_name in _endpoint_modules(package_name):
+        importlib.import_module(module_name)
+
+
+def prioritize_static_routes(router: APIRouter):
+    """
+    Reorders a router's routes so that routes with fewer path parameters are matched first.
+
+    Endpoint modules are imported in alphabetical order, so without this a route such as
+    `GET /product/{product_id}` could be registered before `GET /product/stock` and capture its requests.
+    The sort is stable, so routes with the same number of parameters keep their registration order.
+    """
+    router.routes.sort(key=lambda route: getattr(route, "path", "").count("{"))
+
+
+def wrap_package_functions(package_name: str, layer: str, suffix: str, decorator: Callable[[Callable], Callable]):
+    """
+    Applies `decorator` to every function ending in `suffix` defined in the `layer` packages under
+    `package_name`, without modifying the modules that define them.
+
+    Every module of each layer package (e.g. `core.product.repositories`) is imported, each of its matching
+    functions is decorated once, and every already imported module of `package_name` that holds a reference
+    to the original function (callers import them with `from ... import ...`) is rebound to the decorated
+    one. It should therefore be called once the application has been assembled, e.g. after the routers have
+    been included, so every caller is already imported. Functions already decorated by the same decorator
+    are skipped, so calling it twice is harmless, and different decorators can be stacked.
+
+    Args:
+        package_name (str): The root package, e.g. "core".
+        layer (str): The name of the layer packages, e.g. "repositories".
+        suffix (str): The suffix of the functions to decorate, e.g. "_repo".
+        decorator (Callable[[Callable], Callable]): The decorator to apply.
+
+    Example:
+        wrap_package_functions("core", "repositories", "_repo", timed_repository)
+    """
+    package = importlib.import_module(package_name)
+    for module_info in pkgutil.walk_packages(package.__path__, f"{package_name}."):
+        if f".{layer}." in module_info.name:
+            importlib.import_module(module_info.name)
+
+    marker = f"__wrapped_by_{decorator.__module__}_{decorator.__name__}__".replace(".", "_")
+    wrappers = {}
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith(f"{package_name}.") or f".{layer}." not in module_name:
+            continue
+        for attribute, value in vars(module).items():
+            if (attribute.endswith(suffix) and inspect.isfunction(value) and value.__module__ == module_name
+                    and not getattr(value, marker, False)):
+                wrappers[value] = decorator(value)
+                setattr(wrappers[value], marker, True)
+
+    for module_name, module in list(sys.modules.items()):
+        if module_name != package_name and not module_name.startswith(f"{package_name}."):
+            continue
+        for attribute, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value in wrappers:
+                setattr(module, attribute, wrappers[value])
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from infrastructure.database import connect_to_mongo, close_mongo_connection
+
+T = TypeVar("T")
+
+
+def run_with_mongo(command: Callable[[], Awaitable[T]]) -> T:
+    """
+    Runs an asynchronous command-line task with the MongoDB client connected.
+
+    The client is created before `command` is awaited and closed afterwards, even if the command fails,
+    mirroring what `lifespan` does for the web application.
+
+    Args:
+        command (Callable[[], Awaitable[T]]): A function returning the coroutine to run.
+
+    Returns:
+        T: The value returned by the command.
+
+    Example:
+        run_with_mongo(lambda: backfill_product_snapshots(500))
+    """
+    async def main() -> T:
+        connect_to_mongo()
+        try:
+            return await command()
+        finally:
+            await close_mongo_connection()
+
+    return asyncio.run(main())
@@ -0,0 +1,136 @@
+import asyncio
+import contextvars
+from typing import Awaitable, Callable, Generic, List, NamedTuple, Optional, Set, TypeVar
+
+from infrastructure.metrics import Counter, Histogram
+from infrastructure.query_counter import QueryCounter, get_query_counter, track_queries
+from infrastructure.tracing import Span, get_current_span, start_span
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+group_commit_batch_size = Histogram(
+    "group_commit_batch_size", "Items written per group commit flush.", ("stage",),
+    (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000),
+)
+group_commit_batch_fill_ratio = Histogram(
+    "group_commit_batch_fill_ratio", "Items per group commit flush relative to the maximum batch size.", ("stage",),
+    (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+group_commit_flushes_total = Counter(
+    "group_commit_flushes_total", "Group commit flushes, by what triggered them (a full batch or the window).",
+    ("stage", "trigger"),
+)
+
+
+class _Submission(NamedTuple):
+    item: object
+    future: asyncio.Future
+    counter: Optional[QueryCounter]
+    span: Optional[Span]
+
+
+class GroupCommit(Generic[T, R]):
+    """
+    Collects items submitted concurrently and writes them together, resolving each submitter individually.
+
+    The first item submitted to an empty queue opens a window of `window_seconds`; every item submitted
+    during the window joins the same batch. The batch is flushed when the window closes or as soon as
+    `max_batch_size` items are queued, whichever comes first, by calling `flush` once with all the items.
+    `flush` must return one result per item, in order, and each `submit` call returns its own result. If
+    `flush` raises, every submitter of the batch receives the exception.
+
+    The trade-off is latency for throughput: each write waits up to one window, but under load hundreds of
+    writes cost a single round trip. Flushes run as separate tasks, so several batches may be in flight.
+    Batch sizes and fill ratios are recorded in the `group_commit_*` metrics.
+
+    A flush belongs to every submitter of its batch, not to the one that happened to open it, so it runs in
+    a fresh context: its commands are tracked by its own `QueryCounter` and traced under its own
+    `group_commit <name>` span. Once it is done, its commands are added to the query counter of every
+    submitter, and the current span of every submitter gets the flush's trace id as its
+    `group_commit.trace_id` attribute.
+
+    Args:
+        name (str): The name of the stage, used as the `stage` label of the metrics.
+        flush (Callable[[List[T]], Awaitable[List[R]]]): Writes a batch and returns one result per item.
+        window_seconds (float): How long the first item of a batch waits for others to join it.
+        max_batch_size (int): The number of queued items that triggers a flush before the window closes.
+
+    Example:
+        stage = GroupCommit("documents", create_documents_repo, window_seconds=0.005, max_batch_size=100)
+        result = await stage.submit({"reference": "INV-1", "concept": "sale", "items": items})
+    """
+
+    def __init__(self, name: str, flush: Callable[[List[T]], Awaitable[List[R]]], window_seconds: float,
+                 max_batch_size: int):
+        self.name = name
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._flush_batch = flush
+        self._pending: List[_Submission] = []
+        self._timer = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether batching is configured at all. Callers should write directly when it is not.
+        """
+        return self.window_seconds > 0 and self.max_batch_size > 1
+
+    async def submit(self, item: T) -> R:
+        """
+        Queues an item for the next flush and waits for its result.
+
+        Raises:
+            Exception: Whatever `flush` raised for the batch the item was written in.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_Submission(item, future, get_query_counter(), get_current_span()))
+        if len(self._pending) >= self.max_batch_size:
+            self._start_flush("size")
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._start_flush, "window")
+        return await future
+
+    def _start_flush(self, trigger: str):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._flush(batch, trigger), context=contextvars.Context())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: List[_Submission], trigger: str):
+        group_commit_flushes_total.inc(self.name, trigger)
+        group_commit_batch_size.observe(len(batch), self.name)
+        group_commit_batch_fill_ratio.observe(len(batch) / self.max_batch_size, self.name)
+        attributes = {"group_commit.batch_size": len(batch), "group_commit.trigger": trigger}
+        with start_span(f"group_commit {self.name}", attributes=attributes) as span, \
+                track_queries(f"group commit {self.name}") as counter:
+            results, error = [], None
+            try:
+                results = await self._flush_batch([submission.item for submission in batch])
+            except Exception as e:
+                span.record_exception(e)
+                error = e
+
+        for submission in batch:
+            if submission.counter is not None:
+                submission.counter.count += counter.count
+                submission.counter.duration_ms += counter.duration_ms
+            if submission.span is not None:
+                submission.span.set_attribute("group_commit.trace_id", span.trace_id)
+
+        if error is not None:
+            for submission in batch:
+                if not submission.future.done():
+                    submission.future.set_exception(error)
+            return
+        for submission, result in zip(batch, results):
+            if not submission.future.done():
+                submission.future.set_result(result)
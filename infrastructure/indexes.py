@@ -0,0 +1,116 @@
+import logging
+from typing import Iterable, List, NamedTuple, Optional, Type
+
+from mongoengine import Document
+from pymongo import IndexModel
+
+from infrastructure.database import get_collection
+
+logger = logging.getLogger(__name__)
+
+
+class HotQuery(NamedTuple):
+    """
+    A query shape the application runs on a hot path, and which therefore must be served by an index.
+
+    Attributes:
+        name (str): A human readable name used in error messages.
+        entity (Type[Document]): The entity whose collection the query runs against.
+        filter (dict): A representative filter; only its shape matters to the query planner.
+        sort (Optional[list]): The sort specification of the query, if any.
+    """
+    name: str
+    entity: Type[Document]
+    filter: dict
+    sort: Optional[list] = None
+
+
+class CollectionScanError(RuntimeError):
+    """
+    Raised when one or more hot queries would be executed with a full collection scan.
+    """
+
+
+def index_models(entity: Type[Document]) -> List[IndexModel]:
+    """
+    Builds the `IndexModel`s declared by a mongoengine entity (its `meta['indexes']` and `unique` fields).
+
+    Args:
+        entity (Type[Document]): The entity class, e.g. `Product`.
+
+    Returns:
+        List[IndexModel]: One model per declared index.
+    """
+    models = []
+    for spec in entity._meta.get('index_specs') or []:
+        options = {key: value for key, value in spec.items() if key != 'fields'}
+        models.append(IndexModel(spec['fields'], background=True, **options))
+    return models
+
+
+async def ensure_indexes(entities: Iterable[Type[Document]]):
+    """
+    Creates every index declared by the given entities.
+
+    Creating an index that already exists with the same options is a no-op, so this function is idempotent
+    and safe to run on every startup. Indexes are built with `background=True` so that servers older than
+    MongoDB 4.2 do not lock the collection while building.
+
+    Args:
+        entities (Iterable[Type[Document]]): The entity classes whose indexes should exist.
+
+    Raises:
+        pymongo.errors.OperationFailure: If an index cannot be built, e.g. a unique index over duplicated data.
+
+    Example:
+        await ensure_indexes([Product, Document, Counter])
+    """
+    for entity in entities:
+        models = index_models(entity)
+        if models:
+            names = await get_collection(entity).create_indexes(models)
+            logger.info("Ensured indexes on %s: %s", entity._get_collection_name(), ", ".join(names))
+
+
+def _uses_collection_scan(plan) -> bool:
+    if isinstance(plan, dict):
+        return plan.get('stage') == 'COLLSCAN' or any(_uses_collection_scan(value) for value in plan.values())
+    if isinstance(plan, list):
+        return any(_uses_collection_scan(value) for value in plan)
+    return False
+
+
+async def find_collection_scans(hot_queries: Iterable[HotQuery]) -> List[str]:
+    """
+    Asks the query planner how each hot query would be executed and returns those planned as a COLLSCAN.
+
+    Args:
+        hot_queries (Iterable[HotQuery]): The queries to explain.
+
+    Returns:
+        List[str]: The names of the queries whose winning plan contains a COLLSCAN stage.
+    """
+    scans = []
+    for query in hot_queries:
+        cursor = get_collection(query.entity).find(query.filter).limit(1)
+        if query.sort:
+            cursor = cursor.sort(query.sort)
+        explanation = await cursor.explain()
+        if _uses_collection_scan(explanation['queryPlanner']['winningPlan']):
+            scans.append(query.name)
+    return scans
+
+
+async def check_query_plans(hot_queries: Iterable[HotQuery]):
+    """
+    Fails loudly if any hot query would be executed with a full collection scan.
+
+    Raises:
+        CollectionScanError: If at least one hot query is planned as a COLLSCAN. The message lists them all.
+
+    Example:
+        await check_query_plans(HOT_QUERIES)
+    """
+    scans = await find_collection_scans(hot_queries)
+    if scans:
+        raise CollectionScanError(f"Queries planned as a collection scan: {', '.join(scans)}")
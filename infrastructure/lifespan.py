@@ -1,9 +1,27 @@
+import asyncio
+import logging
 from contextlib import asynccontextmanager
 
-import mongoengine as me
 from fastapi import FastAPI
 
-from infrastructure.database import connect_to_mongo
+from core.indexes import build_indexes
+from core.product.services.refresh_product_search_index_service import refresh_product_search_index_service
+from core.stock.services.take_stock_snapshot_service import schedule_stock_snapshots_service
+from infrastructure.database import connect_to_mongo, close_mongo_connection
+from infrastructure.settings import settings
+from infrastructure.shared_cache import close_shared_cache, connect_shared_cache, listen_for_invalidations
+from infrastructure.tracing import configure_tracing
+
+logger = logging.getLogger(__name__)
+
+INDEX_BUILD_MODES = ("background", "blocking", "off")
+
+
+async def _build_indexes_in_background():
+    try:
+        await build_indexes(check=settings.index_check_query_plans)
+    except Exception:
+        logger.critical("Building indexes or checking hot query plans failed", exc_info=True)
 
 
 @asynccontextmanager
@@ -11,8 +29,16 @@ async def lifespan(_app: FastAPI):
     """
     Context manager that manages the lifecycle of the MongoDB connection in a FastAPI application.
 
-    This function is used as the `lifespan` parameter in the FastAPI application, ensuring that the MongoDB
-    connection is established when the application starts and disconnected when the application shuts down.
+    This function is used as the `lifespan` parameter in the FastAPI application, ensuring that the
+    asynchronous MongoDB client (and its connection pool) is created when the application starts and
+    closed when the application shuts down. Depending on `settings.index_build_mode`, the declared indexes
+    are built in the background while the application starts serving, built before serving (failing
+    startup if a hot query would need a collection scan), or not built at all. If
+    `settings.stock_snapshot_interval_seconds` is set, stock snapshots are taken periodically in the background.
+    If `settings.product_search_index_enabled` is set, the product search index is loaded (and periodically
+    reloaded) in the background. If a shared cache backend is configured, it is connected, and the
+    invalidations published by the other workers are applied to the in-process caches in the background.
+    If tracing is enabled, finished spans are exported in the background and flushed on shutdown.
 
     Args:
         _app (FastAPI): The FastAPI application instance. This is passed automatically by FastAPI when
@@ -23,12 +49,47 @@ async def lifespan(_app: FastAPI):
               the lifespan of the FastAPI app.
 
     Raises:
-        mongoengine.errors.ConnectionError: If the connection to MongoDB fails during startup.
+        pymongo.errors.ConfigurationError: If the MongoDB settings are invalid.
+        RuntimeError: If the Redis shared cache is configured but the `redis` package is not installed.
+        CollectionScanError: In `blocking` index build mode, if a hot query is planned as a COLLSCAN.
+        ValueError: If `INDEX_BUILD_MODE` is not `background`, `blocking` or `off`.
 
     Example:
         app = FastAPI(lifespan=lifespan)
         # This sets up the MongoDB connection at the start and closes it when the app shuts down.
     """
+    if settings.index_build_mode not in INDEX_BUILD_MODES:
+        raise ValueError(f"Unknown index build mode: {settings.index_build_mode}")
+
     connect_to_mongo()
+
+    background_tasks = []
+    if connect_shared_cache() is not None:
+        background_tasks.append(asyncio.create_task(listen_for_invalidations()))
+    span_processor = configure_tracing()
+    if span_processor is not None:
+        background_tasks.append(asyncio.create_task(span_processor.run()))
+
+    if settings.index_build_mode == "blocking":
+        await build_indexes(check=settings.index_check_query_plans)
+    elif settings.index_build_mode == "background":
+        background_tasks.append(asyncio.create_task(_build_indexes_in_background()))
+
+    if settings.product_search_index_enabled:
+        background_tasks.append(asyncio.create_task(
+            refresh_product_search_index_service(settings.product_search_index_refresh_seconds)
+        ))
+
+    if settings.stock_snapshot_interval_seconds > 0:
+        background_tasks.append(asyncio.create_task(
+            schedule_stock_snapshots_service(settings.stock_snapshot_interval_seconds)
+        ))
+
     yield
-    me.disconnect(alias="inventory")
+
+    for task in background_tasks:
+        task.cancel()
+    if span_processor is not None:
+        await span_processor.shutdown()
+    await close_shared_cache()
+    await close_mongo_connection()
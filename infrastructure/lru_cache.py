@@ -0,0 +1,127 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LruCache:
+    """
+    In-process cache with least-recently-used eviction and an optional time-to-live.
+
+    The cache can be bounded by number of entries, by approximate size in bytes, or both. The size of each
+    value is estimated with the `sizeof` function given at construction time, so callers decide what
+    "approximate bytes" means for the values they store (e.g. their encoded BSON length). When an insertion
+    exceeds either bound, the least recently used entries are evicted until the cache fits again.
+
+    The cache is not thread-safe; it is meant to be used from a single asyncio event loop, where no other
+    coroutine can run in the middle of a method call.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that found no (fresh) entry.
+        evictions (int): Number of entries dropped to respect the size bounds.
+        expirations (int): Number of entries dropped because their time-to-live elapsed.
+
+    Example:
+        cache = LruCache(max_entries=1000, ttl_seconds=60)
+        cache.set("P001", {"code": "P001"})
+        cache.get("P001")  # Output: {"code": "P001"}
+    """
+
+    def __init__(
+            self,
+            max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            ttl_seconds: Optional[float] = None,
+            sizeof: Callable[[Any], int] = lambda value: 1,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether the cache can hold any entry at all. A cache bounded to zero entries or bytes is disabled.
+        """
+        return self.max_entries != 0 and self.max_bytes != 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value cached under `key` and marks it as most recently used, or None if it is missing
+        or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, size, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        """
+        Caches `value` under `key`, replacing any previous value, and evicts entries if a bound is exceeded.
+        """
+        if not self.enabled:
+            return
+
+        self._remove(key)
+        size = self._sizeof(value)
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        self._entries[key] = (value, size, expires_at)
+        self._bytes += size
+
+        while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def delete(self, key: Hashable):
+        """
+        Removes the entry cached under `key`, if any.
+        """
+        self._remove(key)
+
+    def clear(self):
+        """
+        Removes every entry from the cache. The counters are kept.
+        """
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters together with its current and maximum size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
@@ -0,0 +1,256 @@
+import functools
+import inspect
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import aclosing
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from fastapi import Response
+
+from infrastructure.auto_import import wrap_package_functions
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+REPOSITORY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        _registry.append(self)
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self._samples()]
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """
+        Returns the exposition lines of the metric's values, without the HELP and TYPE lines.
+        """
+
+
+class Counter(_Metric):
+    """
+    A monotonically increasing value per combination of label values, e.g. the number of requests served.
+
+    Example:
+        requests = Counter("http_requests_total", "HTTP requests served.", ("method",))
+        requests.inc("GET")
+    """
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1):
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {_format_number(value)}"
+                for labels, value in self._values.items()]
+
+
+class Gauge(Counter):
+    """
+    A value that can go up and down per combination of label values, e.g. the number of requests in flight.
+    """
+    kind = "gauge"
+
+    def dec(self, *label_values: str, amount: float = 1):
+        self.inc(*label_values, amount=-amount)
+
+
+class Histogram(_Metric):
+    """
+    Counts observations (e.g. durations in seconds) in cumulative buckets, per combination of label values.
+
+    Observing a value costs a binary search over the bucket bounds and three additions, so histograms can be
+    updated on every request without measurable overhead.
+
+    Example:
+        latency = Histogram("job_duration_seconds", "Job duration.", ("job",))
+        latency.observe(0.042, "import")
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *label_values: str):
+        entry = self._values.get(label_values)
+        if entry is None:
+            entry = self._values[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def _samples(self) -> List[str]:
+        samples = []
+        for labels, (counts, total, count) in self._values.items():
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels((*self.label_names, "le"), (*labels, _format_number(bound)))
+                samples.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            samples.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {_format_number(total)}")
+            samples.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {count}")
+        return samples
+
+
+_registry: List[_Metric] = []
+
+http_requests_total = Counter(
+    "http_requests_total", "HTTP requests served, by method, route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds", "Time spent serving HTTP requests, by method and route template.",
+    ("method", "route"),
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress", "HTTP requests currently being served, by method.", ("method",),
+)
+repository_duration_seconds = Histogram(
+    "repository_duration_seconds", "Time spent in each repository function, including database round trips.",
+    ("repository",), REPOSITORY_BUCKETS,
+)
+repository_errors_total = Counter(
+    "repository_errors_total", "Repository calls that raised an exception, by repository function.", ("repository",),
+)
+
+
+def render_metrics() -> str:
+    """
+    Renders every registered metric in the Prometheus text exposition format (version 0.0.4).
+    """
+    return "\n".join(line for metric in _registry for line in metric.render()) + "\n"
+
+
+async def metrics_endpoint() -> Response:
+    """
+    Endpoint serving the metrics of this worker in the Prometheus text format.
+
+    Each worker process keeps its own metrics, so with several workers every scrape describes only the worker
+    that served it; Prometheus aggregates them when the workers are scraped as separate targets.
+
+    Example:
+        app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+    """
+    return Response(render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+async def metrics_middleware(request, call_next):
+    """
+    HTTP middleware that counts and times every request by method, route template and status code.
+
+    Requests are labelled with the path template of the route that served them (e.g.
+    `/product/{product_id}`) rather than the actual path, so the number of label combinations stays bounded.
+    Requests that match no route are labelled `unmatched`.
+
+    Example:
+        app.middleware("http")(metrics_middleware)
+    """
+    method = request.method
+    http_requests_in_progress.inc(method)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        http_request_duration_seconds.observe(time.perf_counter() - start, method, route)
+        http_requests_total.inc(method, route, str(status))
+        http_requests_in_progress.dec(method)
+
+
+def timed_repository(function: Callable) -> Callable:
+    """
+    Decorator that records the duration (and failures) of a repository function in
+    `repository_duration_seconds` and `repository_errors_total`, labelled with the function name.
+
+    Coroutine functions are timed until they return, async generator functions until they are exhausted or
+    closed, and plain functions until they return.
+
+    Example:
+        get_product_by_id_repo = timed_repository(get_product_by_id_repo)
+    """
+    name = function.__name__
+
+    if inspect.isasyncgenfunction(function):
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                async with aclosing(function(*args, **kwargs)) as items:
+                    async for item in items:
+                        yield item
+            except Exception:
+                repository_errors_total.inc(name)
+                raise
+            finally:
+                repository_duration_seconds.observe(time.perf_counter() - start, name)
+
+    elif inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await function(*args, **kwargs)
+            except Exception:
+                repository_errors_total.inc(name)
+                raise
+            finally:
+                repository_duration_seconds.observe(time.perf_counter() - start, name)
+
+    else:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            except Exception:
+                repository_errors_total.inc(name)
+                raise
+            finally:
+                repository_duration_seconds.observe(time.perf_counter() - start, name)
+
+    return wrapper
+
+
+def instrument_repositories(package_name: str):
+    """
+    Applies `timed_repository` to every `*_repo` function of the `repositories` packages under `package_name`
+    (see `wrap_package_functions`). Call it once the application has been assembled.
+
+    Example:
+        instrument_repositories("core")
+    """
+    wrap_package_functions(package_name, "repositories", "_repo", timed_repository)
@@ -0,0 +1,149 @@
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Any, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+
+def normalize_term(text: str) -> str:
+    """
+    Normalizes text for prefix matching: accents are removed, case is folded and whitespace is collapsed.
+
+    Example:
+        normalize_term("  Café   Crème ")  # Output: "cafe creme"
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(character for character in decomposed if not unicodedata.combining(character))
+    return " ".join(stripped.casefold().split())
+
+
+class PrefixIndex:
+    """
+    In-process index answering "which entries have a term starting with this prefix" in logarithmic time.
+
+    Each entry has a value (returned by `search`) and, for each of the index's fields, a list of terms. Every
+    field is kept as a sorted array of `(term, key)` pairs, so the entries matching a prefix are contiguous
+    and found with a binary search; collecting the top `limit` matches only walks those `limit` pairs (plus
+    duplicates), whatever the size of the index. Fields are searched in the order they were declared, so
+    matches on earlier fields rank first; within a field, terms rank alphabetically (so an exact match ranks
+    before the longer terms it is a prefix of).
+
+    Adding or removing a single entry shifts the arrays (a memory move, fast even for hundreds of thousands of
+    terms); `build` creates an index from many entries at once with a single sort per field. Terms are
+    normalized with `normalize_term`, as are search queries.
+
+    The index is not thread-safe; like `LruCache`, it is meant to be used from a single asyncio event loop.
+
+    Args:
+        fields (Sequence[str]): The names of the fields, in ranking order.
+
+    Attributes:
+        loaded (bool): Whether the index has been filled with `replace_with`, i.e. holds a complete data set.
+
+    Example:
+        index = PrefixIndex(("code", "name"))
+        index.put("1", {"code": ["P001"], "name": ["Blue Pen"]}, {"code": "P001"})
+        index.search("p0", 10)  # Output: [{"code": "P001"}]
+    """
+
+    def __init__(self, fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self._arrays: Dict[str, List[Tuple[str, Hashable]]] = {field: [] for field in self.fields}
+        self._terms: Dict[Hashable, Dict[str, List[str]]] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _normalized_terms(self, terms: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+        return {
+            field: list(dict.fromkeys(filter(None, (normalize_term(term) for term in terms.get(field, ())))))
+            for field in self.fields
+        }
+
+    def put(self, key: Hashable, terms: Dict[str, Iterable[str]], value: Any):
+        """
+        Adds an entry, or replaces the terms and value of an existing one.
+
+        Args:
+            key (Hashable): The identity of the entry, e.g. a product id.
+            terms (Dict[str, Iterable[str]]): The terms of the entry for each field. Missing fields have none.
+            value (Any): What `search` returns for the entry.
+        """
+        self.remove(key)
+        normalized = self._normalized_terms(terms)
+        for field, field_terms in normalized.items():
+            for term in field_terms:
+                insort(self._arrays[field], (term, key))
+        self._terms[key] = normalized
+        self._values[key] = value
+
+    def remove(self, key: Hashable):
+        """
+        Removes an entry, if present.
+        """
+        normalized = self._terms.pop(key, None)
+        if normalized is None:
+            return
+        self._values.pop(key, None)
+        for field, field_terms in normalized.items():
+            array = self._arrays[field]
+            for term in field_terms:
+                position = bisect_left(array, (term, key))
+                if position < len(array) and array[position] == (term, key):
+                    del array[position]
+
+    @classmethod
+    def build(cls, fields: Sequence[str], entries: Iterable[Tuple[Hashable, Dict[str, Iterable[str]], Any]]) -> "PrefixIndex":
+        """
+        Builds a new index from many `(key, terms, value)` entries, with a single sort per field.
+
+        Building does not touch any other index, so it can run in a worker thread (`asyncio.to_thread`) to
+        keep a large build off the event loop; the result is then swapped in with `replace_with`.
+        """
+        index = cls(fields)
+        for key, terms, value in entries:
+            normalized = index._normalized_terms(terms)
+            for field, field_terms in normalized.items():
+                index._arrays[field].extend((term, key) for term in field_terms)
+            index._terms[key] = normalized
+            index._values[key] = value
+        for array in index._arrays.values():
+            array.sort()
+        return index
+
+    def replace_with(self, other: "PrefixIndex"):
+        """
+        Replaces the content of this index with the content of `other`, e.g. one returned by `build`.
+        """
+        self._arrays, self._terms, self._values = other._arrays, other._terms, other._values
+        self.loaded = True
+
+    def search(self, query: str, limit: int) -> List[Any]:
+        """
+        Returns the values of up to `limit` entries with a term starting with `query`, best matches first.
+
+        Args:
+            query (str): The prefix to look for. It is normalized like the terms.
+            limit (int): The maximum number of values to return.
+
+        Returns:
+            List[Any]: The matching values, each entry at most once.
+        """
+        prefix = normalize_term(query)
+        if not prefix:
+            return []
+
+        matches: Dict[Hashable, Any] = {}
+        for field in self.fields:
+            array = self._arrays[field]
+            position = bisect_left(array, (prefix,))
+            while position < len(array) and len(matches) < limit:
+                term, key = array[position]
+                if not term.startswith(prefix):
+                    break
+                if key not in matches:
+                    matches[key] = self._values[key]
+                position += 1
+            if len(matches) >= limit:
+                break
+        return list(matches.values())
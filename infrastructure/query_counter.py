@@ -0,0 +1,172 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from pymongo import monitoring
+
+from infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_SHAPE_KEYS = ("filter", "query", "q", "pipeline", "sort", "updates", "deletes")
+
+
+class QueryCounter:
+    """
+    Accumulates the number of MongoDB commands issued within a single unit of work, and the time spent on them.
+
+    A `QueryCounter` is bound to the current context by `track_queries`, and every command sent to
+    MongoDB while it is active increments `count` and, once answered, adds its round trip time to
+    `duration_ms`. Because the binding lives in a `ContextVar`, each request (asyncio task) gets its own
+    counter even when many requests are served concurrently.
+
+    Attributes:
+        count (int): The number of commands issued while the counter was active.
+        duration_ms (float): The total time, in milliseconds, MongoDB took to answer those commands.
+        label (Optional[str]): What the counter is attributed to in the slow command log, e.g. "GET /product/".
+
+    Example:
+        with track_queries() as counter:
+            await create_document_repo("INV-12345", "sale", items)
+        print(counter.count, counter.duration_ms)  # Output: number of round trips and their total time
+    """
+
+    def __init__(self, label: Optional[str] = None):
+        self.count = 0
+        self.duration_ms = 0.0
+        self.label = label
+
+
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+def query_shape(value: Any) -> Any:
+    """
+    Replaces every literal in a filter, sort or pipeline with "?", keeping only its structure.
+
+    Only the first element of a list is kept, so the shape of an `$in` over a thousand IDs, or of a batch of
+    updates, stays short, and no values (which may be personal data) end up in the logs.
+
+    Example:
+        query_shape({"code": "P001", "price": {"$gt": 10}})  # Output: {"code": "?", "price": {"$gt": "?"}}
+    """
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [query_shape(value[0])] if value else []
+    return "?"
+
+
+def command_shape(command_name: str, command: dict) -> dict:
+    """
+    Returns the collection and the shape (see `query_shape`) of the filter, sort and pipeline of a command.
+    """
+    shape = {key: query_shape(command[key]) for key in _SHAPE_KEYS if key in command}
+    collection = command.get(command_name)
+    if isinstance(collection, str):
+        shape["collection"] = collection
+    return shape
+
+
+class QueryCounterListener(monitoring.CommandListener):
+    """
+    PyMongo command listener that feeds the `QueryCounter` bound to the current context and logs slow commands.
+
+    Every command issued inside `track_queries` is attributed to the active counter, which accumulates the
+    number of commands and their round trip time. Independently of any counter, commands answered (or
+    failed) after more than `slow_threshold_ms` are logged as warnings together with the shape of their
+    filter (see `query_shape`) and the label of the counter, if any, e.g. the request that issued them.
+
+    Args:
+        slow_threshold_ms (Optional[float]): The slow command threshold. None disables the slow command log.
+    """
+
+    def __init__(self, slow_threshold_ms: Optional[float] = None):
+        self.slow_threshold_ms = slow_threshold_ms
+        self._commands: Dict[Tuple[Any, int], Tuple[str, dict]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.count += 1
+        if self.slow_threshold_ms is not None:
+            self._commands[(event.connection_id, event.request_id)] = (event.command_name, event.command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finished(event, "")
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finished(event, " (failed)")
+
+    def _finished(self, event, outcome: str):
+        duration_ms = event.duration_micros / 1000
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.duration_ms += duration_ms
+
+        if self.slow_threshold_ms is None:
+            return
+        command_name, command = self._commands.pop((event.connection_id, event.request_id), (event.command_name, {}))
+        if duration_ms >= self.slow_threshold_ms:
+            logger.warning(
+                "Slow MongoDB command%s: %s took %.1f ms for %s: %s",
+                outcome, command_name, duration_ms,
+                counter.label if counter is not None and counter.label else "no request",
+                command_shape(command_name, command),
+            )
+
+
+def get_query_counter() -> Optional[QueryCounter]:
+    """
+    Returns the `QueryCounter` bound to the current context, or None if queries are not being tracked.
+    """
+    return _current_counter.get()
+
+
+@contextmanager
+def track_queries(label: Optional[str] = None) -> Iterator[QueryCounter]:
+    """
+    Binds a fresh `QueryCounter` to the current context for the duration of the `with` block.
+
+    Args:
+        label (Optional[str]): What the commands are attributed to in the slow command log.
+
+    Yields:
+        QueryCounter: The counter that accumulates the commands issued inside the block.
+
+    Example:
+        with track_queries() as counter:
+            await get_document_by_reference_repo("INV-12345")
+        assert counter.count == 1
+    """
+    counter = QueryCounter(label)
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+async def query_counter_middleware(request, call_next):
+    """
+    HTTP middleware that tracks the MongoDB commands issued while serving each request.
+
+    The active `QueryCounter` is exposed as `request.state.query_counter`, so endpoints and tests can
+    assert that the number of round trips stays constant regardless of the payload size, and slow commands
+    are logged with the method and path of the request that issued them.
+
+    In debug mode (`DEBUG=true`), the counters are also returned in the `X-DB-Queries` (number of commands)
+    and `X-DB-Time` (milliseconds spent waiting on MongoDB) response headers. For streamed responses the
+    headers only cover the commands issued before the body started streaming.
+
+    Example:
+        app.middleware("http")(query_counter_middleware)
+    """
+    with track_queries(f"{request.method} {request.url.path}") as counter:
+        request.state.query_counter = counter
+        response = await call_next(request)
+        if settings.debug:
+            response.headers["X-DB-Queries"] = str(counter.count)
+            response.headers["X-DB-Time"] = f"{counter.duration_ms:.2f}"
+        return response
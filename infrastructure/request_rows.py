@@ -0,0 +1,84 @@
+import csv
+import json
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request
+
+SUPPORTED_ROW_MEDIA_TYPES = ("application/json", "application/x-ndjson", "text/csv")
+
+
+async def _iter_lines(request: Request) -> AsyncIterator[str]:
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8").rstrip("\r")
+    if buffer:
+        yield buffer.decode("utf-8").rstrip("\r")
+
+
+async def iter_request_rows(request: Request) -> AsyncIterator[dict]:
+    """
+    Iterates over the rows of a request body, as dictionaries, according to its `Content-Type`.
+
+    - `application/json`: the body is a JSON array of objects. It is parsed as a whole, so its size is bounded
+      by the request body size.
+    - `application/x-ndjson`: one JSON object per line, parsed as the body is received.
+    - `text/csv`: a header row followed by one record per line, parsed as the body is received. Empty cells
+      are returned as None.
+
+    With the two streamed formats only the line being parsed is held in memory, so arbitrarily large bodies
+    can be consumed with bounded memory.
+
+    Args:
+        request (Request): The incoming request.
+
+    Yields:
+        dict: Each row of the body. Rows that cannot be parsed are yielded as an exception instance instead,
+        so callers can report the error for that row and continue.
+
+    Raises:
+        HTTPException: 415 if the content type is not supported, 400 if a JSON body is malformed or not an
+            array.
+
+    Example:
+        async for row in iter_request_rows(request):
+            print(row)
+    """
+    media_type = request.headers.get("content-type", "application/json").split(";")[0].strip()
+
+    if media_type == "application/json":
+        try:
+            rows = json.loads(await request.body() or b"[]")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid JSON body")
+        if not isinstance(rows, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array")
+        for row in rows:
+            yield row
+
+    elif media_type == "application/x-ndjson":
+        async for line in _iter_lines(request):
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    yield e
+
+    elif media_type == "text/csv":
+        header = None
+        async for line in _iter_lines(request):
+            if not line.strip():
+                continue
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            yield {name: value or None for name, value in zip(header, values)}
+
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported content type, expected one of: {', '.join(SUPPORTED_ROW_MEDIA_TYPES)}",
+        )
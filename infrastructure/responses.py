@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serializes a DTO straight to a JSON response with Pydantic's compiled serializer.
+
+    When an endpoint returns a model, FastAPI dumps it to a dictionary and validates that dictionary against
+    the `response_model` again before encoding it. Returning the `Response` built here skips that second
+    validation, which matters for DTOs built from trusted data with `model_construct` (see the `from_raw`
+    methods). The endpoint's `response_model` is still used for the OpenAPI schema.
+
+    Args:
+        model (BaseModel): The DTO to serialize.
+        status_code (int): The HTTP status code of the response. Defaults to 200.
+
+    Returns:
+        Response: An `application/json` response holding the serialized DTO.
+
+    Example:
+        return model_response(ProductDto.from_raw(raw))
+    """
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
@@ -0,0 +1,300 @@
+import os
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Optional
+
+from dotenv import load_dotenv
+
+
+def _parse_int_mapping(value: str) -> Dict[str, int]:
+    """
+    Parses a comma-separated `key=value` list (e.g. "sale=100,purchase=10") into a dictionary of integers.
+    """
+    mapping = {}
+    for pair in filter(None, (chunk.strip() for chunk in value.split(","))):
+        key, _, number = pair.partition("=")
+        mapping[key.strip()] = int(number)
+    return mapping
+
+
+def _optional_int(name: str, default: Optional[int] = None) -> Optional[int]:
+    """
+    Reads an optional integer environment variable, returning `default` when it is unset and None when it is
+    set to an empty value.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return int(value) if value else None
+
+
+def _optional_float(name: str, default: Optional[float] = None) -> Optional[float]:
+    """
+    Reads an optional float environment variable, returning `default` when it is unset and None when it is
+    set to an empty value.
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return float(value) if value else None
+
+
+def _bool(name: str, default: bool) -> bool:
+    """
+    Reads a boolean environment variable ("1", "true", "yes" and "on" are true, case-insensitively).
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_set(value: str) -> FrozenSet[str]:
+    """
+    Parses a comma-separated list (e.g. "purchase,return") into a set of stripped, non-empty strings.
+    """
+    return frozenset(filter(None, (chunk.strip() for chunk in value.split(","))))
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Application settings read from environment variables (and from a `.env` file, if present).
+
+    Attributes:
+        mongo_uri (str): The MongoDB connection string (`MONGO_URI`, default `mongodb://localhost:27017`).
+        mongo_database (str): The name of the database holding the inventory (`MONGO_DATABASE`).
+        mongo_max_pool_size (int): Maximum number of connections per server (`MONGO_MAX_POOL_SIZE`).
+        mongo_min_pool_size (int): Connections kept open even when idle (`MONGO_MIN_POOL_SIZE`).
+        mongo_max_connecting (int): Maximum number of connections being established concurrently
+            (`MONGO_MAX_CONNECTING`).
+        mongo_max_idle_time_ms (Optional[int]): How long a pooled connection may stay idle before it is
+            closed (`MONGO_MAX_IDLE_TIME_MS`).
+        mongo_wait_queue_timeout_ms (Optional[int]): How long an operation may wait for a free connection
+            (`MONGO_WAIT_QUEUE_TIMEOUT_MS`).
+        mongo_server_selection_timeout_ms (int): How long an operation may wait for a suitable server
+            (`MONGO_SERVER_SELECTION_TIMEOUT_MS`).
+        mongo_connect_timeout_ms (int): Timeout for establishing a connection (`MONGO_CONNECT_TIMEOUT_MS`).
+        mongo_socket_timeout_ms (Optional[int]): Timeout for a single network round trip
+            (`MONGO_SOCKET_TIMEOUT_MS`).
+        mongo_read_uri (Optional[str]): A separate connection string for reads that tolerate replication lag
+            (`MONGO_READ_URI`). By default those reads share the client of `MONGO_URI`.
+        mongo_read_preference (str): Where reads that tolerate replication lag are sent
+            (`MONGO_READ_PREFERENCE`, default `primary`; e.g. `secondaryPreferred` or `nearest`).
+        mongo_max_staleness_seconds (Optional[int]): How far behind the primary a secondary may be to serve
+            those reads (`MONGO_MAX_STALENESS_SECONDS`, unbounded by default, at least 90 when set).
+        mongo_slow_command_ms (Optional[float]): Commands taking at least this long are logged as warnings
+            with the shape of their filter (`MONGO_SLOW_COMMAND_MS`, default 100, empty disables the log).
+        index_build_mode (str): How the declared indexes are built at startup (`INDEX_BUILD_MODE`): `background`
+            (default) builds them while the application already serves requests, `blocking` builds them and
+            checks the hot query plans before serving, failing startup on a COLLSCAN, and `off` skips both.
+        index_check_query_plans (bool): Whether to check the hot query plans after building the indexes
+            (`INDEX_CHECK_QUERY_PLANS`, default true).
+        product_cache_max_entries (Optional[int]): Maximum number of products kept in the in-process product
+            cache (`PRODUCT_CACHE_MAX_ENTRIES`, default 10000, 0 disables the cache).
+        product_cache_max_bytes (Optional[int]): Maximum approximate size in bytes (encoded BSON) of the
+            product cache (`PRODUCT_CACHE_MAX_BYTES`, unbounded by default).
+        product_cache_ttl_seconds (Optional[float]): How long a cached product may be served before it is
+            read again (`PRODUCT_CACHE_TTL_SECONDS`, default 300). This bounds how stale a worker's copy can
+            be after another worker updates the product.
+        product_import_chunk_size (int): Default number of rows written per bulk write by `POST /product/bulk`
+            (`PRODUCT_IMPORT_CHUNK_SIZE`, default 1000).
+        product_search_index_enabled (bool): Whether each worker loads the products into the in-process index
+            serving `GET /product/search` (`PRODUCT_SEARCH_INDEX_ENABLED`, default true). When disabled, searches
+            only match code prefixes, with a database query.
+        product_search_index_refresh_seconds (int): How often the search index is reloaded to pick up products
+            written by other workers (`PRODUCT_SEARCH_INDEX_REFRESH_SECONDS`, default 300, 0 loads it once).
+        cache_shared_backend (str): The cache shared by the workers behind their in-process product and document
+            caches (`CACHE_SHARED_BACKEND`): `off` (default), `redis` or `memory` (in-process, for a single
+            worker or for trying the shared path without a Redis server).
+        cache_redis_url (str): The Redis-protocol server of the shared cache (`CACHE_REDIS_URL`, default
+            `redis://localhost:6379/0`).
+        cache_redis_timeout_seconds (float): How long a shared cache command may take before it is treated as
+            a miss (`CACHE_REDIS_TIMEOUT_SECONDS`, default 0.1).
+        cache_key_prefix (str): Prefix of the shared cache keys and invalidation channel (`CACHE_KEY_PREFIX`,
+            default `pyinventory:`), so several deployments can share a server.
+        stock_inbound_concepts (FrozenSet[str]): Document concepts that add their quantities to the stock on
+            hand (`STOCK_INBOUND_CONCEPTS`, default `purchase`).
+        stock_outbound_concepts (FrozenSet[str]): Document concepts that subtract their quantities from the
+            stock on hand (`STOCK_OUTBOUND_CONCEPTS`, default `sale`). Other concepts do not affect stock.
+        stock_snapshot_interval_seconds (int): How often the stock on hand is snapshotted from the application
+            (`STOCK_SNAPSHOT_INTERVAL_SECONDS`, default 0, which disables the in-process schedule so snapshots
+            can be taken by a single scheduled `make stock_snapshot` instead). The schedule runs in every
+            worker; overlapping runs are safe but repeat the same work.
+        stock_snapshot_delay_seconds (int): How far behind the current time a snapshot is taken, so documents
+            still being inserted are not missed (`STOCK_SNAPSHOT_DELAY_SECONDS`, default 60).
+        document_cache_max_entries (Optional[int]): Maximum number of serialized documents kept in the in-process
+            document cache (`DOCUMENT_CACHE_MAX_ENTRIES`, unbounded by default).
+        document_cache_max_bytes (Optional[int]): Maximum size in bytes of the serialized documents kept in the
+            document cache (`DOCUMENT_CACHE_MAX_BYTES`, default 64 MiB, 0 disables the cache).
+        document_group_commit_window_ms (float): How long a document created by `POST /document/` waits for
+            concurrent creations to be inserted with it (`DOCUMENT_GROUP_COMMIT_WINDOW_MS`, default 0, which
+            inserts every document on its own).
+        document_group_commit_max_batch_size (int): How many queued documents trigger an insert before the
+            window closes (`DOCUMENT_GROUP_COMMIT_MAX_BATCH_SIZE`, default 100).
+        document_export_batch_size (int): How many documents `GET /document/export` reads per database round
+            trip (`DOCUMENT_EXPORT_BATCH_SIZE`, default 1000).
+        document_export_row_group_size (int): How many rows each Parquet row group of `GET /document/export`
+            holds (`DOCUMENT_EXPORT_ROW_GROUP_SIZE`, default 50000). It bounds the memory used by an export.
+        idempotency_key_ttl_seconds (int): How long an `Idempotency-Key` of `POST /document/` is remembered
+            (`IDEMPOTENCY_KEY_TTL_SECONDS`, default 86400).
+        counter_default_block_size (int): How many consecutive numbers a worker reserves at once for a
+            counter that has no explicit block size (`COUNTER_DEFAULT_BLOCK_SIZE`, default 1).
+        counter_block_sizes (Dict[str, int]): Per-counter block sizes, e.g. `COUNTER_BLOCK_SIZES=sale=100`.
+        debug (bool): Whether responses carry debugging headers such as `X-DB-Queries` and `X-DB-Time`
+            (`DEBUG`, default false).
+        endpoint_discovery (str): How routers find their endpoint modules (`ENDPOINT_DISCOVERY`): `manifest`
+            reads them from the checked-in endpoint manifest, `discovery` walks the endpoint packages, and
+            `auto` (default) uses the manifest unless `DEBUG` is set.
+        endpoint_manifest_path (str): The endpoint manifest, relative to the project root
+            (`ENDPOINT_MANIFEST_PATH`, default `core/endpoints_manifest.json`).
+        metrics_enabled (bool): Whether requests and repository calls are measured and served on `GET /metrics`
+            (`METRICS_ENABLED`, default false). When disabled nothing is instrumented, so there is no overhead.
+        tracing_exporter (str): Where spans are exported (`TRACING_EXPORTER`): `off` (default, nothing is
+            instrumented), `file` or `otlp`.
+        tracing_file_path (str): The file spans are appended to by the `file` exporter (`TRACING_FILE_PATH`,
+            default `traces.jsonl`).
+        tracing_otlp_endpoint (str): The OTLP/HTTP traces endpoint used by the `otlp` exporter
+            (`TRACING_OTLP_ENDPOINT`, default `http://localhost:4318/v1/traces`).
+        tracing_sample_ratio (float): The fraction of traces recorded (`TRACING_SAMPLE_RATIO`, default 1.0).
+            Requests carrying a `traceparent` header follow the caller's sampling decision instead.
+        tracing_service_name (str): The `service.name` reported with every span (`TRACING_SERVICE_NAME`,
+            default `pyinventory`).
+
+    Gap tolerance:
+        A block size of 1 allocates every consecutive with a single atomic update, so numbers are strictly
+        increasing and only skipped if the document insert itself fails. A block size greater than 1 makes
+        the counter gap tolerant: each worker hands out numbers from its own reserved block, so numbers from
+        different workers interleave out of order, and the unused remainder of a block is lost when the
+        worker restarts.
+
+    Example:
+        settings.counter_block_size("sale")  # Output: 100 with COUNTER_BLOCK_SIZES=sale=100
+    """
+
+    mongo_uri: str = "mongodb://localhost:27017"
+    mongo_database: str = "inventory"
+    mongo_max_pool_size: int = 100
+    mongo_min_pool_size: int = 0
+    mongo_max_connecting: int = 2
+    mongo_max_idle_time_ms: Optional[int] = None
+    mongo_wait_queue_timeout_ms: Optional[int] = None
+    mongo_server_selection_timeout_ms: int = 30000
+    mongo_connect_timeout_ms: int = 20000
+    mongo_socket_timeout_ms: Optional[int] = None
+    mongo_read_uri: Optional[str] = None
+    mongo_read_preference: str = "primary"
+    mongo_max_staleness_seconds: Optional[int] = None
+    mongo_slow_command_ms: Optional[float] = 100
+    index_build_mode: str = "background"
+    index_check_query_plans: bool = True
+    product_cache_max_entries: Optional[int] = 10000
+    product_cache_max_bytes: Optional[int] = None
+    product_cache_ttl_seconds: Optional[float] = 300
+    product_import_chunk_size: int = 1000
+    product_search_index_enabled: bool = True
+    product_search_index_refresh_seconds: int = 300
+    cache_shared_backend: str = "off"
+    cache_redis_url: str = "redis://localhost:6379/0"
+    cache_redis_timeout_seconds: float = 0.1
+    cache_key_prefix: str = "pyinventory:"
+    stock_inbound_concepts: FrozenSet[str] = frozenset({"purchase"})
+    stock_outbound_concepts: FrozenSet[str] = frozenset({"sale"})
+    stock_snapshot_interval_seconds: int = 0
+    stock_snapshot_delay_seconds: int = 60
+    document_cache_max_entries: Optional[int] = None
+    document_cache_max_bytes: Optional[int] = 64 * 1024 * 1024
+    document_group_commit_window_ms: float = 0
+    document_group_commit_max_batch_size: int = 100
+    document_export_batch_size: int = 1000
+    document_export_row_group_size: int = 50000
+    idempotency_key_ttl_seconds: int = 86400
+    counter_default_block_size: int = 1
+    counter_block_sizes: Dict[str, int] = field(default_factory=dict)
+    debug: bool = False
+    endpoint_discovery: str = "auto"
+    endpoint_manifest_path: str = "core/endpoints_manifest.json"
+    metrics_enabled: bool = False
+    tracing_exporter: str = "off"
+    tracing_file_path: str = "traces.jsonl"
+    tracing_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    tracing_sample_ratio: float = 1.0
+    tracing_service_name: str = "pyinventory"
+
+    def stock_sign(self, concept: str) -> int:
+        """
+        Returns 1 if documents of the given concept add stock, -1 if they remove it and 0 otherwise.
+        """
+        if concept in self.stock_inbound_concepts:
+            return 1
+        if concept in self.stock_outbound_concepts:
+            return -1
+        return 0
+
+    def counter_block_size(self, name: str) -> int:
+        """
+        Returns the block size configured for the counter with the given name.
+        """
+        return max(1, self.counter_block_sizes.get(name, self.counter_default_block_size))
+
+
+def load_settings() -> Settings:
+    """
+    Builds a `Settings` instance from the process environment.
+
+    Returns:
+        Settings: The application settings.
+    """
+    load_dotenv()
+    return Settings(
+        mongo_uri=os.getenv("MONGO_URI", "mongodb://localhost:27017"),
+        mongo_database=os.getenv("MONGO_DATABASE", "inventory"),
+        mongo_max_pool_size=int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+        mongo_min_pool_size=int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        mongo_max_connecting=int(os.getenv("MONGO_MAX_CONNECTING", "2")),
+        mongo_max_idle_time_ms=_optional_int("MONGO_MAX_IDLE_TIME_MS"),
+        mongo_wait_queue_timeout_ms=_optional_int("MONGO_WAIT_QUEUE_TIMEOUT_MS"),
+        mongo_server_selection_timeout_ms=int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000")),
+        mongo_connect_timeout_ms=int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "20000")),
+        mongo_socket_timeout_ms=_optional_int("MONGO_SOCKET_TIMEOUT_MS"),
+        mongo_read_uri=os.getenv("MONGO_READ_URI") or None,
+        mongo_read_preference=os.getenv("MONGO_READ_PREFERENCE", "primary"),
+        mongo_max_staleness_seconds=_optional_int("MONGO_MAX_STALENESS_SECONDS"),
+        mongo_slow_command_ms=_optional_float("MONGO_SLOW_COMMAND_MS", 100),
+        index_build_mode=os.getenv("INDEX_BUILD_MODE", "background"),
+        index_check_query_plans=_bool("INDEX_CHECK_QUERY_PLANS", True),
+        product_cache_max_entries=_optional_int("PRODUCT_CACHE_MAX_ENTRIES", 10000),
+        product_cache_max_bytes=_optional_int("PRODUCT_CACHE_MAX_BYTES"),
+        product_cache_ttl_seconds=float(os.getenv("PRODUCT_CACHE_TTL_SECONDS", "300")) or None,
+        product_import_chunk_size=int(os.getenv("PRODUCT_IMPORT_CHUNK_SIZE", "1000")),
+        product_search_index_enabled=_bool("PRODUCT_SEARCH_INDEX_ENABLED", True),
+        product_search_index_refresh_seconds=int(os.getenv("PRODUCT_SEARCH_INDEX_REFRESH_SECONDS", "300")),
+        cache_shared_backend=os.getenv("CACHE_SHARED_BACKEND", "off"),
+        cache_redis_url=os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0"),
+        cache_redis_timeout_seconds=float(os.getenv("CACHE_REDIS_TIMEOUT_SECONDS", "0.1")),
+        cache_key_prefix=os.getenv("CACHE_KEY_PREFIX", "pyinventory:"),
+        stock_inbound_concepts=_parse_set(os.getenv("STOCK_INBOUND_CONCEPTS", "purchase")),
+        stock_outbound_concepts=_parse_set(os.getenv("STOCK_OUTBOUND_CONCEPTS", "sale")),
+        stock_snapshot_interval_seconds=int(os.getenv("STOCK_SNAPSHOT_INTERVAL_SECONDS", "0")),
+        stock_snapshot_delay_seconds=int(os.getenv("STOCK_SNAPSHOT_DELAY_SECONDS", "60")),
+        document_cache_max_entries=_optional_int("DOCUMENT_CACHE_MAX_ENTRIES"),
+        document_cache_max_bytes=_optional_int("DOCUMENT_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+        document_group_commit_window_ms=float(os.getenv("DOCUMENT_GROUP_COMMIT_WINDOW_MS", "0")),
+        document_group_commit_max_batch_size=int(os.getenv("DOCUMENT_GROUP_COMMIT_MAX_BATCH_SIZE", "100")),
+        document_export_batch_size=int(os.getenv("DOCUMENT_EXPORT_BATCH_SIZE", "1000")),
+        document_export_row_group_size=int(os.getenv("DOCUMENT_EXPORT_ROW_GROUP_SIZE", "50000")),
+        idempotency_key_ttl_seconds=int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400")),
+        counter_default_block_size=int(os.getenv("COUNTER_DEFAULT_BLOCK_SIZE", "1")),
+        counter_block_sizes=_parse_int_mapping(os.getenv("COUNTER_BLOCK_SIZES", "")),
+        debug=_bool("DEBUG", False),
+        endpoint_discovery=os.getenv("ENDPOINT_DISCOVERY", "auto"),
+        endpoint_manifest_path=os.getenv("ENDPOINT_MANIFEST_PATH", "core/endpoints_manifest.json"),
+        metrics_enabled=_bool("METRICS_ENABLED", False),
+        tracing_exporter=os.getenv("TRACING_EXPORTER", "off"),
+        tracing_file_path=os.getenv("TRACING_FILE_PATH", "traces.jsonl"),
+        tracing_otlp_endpoint=os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces"),
+        tracing_sample_ratio=float(os.getenv("TRACING_SAMPLE_RATIO", "1.0")),
+        tracing_service_name=os.getenv("TRACING_SERVICE_NAME", "pyinventory"),
+    )
+
+
+settings = load_settings()
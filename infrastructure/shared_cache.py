@@ -0,0 +1,422 @@
+import asyncio
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+import bson
+
+from infrastructure.lru_cache import LruCache
+from infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """
+    Interface of a cache of serialized values shared by the workers of a deployment.
+
+    Values are bytes, so any process (or language) speaking the backend's protocol can read them. Besides the
+    key-value operations, a backend offers a publish/subscribe channel, used to tell the other workers which
+    entries of their in-process caches are stale.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        """
+        Returns the value of each key, in order, with None for missing keys.
+        """
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, bytes], ttl_seconds: Optional[float] = None,
+                       only_if_absent: bool = False):
+        """
+        Stores many values, each expiring after `ttl_seconds` if given. With `only_if_absent`, keys that
+        already hold a value keep it.
+        """
+
+    @abstractmethod
+    async def delete_many(self, keys: Sequence[str]):
+        """
+        Removes the given keys, if present.
+        """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: bytes):
+        """
+        Sends a message to every current subscriber of `channel`.
+        """
+
+    @abstractmethod
+    def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        """
+        Yields the messages published on `channel` from now on, until the iterator is closed.
+        """
+
+    async def close(self):
+        """
+        Releases the backend's connections.
+        """
+
+
+class InProcessCacheBackend(CacheBackend):
+    """
+    `CacheBackend` kept in the memory of the current process.
+
+    It is only shared by the coroutines of one worker, so it is meant for single-worker deployments and for
+    exercising the two-tier lookup and the invalidation messages without a Redis server.
+
+    Args:
+        max_bytes (Optional[int]): Maximum total size of the stored values. Unbounded by default.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._cache = LruCache(max_bytes=max_bytes, sizeof=len)
+        self._expirations: Dict[str, float] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        now = time.monotonic()
+        values = []
+        for key in keys:
+            if self._expirations.get(key, now + 1) <= now:
+                self._cache.delete(key)
+                self._expirations.pop(key, None)
+            values.append(self._cache.get(key))
+        return values
+
+    async def set_many(self, items: Dict[str, bytes], ttl_seconds: Optional[float] = None,
+                       only_if_absent: bool = False):
+        if only_if_absent:
+            present = await self.get_many(list(items))
+            items = {key: value for (key, value), current in zip(items.items(), present) if current is None}
+        for key, value in items.items():
+            self._cache.set(key, value)
+            if ttl_seconds:
+                self._expirations[key] = time.monotonic() + ttl_seconds
+            else:
+                self._expirations.pop(key, None)
+
+    async def delete_many(self, keys: Sequence[str]):
+        for key in keys:
+            self._cache.delete(key)
+            self._expirations.pop(key, None)
+
+    async def publish(self, channel: str, message: bytes):
+        for queue in self._subscribers.get(channel, ()):
+            queue.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(channel, []).append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[channel].remove(queue)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    `CacheBackend` stored in a server speaking the Redis protocol (Redis, Valkey, KeyDB, ...).
+
+    Reads use a single `MGET` and writes a single pipelined round trip, whatever the number of keys.
+    Invalidation messages use Redis pub/sub.
+
+    Args:
+        client: A `redis.asyncio.Redis` client, or a compatible one such as `fakeredis.aioredis.FakeRedis`.
+        subscriber: The client used for subscriptions, which wait for messages indefinitely and therefore must
+            not have a socket timeout. Defaults to `client`.
+
+    Example:
+        backend = RedisCacheBackend(redis.asyncio.from_url("redis://localhost:6379/0"))
+    """
+
+    def __init__(self, client, subscriber=None):
+        self._client = client
+        self._subscriber = subscriber if subscriber is not None else client
+
+    @classmethod
+    def from_url(cls, url: str, timeout_seconds: Optional[float] = None) -> "RedisCacheBackend":
+        """
+        Creates a backend connected to `url`, whose commands fail after `timeout_seconds` so a slow cache
+        server cannot stall requests. The `redis` package is imported here, so it is only needed when a Redis
+        cache is configured.
+
+        Raises:
+            RuntimeError: If the `redis` package is not installed.
+        """
+        try:
+            import redis.asyncio
+        except ImportError as e:
+            raise RuntimeError("CACHE_SHARED_BACKEND=redis requires the redis package (pip install redis)") from e
+
+        return cls(
+            redis.asyncio.from_url(url, socket_timeout=timeout_seconds, socket_connect_timeout=timeout_seconds),
+            redis.asyncio.from_url(url, socket_connect_timeout=timeout_seconds),
+        )
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[bytes]]:
+        return await self._client.mget(keys)
+
+    async def set_many(self, items: Dict[str, bytes], ttl_seconds: Optional[float] = None,
+                       only_if_absent: bool = False):
+        milliseconds = int(ttl_seconds * 1000) if ttl_seconds else None
+        async with self._client.pipeline(transaction=False) as pipeline:
+            for key, value in items.items():
+                pipeline.set(key, value, px=milliseconds, nx=only_if_absent)
+            await pipeline.execute()
+
+    async def delete_many(self, keys: Sequence[str]):
+        await self._client.delete(*keys)
+
+    async def publish(self, channel: str, message: bytes):
+        await self._client.publish(channel, message)
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        pubsub = self._subscriber.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(channel)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+
+    async def close(self):
+        await self._client.aclose()
+        if self._subscriber is not self._client:
+            await self._subscriber.aclose()
+
+
+_backend: Optional[CacheBackend] = None
+_caches: Dict[str, "TieredCache"] = {}
+_origin = os.urandom(8)
+
+
+def _shared_key(cache_name: str, key: Hashable) -> str:
+    return f"{settings.cache_key_prefix}{cache_name}:{key}"
+
+
+def _invalidation_channel() -> str:
+    return f"{settings.cache_key_prefix}invalidations"
+
+
+class TieredCache:
+    """
+    Two-tier cache: an in-process `LruCache` (L1) in front of the shared `CacheBackend` (L2), if configured.
+
+    Lookups are answered from L1 when possible, then from L2, whose values are decoded and copied into L1,
+    and otherwise miss, so the caller reads the source of truth and `fill`s the cache. Values are serialized
+    with `encode` / `decode` (e.g. BSON) only when they go through L2, so L1 hits cost no decoding.
+
+    Writes go through `put_many` (or `invalidate`), which replaces (or removes) the entries in both tiers and
+    publishes an invalidation message, so the other workers drop their L1 copies. `fill` never overwrites an
+    L2 value, so a worker that read a stale copy (e.g. from a lagging secondary) while a write was in flight
+    cannot replace the value written with it.
+
+    A failing shared backend never fails a request: errors are logged and counted, and the cache behaves as
+    if L2 were empty.
+
+    Args:
+        name (str): The name of the cache, used to namespace its L2 keys and its invalidation messages.
+        local (LruCache): The L1 cache.
+        encode (Callable[[Any], bytes]): Serializes a value for L2.
+        decode (Callable[[bytes], Any]): Deserializes a value read from L2.
+        ttl_seconds (Optional[float]): How long values live in L2. They never expire by default.
+
+    Example:
+        product_cache = TieredCache("product", LruCache(max_entries=10000), bson.encode, bson.decode, 300)
+        raw = await product_cache.get(product_id)
+    """
+
+    def __init__(self, name: str, local: LruCache, encode: Callable, decode: Callable,
+                 ttl_seconds: Optional[float] = None):
+        self.name = name
+        self.local = local
+        self.encode = encode
+        self.decode = decode
+        self.ttl_seconds = ttl_seconds
+        self.shared_hits = 0
+        self.shared_misses = 0
+        self.shared_errors = 0
+        _caches[name] = self
+
+    async def get(self, key: Hashable):
+        """
+        Returns the value cached under `key`, or None on a miss in both tiers.
+        """
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[Hashable]) -> dict:
+        """
+        Returns the cached values of the given keys, looking up the L1 misses in L2 with a single request.
+        Missing keys are absent from the result.
+        """
+        values = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                values[key] = value
+
+        if missing and _backend is not None:
+            try:
+                found = await _backend.get_many([_shared_key(self.name, key) for key in missing])
+            except Exception:
+                self._shared_failed("read")
+                return values
+            for key, data in zip(missing, found):
+                if data is None:
+                    self.shared_misses += 1
+                    continue
+                self.shared_hits += 1
+                values[key] = self.decode(data)
+                self.local.set(key, values[key])
+
+        return values
+
+    async def fill(self, key: Hashable, value):
+        """
+        Caches a value just read from the source of truth, without overwriting a value already in L2.
+        """
+        await self.fill_many({key: value})
+
+    async def fill_many(self, items: dict):
+        """
+        Caches many values just read from the source of truth (see `fill`).
+        """
+        for key, value in items.items():
+            self.local.set(key, value)
+        await self._write_shared(items, only_if_absent=True)
+
+    async def put(self, key: Hashable, value):
+        """
+        Caches the value just written under `key`, in both tiers, and invalidates the L1 copies of the other
+        workers.
+        """
+        await self.put_many({key: value})
+
+    async def put_many(self, items: dict):
+        """
+        Caches many values just written (see `put`), with one L2 round trip and one invalidation message.
+        """
+        for key, value in items.items():
+            self.local.set(key, value)
+        if await self._write_shared(items, only_if_absent=False):
+            await self._publish_invalidation(list(items))
+
+    async def invalidate(self, keys: Iterable[Hashable]):
+        """
+        Removes the given keys from both tiers and from the L1 caches of the other workers.
+        """
+        keys = list(keys)
+        for key in keys:
+            self.local.delete(key)
+        if _backend is None or not keys:
+            return
+        try:
+            await _backend.delete_many([_shared_key(self.name, key) for key in keys])
+        except Exception:
+            self._shared_failed("invalidation")
+            return
+        await self._publish_invalidation(keys)
+
+    def stats(self) -> dict:
+        """
+        Returns the counters of L1 (see `LruCache.stats`) together with the L2 hit, miss and error counters.
+        The L2 counters are None when no shared backend is configured.
+        """
+        shared = _backend is not None
+        return {
+            **self.local.stats(),
+            "shared_hits": self.shared_hits if shared else None,
+            "shared_misses": self.shared_misses if shared else None,
+            "shared_errors": self.shared_errors if shared else None,
+        }
+
+    async def _write_shared(self, items: dict, only_if_absent: bool) -> bool:
+        if _backend is None or not items:
+            return False
+        try:
+            await _backend.set_many(
+                {_shared_key(self.name, key): self.encode(value) for key, value in items.items()},
+                self.ttl_seconds, only_if_absent,
+            )
+        except Exception:
+            self._shared_failed("write")
+            return False
+        return True
+
+    async def _publish_invalidation(self, keys: List[Hashable]):
+        message = bson.encode({'origin': _origin, 'cache': self.name, 'keys': [str(key) for key in keys]})
+        try:
+            await _backend.publish(_invalidation_channel(), message)
+        except Exception:
+            self._shared_failed("invalidation")
+
+    def _shared_failed(self, operation: str):
+        self.shared_errors += 1
+        logger.warning("Shared %s cache %s failed", self.name, operation, exc_info=True)
+
+
+def connect_shared_cache() -> Optional[CacheBackend]:
+    """
+    Creates the shared cache backend selected by `CACHE_SHARED_BACKEND`, if any.
+
+    With `redis`, the backend connects to `CACHE_REDIS_URL`, lazily, on the first operation; with `memory`,
+    an `InProcessCacheBackend` is used; with `off` (default), tiered caches only use their L1.
+
+    Returns:
+        Optional[CacheBackend]: The backend, which is also kept as the process-wide shared cache.
+
+    Raises:
+        ValueError: If `CACHE_SHARED_BACKEND` is unknown.
+        RuntimeError: With `redis`, if the `redis` package is not installed.
+    """
+    global _backend
+    if settings.cache_shared_backend == "redis":
+        _backend = RedisCacheBackend.from_url(settings.cache_redis_url, settings.cache_redis_timeout_seconds)
+    elif settings.cache_shared_backend == "memory":
+        _backend = InProcessCacheBackend()
+    elif settings.cache_shared_backend != "off":
+        raise ValueError(f"Unknown shared cache backend: {settings.cache_shared_backend}")
+    return _backend
+
+
+async def close_shared_cache():
+    """
+    Closes the shared cache backend created by `connect_shared_cache`, if any.
+    """
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+async def listen_for_invalidations(retry_seconds: float = 1):
+    """
+    Drops the L1 entries invalidated by the other workers, until cancelled.
+
+    Messages published while the subscription is down are lost, so every L1 cache is cleared whenever the
+    subscription is (re-)established; a lost connection is retried every `retry_seconds`.
+    """
+    while _backend is not None:
+        try:
+            for cache in _caches.values():
+                cache.local.clear()
+            async for message in _backend.subscribe(_invalidation_channel()):
+                invalidation = bson.decode(message)
+                cache = _caches.get(invalidation['cache'])
+                if cache is None or invalidation['origin'] == _origin:
+                    continue
+                for key in invalidation['keys']:
+                    cache.local.delete(key)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.warning("Shared cache invalidation subscription failed, retrying", exc_info=True)
+        await asyncio.sleep(retry_seconds)
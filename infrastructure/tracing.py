@@ -0,0 +1,427 @@
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import time
+from collections import deque
+from contextlib import aclosing, contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pymongo import monitoring
+
+from infrastructure.auto_import import wrap_package_functions
+from infrastructure.query_counter import command_shape
+from infrastructure.settings import settings
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+
+class SpanContext(NamedTuple):
+    """
+    The identity of a span created by another process, e.g. received in a W3C `traceparent` header.
+    """
+    trace_id: str
+    span_id: str
+    sampled: bool
+
+
+class Span:
+    """
+    A timed operation within a trace, following the OpenTelemetry data model.
+
+    Spans are created with `start_span` (or by the `traced` decorator and the tracing middleware and command
+    listener) and exported in the OTLP/JSON encoding once they end, so any OpenTelemetry collector or backend
+    can ingest them. Spans of a trace that was not sampled are not recorded or exported at all.
+
+    Attributes:
+        name (str): The operation name, e.g. "GET /product/{product_id}" or "get_product_by_id_repo".
+        trace_id (str): The 32 hex digit identifier shared by every span of the trace.
+        span_id (str): The 16 hex digit identifier of this span.
+        parent_span_id (Optional[str]): The identifier of the parent span, None for the root span.
+        sampled (bool): Whether the span is recorded and exported.
+        kind (int): The OTLP span kind (internal, server or client).
+        attributes (Dict[str, Any]): Key/value pairs describing the operation.
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id", "sampled", "kind", "attributes",
+                 "start_time_ns", "end_time_ns", "status_code", "status_message")
+
+    def __init__(self, name: str, parent: Optional[Union["Span", SpanContext]] = None, kind: int = SPAN_KIND_INTERNAL,
+                 attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        if parent is None:
+            self.trace_id = os.urandom(16).hex()
+            self.parent_span_id = None
+            self.sampled = random.random() < settings.tracing_sample_ratio
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_span_id = parent.span_id
+            self.sampled = parent.sampled
+        self.span_id = os.urandom(8).hex()
+        self.kind = kind
+        self.attributes = attributes or {}
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self.status_code = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException):
+        """
+        Marks the span as failed with the given exception.
+        """
+        self.status_code = STATUS_ERROR
+        self.status_message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+
+    def end(self):
+        """
+        Ends the span and queues it for export if it was sampled. Ending a span twice has no effect.
+        """
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = time.time_ns()
+        if self.sampled and _processor is not None:
+            _processor.on_end(self)
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_time_ns),
+            "endTimeUnixNano": str(self.end_time_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": self.status_code, "message": self.status_message},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": value if isinstance(value, str) else json.dumps(value, default=str)}}
+
+
+def otlp_payload(spans: List[Span]) -> dict:
+    """
+    Wraps finished spans in an OTLP/JSON `ExportTraceServiceRequest`, as accepted on `/v1/traces`.
+    """
+    return {"resourceSpans": [{
+        "resource": {"attributes": [_otlp_attribute("service.name", settings.tracing_service_name)]},
+        "scopeSpans": [{"scope": {"name": __name__}, "spans": [span.to_otlp() for span in spans]}],
+    }]}
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def get_current_span() -> Optional[Span]:
+    """
+    Returns the span active in the current context, or None outside of any span.
+    """
+    return _current_span.get()
+
+
+@contextmanager
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict[str, Any]] = None,
+               parent: Optional[Union[Span, SpanContext]] = None) -> Iterator[Span]:
+    """
+    Starts a span, makes it the current span for the duration of the `with` block, and ends it afterwards.
+
+    The span is a child of `parent` if given, otherwise of the current span; without either it starts a new
+    trace, which is sampled with probability `TRACING_SAMPLE_RATIO`. Children inherit the sampling decision
+    of their parent, so traces are either recorded completely or not at all. An exception raised inside the
+    block marks the span as failed and is propagated.
+
+    Example:
+        with start_span("recalculate_prices", attributes={"products": 120}):
+            await recalculate_prices()
+    """
+    span = Span(name, parent or _current_span.get(), kind, attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except Exception as e:
+        span.record_exception(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def traced(function: Callable) -> Callable:
+    """
+    Decorator that records every call of a function as a span named after it.
+
+    Coroutine and plain functions run inside the span, so spans started by the functions they call become
+    its children. Async generator functions (streamed results) are recorded from the first to the last item,
+    as a child of the span active when iteration starts, but are not made current, because they may be
+    iterated from a different task than the one that created them.
+
+    Example:
+        get_product_by_id_service = traced(get_product_by_id_service)
+    """
+    name = function.__name__
+    attributes = {"code.function": name, "code.namespace": function.__module__}
+
+    if inspect.isasyncgenfunction(function):
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            span = Span(name, _current_span.get(), attributes=dict(attributes))
+            try:
+                async with aclosing(function(*args, **kwargs)) as items:
+                    async for item in items:
+                        yield item
+            except Exception as e:
+                span.record_exception(e)
+                raise
+            finally:
+                span.end()
+
+    elif inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            with start_span(name, attributes=dict(attributes)):
+                return await function(*args, **kwargs)
+
+    else:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with start_span(name, attributes=dict(attributes)):
+                return function(*args, **kwargs)
+
+    return wrapper
+
+
+def _parse_traceparent(header: Optional[str]) -> Optional[SpanContext]:
+    parts = (header or "").split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        return SpanContext(parts[1], parts[2], bool(int(parts[3], 16) & 1))
+    except ValueError:
+        return None
+
+
+async def tracing_middleware(request, call_next):
+    """
+    HTTP middleware that records every request as a server span, the root of the spans of its service,
+    repository and MongoDB calls.
+
+    An incoming W3C `traceparent` header makes the request part of the caller's trace, and its sampling
+    decision is honoured. The span is named after the route template that served the request (e.g.
+    `GET /product/{product_id}`), and responses with a 5xx status mark it as failed.
+
+    Example:
+        app.middleware("http")(tracing_middleware)
+    """
+    attributes = {"http.request.method": request.method, "url.path": request.url.path}
+    parent = _parse_traceparent(request.headers.get("traceparent"))
+    with start_span(f"{request.method} {request.url.path}", SPAN_KIND_SERVER, attributes, parent) as span:
+        response = await call_next(request)
+        route = getattr(request.scope.get("route"), "path", None)
+        if route:
+            span.name = f"{request.method} {route}"
+            span.set_attribute("http.route", route)
+        span.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 500:
+            span.status_code = STATUS_ERROR
+        return response
+
+
+class TracingCommandListener(monitoring.CommandListener):
+    """
+    PyMongo command listener that records every MongoDB command as a client span, child of the current span.
+
+    Commands issued outside of a sampled trace are ignored. The span carries the collection and the shape of
+    the command's filter (see `query_shape`), never its values.
+    """
+
+    def __init__(self):
+        self._spans: Dict[Tuple[Any, int], Span] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        parent = _current_span.get()
+        if parent is None or not parent.sampled:
+            return
+        shape = command_shape(event.command_name, event.command)
+        self._spans[(event.connection_id, event.request_id)] = Span(
+            f"mongodb.{event.command_name}", parent, SPAN_KIND_CLIENT, {
+                "db.system": "mongodb",
+                "db.name": event.database_name,
+                "db.operation": event.command_name,
+                "db.mongodb.collection": shape.pop("collection", ""),
+                "db.statement": json.dumps(shape),
+            },
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.end()
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.status_code = STATUS_ERROR
+            span.status_message = str(event.failure.get("errmsg", ""))
+            span.end()
+
+
+class FileSpanExporter:
+    """
+    Appends batches of spans to a file, one OTLP/JSON `ExportTraceServiceRequest` per line (the format of the
+    OpenTelemetry collector's file exporter).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _write(self, line: str):
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+    async def export(self, spans: List[Span]):
+        await asyncio.to_thread(self._write, json.dumps(otlp_payload(spans)))
+
+    async def close(self):
+        pass
+
+
+class OtlpHttpSpanExporter:
+    """
+    Sends batches of spans to an OTLP/HTTP endpoint (e.g. `http://localhost:4318/v1/traces`) as JSON.
+
+    httpx is imported when the exporter is created, so it is not loaded at startup unless traces are sent.
+    """
+
+    def __init__(self, endpoint: str):
+        import httpx
+
+        self.endpoint = endpoint
+        self._client = httpx.AsyncClient(timeout=10)
+
+    async def export(self, spans: List[Span]):
+        response = await self._client.post(self.endpoint, json=otlp_payload(spans))
+        response.raise_for_status()
+
+    async def close(self):
+        await self._client.aclose()
+
+
+class BatchSpanProcessor:
+    """
+    Queues finished spans and exports them in batches from a background task, so requests never wait on the
+    exporter.
+
+    The queue is bounded: when the exporter cannot keep up, new spans are dropped (and counted in `dropped`)
+    instead of growing memory, which keeps tracing safe to leave on under full load.
+
+    Args:
+        exporter: A `FileSpanExporter` or `OtlpHttpSpanExporter`.
+        max_queue_size (int): Maximum number of spans waiting to be exported.
+        max_batch_size (int): Maximum number of spans per export, and the queue length that triggers one.
+        schedule_delay_seconds (float): Maximum time a span waits in the queue before being exported.
+    """
+
+    def __init__(self, exporter, max_queue_size: int = 2048, max_batch_size: int = 512,
+                 schedule_delay_seconds: float = 5):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.schedule_delay_seconds = schedule_delay_seconds
+        self.dropped = 0
+        self._queue: Deque[Span] = deque(maxlen=max_queue_size)
+        self._batch_ready = asyncio.Event()
+
+    def on_end(self, span: Span):
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+            return
+        self._queue.append(span)
+        if len(self._queue) >= self.max_batch_size:
+            self._batch_ready.set()
+
+    async def run(self):
+        """
+        Exports queued spans until cancelled. Export failures are logged and the batch is discarded.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.schedule_delay_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+    async def flush(self):
+        """
+        Exports every queued span.
+        """
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self.max_batch_size, len(self._queue)))]
+            try:
+                await self.exporter.export(batch)
+            except Exception:
+                logger.warning("Exporting %d spans failed", len(batch), exc_info=True)
+
+    async def shutdown(self):
+        await self.flush()
+        await self.exporter.close()
+
+
+_processor: Optional[BatchSpanProcessor] = None
+
+
+def configure_tracing() -> Optional[BatchSpanProcessor]:
+    """
+    Creates the span processor and exporter selected by `TRACING_EXPORTER`, or returns None if tracing is off.
+
+    The processor's `run` coroutine must be scheduled on the event loop (the application lifespan does it),
+    and `shutdown` awaited on exit so the last spans are exported.
+
+    Raises:
+        ValueError: If `TRACING_EXPORTER` is not one of `off`, `file` or `otlp`.
+    """
+    global _processor
+    if settings.tracing_exporter == "off":
+        _processor = None
+    elif settings.tracing_exporter == "file":
+        _processor = BatchSpanProcessor(FileSpanExporter(settings.tracing_file_path))
+    elif settings.tracing_exporter == "otlp":
+        _processor = BatchSpanProcessor(OtlpHttpSpanExporter(settings.tracing_otlp_endpoint))
+    else:
+        raise ValueError(f"Unknown tracing exporter: {settings.tracing_exporter}")
+    return _processor
+
+
+def instrument_layers(package_name: str):
+    """
+    Applies `traced` to every `*_service` function of the `services` packages and every `*_repo` function
+    of the `repositories` packages under `package_name` (see `wrap_package_functions`).
+
+    Example:
+        instrument_layers("core")
+    """
+    wrap_package_functions(package_name, "services", "_service", traced)
+    wrap_package_functions(package_name, "repositories", "_repo", traced)
@@ -3,6 +3,10 @@ from fastapi import FastAPI
 from core.document.router import document_router
 from core.product.router import product_router
 from infrastructure.lifespan import lifespan
+from infrastructure.metrics import instrument_repositories, metrics_endpoint, metrics_middleware
+from infrastructure.query_counter import query_counter_middleware
+from infrastructure.settings import settings
+from infrastructure.tracing import instrument_layers, tracing_middleware
 
 """
 FastAPI application that includes product and document routers.
@@ -32,15 +36,34 @@ Routers Included:
     - `document_router`: Manages document-related endpoints, including operations for handling
       and manipulating documents.
 
+Metrics:
+    - With `METRICS_ENABLED=true`, every request and every repository call is measured and the metrics are
+      served in the Prometheus text format on `GET /metrics`.
+
+Tracing:
+    - With `TRACING_EXPORTER` set, every request, service call, repository call and MongoDB command is
+      recorded as an OpenTelemetry span and exported in the background.
+
+Startup:
+    - Importing this module has no side effects besides registering the routes: the endpoint modules are
+      read from the checked-in endpoint manifest, and MongoDB is only contacted from the lifespan.
+
 Lifespan:
     - The `lifespan` parameter manages startup and shutdown events for the FastAPI application,
       ensuring that necessary tasks are performed before the app starts and after it shuts down.
 """
 
 app = FastAPI(lifespan=lifespan)
+app.middleware("http")(query_counter_middleware)
 
 app.include_router(product_router)
 app.include_router(document_router)
 
-for route in app.routes:
-    print(f"Route: {route.path}, Methods: {route.methods}")
\ No newline at end of file
+if settings.metrics_enabled:
+    app.middleware("http")(metrics_middleware)
+    app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+    instrument_repositories("core")
+
+if settings.tracing_exporter != "off":
+    app.middleware("http")(tracing_middleware)
+    instrument_layers("core")
\ No newline at end of file
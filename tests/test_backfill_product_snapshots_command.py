@@ -0,0 +1,95 @@
+import asyncio
+
+from bson import ObjectId
+
+from core.document.commands import backfill_product_snapshots_command as backfill_module
+from core.document.dtos.document_dto import DocumentDto
+
+PRODUCT = {'_id': ObjectId(), 'code': 'P001', 'name': 'Blue Pen', 'price': 1.5}
+DELETED_PRODUCT_ID = ObjectId()
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def sort(self, key, direction):
+        self.rows = sorted(self.rows, key=lambda row: row[key])
+        return self
+
+    def limit(self, count):
+        self.rows = self.rows[:count]
+        return self
+
+    async def to_list(self):
+        return self.rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+class FakeDocuments:
+    def __init__(self, documents):
+        self.documents = {document['_id']: document for document in documents}
+
+    def find(self, query, projection):
+        return FakeCursor([
+            document for document in self.documents.values()
+            if any(isinstance(item['product'], ObjectId) for item in document['items'])
+            and document['_id'] > query.get('_id', {}).get('$gt', ObjectId('0' * 24))
+        ])
+
+    async def bulk_write(self, operations, ordered):
+        for operation in operations:
+            self.documents[operation._filter['_id']].update(operation._doc['$set'])
+
+
+class FakeProducts:
+    def find(self, query):
+        return FakeCursor([PRODUCT] if PRODUCT['_id'] in query['_id']['$in'] else [])
+
+
+def legacy_document(*product_ids):
+    return {
+        '_id': ObjectId(), 'reference': f'INV-{ObjectId()}', 'consecutive': 1, 'concept': 'sale',
+        'datetime': None, 'description': None,
+        'items': [{'product': product_id, 'quantity': 2, 'price': 1.25} for product_id in product_ids],
+    }
+
+
+def run_backfill(monkeypatch, documents):
+    collection = FakeDocuments(documents)
+    monkeypatch.setattr(backfill_module, "get_collection",
+                        lambda entity: collection if entity.__name__ == "Document" else FakeProducts())
+    return asyncio.run(backfill_module.backfill_product_snapshots(batch_size=1)), collection
+
+
+def test_items_of_deleted_products_get_a_placeholder_snapshot(monkeypatch, capsys):
+    document = legacy_document(PRODUCT['_id'], DELETED_PRODUCT_ID)
+
+    migrated, collection = run_backfill(monkeypatch, [document])
+
+    assert migrated == 1
+    items = DocumentDto.from_raw(collection.documents[document['_id']]).items
+    assert [(item.product_id, item.product_code, item.product_name) for item in items] == [
+        (str(PRODUCT['_id']), 'P001', 'Blue Pen'),
+        (str(DELETED_PRODUCT_ID), backfill_module.DELETED_PRODUCT_CODE, backfill_module.DELETED_PRODUCT_NAME),
+    ]
+    assert items[1].price == 1.25
+    assert "1 with deleted products" in capsys.readouterr().out
+
+
+def test_documents_with_deleted_products_are_counted_separately(monkeypatch, capsys):
+    documents = [legacy_document(PRODUCT['_id']), legacy_document(DELETED_PRODUCT_ID),
+                 legacy_document(PRODUCT['_id'])]
+
+    migrated, _ = run_backfill(monkeypatch, documents)
+
+    assert migrated == 3
+    output = capsys.readouterr().out
+    assert "Migrated 3 documents (1 with deleted products)" in output
+    assert str(DELETED_PRODUCT_ID) in output
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timezone
+
+import bson
+import pytest
+from bson import ObjectId
+
+from core.document.dtos.document_dto import DOCUMENT_PROJECTION
+from core.document.entities.document import Document
+from core.document.entities.document_item import DocumentItem
+from core.document.entities.product_snapshot import ProductSnapshot
+from core.document.services import create_document_idempotently_service as service_module
+
+ITEMS = [{'product_id': str(ObjectId()), 'quantity': 2}]
+
+
+class FakeStore:
+    """
+    Stands in for the idempotency key and document collections, storing documents as BSON like MongoDB.
+    """
+
+    def __init__(self):
+        self.keys = {}
+        self.documents = {}
+
+    async def get_idempotency_key(self, key):
+        record = self.keys.get(key)
+        if record is None:
+            return None
+        document = self.documents.get(record['document'])
+        projected = {field: document[field] for field in ('_id', *DOCUMENT_PROJECTION)} if document else None
+        return {**record, 'document': projected}
+
+    async def claim_idempotency_key(self, key, request_hash):
+        if key in self.keys:
+            return False
+        self.keys[key] = {'_id': key, 'request_hash': request_hash, 'document': None}
+        return True
+
+    async def complete_idempotency_key(self, key, document_id):
+        self.keys[key]['document'] = document_id
+
+    async def create_document(self, reference, concept, items, description=None):
+        document = Document(
+            id=ObjectId(), reference=reference, concept=concept, description=description, consecutive=1,
+            datetime=datetime.now(timezone.utc).replace(microsecond=123456),
+            items=[DocumentItem(product=ProductSnapshot(id=ObjectId(item['product_id']), code="P001",
+                                                        name="Blue Pen", price=1.5),
+                                quantity=item['quantity'], price=1.5) for item in items],
+        )
+        self.documents[document.id] = bson.decode(bson.encode(document.to_mongo()))
+        return document
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = FakeStore()
+
+    async def cache_document(document):
+        return b""
+
+    monkeypatch.setattr(service_module, "get_idempotency_key_repo", store.get_idempotency_key)
+    monkeypatch.setattr(service_module, "claim_idempotency_key_repo", store.claim_idempotency_key)
+    monkeypatch.setattr(service_module, "complete_idempotency_key_repo", store.complete_idempotency_key)
+    monkeypatch.setattr(service_module, "create_document_repo", store.create_document)
+    monkeypatch.setattr(service_module, "cache_document", cache_document)
+    return store
+
+
+def create(key="retry-safe"):
+    return service_module.create_document_idempotently_service(key, "hash", "INV-1", "sale", ITEMS, "Sale")
+
+
+def test_a_retry_returns_the_same_body_as_the_original_request(store):
+    async def run():
+        return await create(), await create()
+
+    original, retry = asyncio.run(run())
+
+    assert len(store.documents) == 1
+    assert retry.model_dump_json() == original.model_dump_json()
+    assert original.datetime.microsecond == 123000
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from bson import ObjectId
+
+from core.document.cursor import decode_document_cursor, encode_document_cursor
+
+DOCUMENT_ID = ObjectId("60c72b2f9b1d8f7c6d0f1a2d")
+
+
+def test_encodes_the_datetime_in_epoch_milliseconds_and_the_id():
+    raw = {'datetime': datetime(2024, 11, 20, 10, 0, tzinfo=timezone.utc), '_id': DOCUMENT_ID}
+
+    assert encode_document_cursor(raw) == "1732096800000_60c72b2f9b1d8f7c6d0f1a2d"
+
+
+def test_naive_datetimes_are_read_as_utc():
+    aware = {'datetime': datetime(2024, 11, 20, 10, 0, tzinfo=timezone.utc), '_id': DOCUMENT_ID}
+    naive = {'datetime': datetime(2024, 11, 20, 10, 0), '_id': DOCUMENT_ID}
+
+    assert encode_document_cursor(naive) == encode_document_cursor(aware)
+
+
+def test_a_cursor_round_trips_at_millisecond_precision():
+    moment = datetime(2024, 11, 20, 10, 0, 0, 123456, tzinfo=timezone.utc)
+
+    decoded = decode_document_cursor(encode_document_cursor({'datetime': moment, '_id': DOCUMENT_ID}))
+
+    assert decoded == (moment.replace(microsecond=123000), DOCUMENT_ID)
+
+
+def test_datetimes_before_the_epoch_round_trip():
+    moment = datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc)
+
+    cursor = encode_document_cursor({'datetime': moment, '_id': DOCUMENT_ID})
+
+    assert cursor.startswith("-500_")
+    assert decode_document_cursor(cursor) == (moment, DOCUMENT_ID)
+
+
+def test_cursors_order_like_the_documents_they_point_at():
+    base = datetime(2024, 11, 20, tzinfo=timezone.utc)
+    earlier = decode_document_cursor(encode_document_cursor({'datetime': base, '_id': DOCUMENT_ID}))
+    later = decode_document_cursor(encode_document_cursor({'datetime': base + timedelta(milliseconds=1),
+                                                           '_id': DOCUMENT_ID}))
+
+    assert earlier < later
+
+
+@pytest.mark.parametrize("cursor", ["", "1732096800000", "1732096800000_", "_60c72b2f9b1d8f7c6d0f1a2d",
+                                    "abc_60c72b2f9b1d8f7c6d0f1a2d", "1732096800000_not-an-object-id",
+                                    "1.5_60c72b2f9b1d8f7c6d0f1a2d"])
+def test_rejects_malformed_cursors(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_document_cursor(cursor)
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from bson import ObjectId
+
+from core.document.group_commit import document_group_commit
+from core.document.repositories import create_document_repo as create_document_module
+from core.document.repositories import create_documents_repo as create_documents_module
+from core.product.entities.product import Product
+
+PRODUCT = Product(id=ObjectId(), code="P001", name="Blue Pen", price=1.5)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.inserted = []
+
+    async def insert_many(self, raws, ordered=True):
+        for raw in raws:
+            raw['_id'] = ObjectId()
+        self.inserted.extend(raws)
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = FakeCollection()
+    sequences = {}
+
+    async def find_products_by_ids(product_ids):
+        return {product_id: PRODUCT for product_id in product_ids if product_id == str(PRODUCT.id)}
+
+    async def reserve_sequence_block(concept, count):
+        sequences[concept] = sequences.get(concept, 0) + count
+        return sequences[concept]
+
+    async def apply_document_stock(documents):
+        list(documents)
+
+    monkeypatch.setattr(create_documents_module, "find_products_by_ids_repo", find_products_by_ids)
+    monkeypatch.setattr(create_documents_module, "reserve_sequence_block_repo", reserve_sequence_block)
+    monkeypatch.setattr(create_documents_module, "apply_document_stock_repo", apply_document_stock)
+    monkeypatch.setattr(create_documents_module, "get_collection", lambda entity: collection)
+    monkeypatch.setattr(document_group_commit, "window_seconds", 0.01)
+    monkeypatch.setattr(document_group_commit, "max_batch_size", 10)
+    return collection
+
+
+def create(reference, items):
+    return create_document_module.create_document_repo(reference, "sale", items)
+
+
+def test_an_invalid_document_fails_alone_in_its_batch(collection):
+    items = [{'product_id': str(PRODUCT.id), 'quantity': 2}]
+
+    async def run():
+        return await asyncio.gather(create("INV-1", items), create("INV-2", []), create("INV-3", items),
+                                    return_exceptions=True)
+
+    first, invalid, third = asyncio.run(run())
+
+    assert (first.reference, first.consecutive) == ("INV-1", 1)
+    assert (third.reference, third.consecutive) == ("INV-3", 3)
+    assert isinstance(invalid, ValueError) and "items" in str(invalid)
+    assert [raw['reference'] for raw in collection.inserted] == ["INV-1", "INV-3"]
+
+
+def test_a_missing_product_fails_alone_in_its_batch(collection):
+    missing_id = str(ObjectId())
+
+    async def run():
+        return await asyncio.gather(create("INV-1", [{'product_id': str(PRODUCT.id), 'quantity': 1}]),
+                                    create("INV-2", [{'product_id': missing_id, 'quantity': 1}]),
+                                    return_exceptions=True)
+
+    created, missing = asyncio.run(run())
+
+    assert created.reference == "INV-1"
+    assert isinstance(missing, ValueError) and str(missing) == f"Products with IDs {missing_id} not found"
+    assert [raw['reference'] for raw in collection.inserted] == ["INV-1"]
@@ -0,0 +1,36 @@
+import asyncio
+import csv
+import io
+from datetime import datetime
+
+from bson import ObjectId
+
+from core.document.dtos.document_export_dto import DOCUMENT_EXPORT_COLUMNS, DocumentExportDto
+from core.document.services import export_documents_csv_service as export_module
+
+PRODUCT_ID = ObjectId()
+
+
+def test_rows_hold_one_item_each_with_aware_utc_datetimes(monkeypatch):
+    async def stream_documents(export, batch_size):
+        yield {
+            'reference': 'INV-1', 'concept': 'sale', 'consecutive': 7, 'description': None,
+            # PyMongo returns the stored UTC datetime without a timezone.
+            'datetime': datetime(2024, 5, 1, 10, 0, 0, 250000),
+            'items': [
+                {'product': {'id': PRODUCT_ID, 'code': 'P001', 'name': 'Blue Pen'}, 'quantity': 2, 'price': 1.5},
+                {'product': {'id': PRODUCT_ID, 'code': 'P001', 'name': 'Blue Pen'}, 'quantity': 1, 'price': 1.5},
+            ],
+        }
+
+    monkeypatch.setattr(export_module, "stream_documents_repo", stream_documents)
+
+    async def run():
+        return b"".join([chunk async for chunk in export_module.export_documents_csv_service(DocumentExportDto())])
+
+    rows = list(csv.reader(io.StringIO(asyncio.run(run()).decode())))
+
+    assert rows[0] == list(DOCUMENT_EXPORT_COLUMNS)
+    assert rows[1] == ['INV-1', 'sale', '7', '2024-05-01T10:00:00.250000+00:00', '', str(PRODUCT_ID), 'P001',
+                       'Blue Pen', '2', '1.5', '3.0']
+    assert len(rows) == 3
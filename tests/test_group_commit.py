@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from infrastructure.group_commit import GroupCommit, group_commit_flushes_total
+from infrastructure.query_counter import get_query_counter, track_queries
+from infrastructure.tracing import get_current_span, start_span
+
+
+class RecordingFlush:
+    def __init__(self, fail_with=None):
+        self.batches = []
+        self.fail_with = fail_with
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        if self.fail_with is not None:
+            raise self.fail_with
+        return [item * 10 for item in items]
+
+
+def test_flushes_a_full_batch_without_waiting_for_the_window():
+    flush = RecordingFlush()
+    stage = GroupCommit("test_size", flush, window_seconds=60, max_batch_size=3)
+
+    async def run():
+        return await asyncio.wait_for(asyncio.gather(*(stage.submit(i) for i in range(3))), timeout=1)
+
+    assert asyncio.run(run()) == [0, 10, 20]
+    assert flush.batches == [[0, 1, 2]]
+    assert group_commit_flushes_total._values[("test_size", "size")] == 1
+
+
+def test_flushes_a_partial_batch_when_the_window_closes():
+    flush = RecordingFlush()
+    stage = GroupCommit("test_window", flush, window_seconds=0.01, max_batch_size=100)
+
+    async def run():
+        return await asyncio.gather(stage.submit(1), stage.submit(2))
+
+    assert asyncio.run(run()) == [10, 20]
+    assert flush.batches == [[1, 2]]
+    assert group_commit_flushes_total._values[("test_window", "window")] == 1
+
+
+def test_items_beyond_a_full_batch_start_the_next_one():
+    flush = RecordingFlush()
+    stage = GroupCommit("test_overflow", flush, window_seconds=0.01, max_batch_size=2)
+
+    async def run():
+        return await asyncio.gather(*(stage.submit(i) for i in range(5)))
+
+    assert asyncio.run(run()) == [0, 10, 20, 30, 40]
+    assert flush.batches == [[0, 1], [2, 3], [4]]
+
+
+def test_each_submitter_receives_its_own_result():
+    async def flush(items):
+        return [f"result-{item}" for item in items]
+
+    stage = GroupCommit("test_results", flush, window_seconds=0.01, max_batch_size=10)
+
+    async def run():
+        first = asyncio.create_task(stage.submit("a"))
+        second = asyncio.create_task(stage.submit("b"))
+        return await second, await first
+
+    assert asyncio.run(run()) == ("result-b", "result-a")
+
+
+def test_a_failed_flush_fails_every_submitter_of_the_batch():
+    flush = RecordingFlush(fail_with=RuntimeError("write failed"))
+    stage = GroupCommit("test_failure", flush, window_seconds=0.01, max_batch_size=10)
+
+    async def run():
+        return await asyncio.gather(stage.submit(1), stage.submit(2), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert flush.batches == [[1, 2]]
+    assert all(isinstance(result, RuntimeError) and str(result) == "write failed" for result in results)
+
+
+def test_a_failed_flush_does_not_affect_the_next_batch():
+    failing = True
+
+    async def flush(items):
+        if failing:
+            raise ValueError("transient")
+        return items
+
+    stage = GroupCommit("test_recovery", flush, window_seconds=0.01, max_batch_size=10)
+
+    async def run():
+        nonlocal failing
+        with pytest.raises(ValueError):
+            await stage.submit(1)
+        failing = False
+        return await stage.submit(2)
+
+    assert asyncio.run(run()) == 2
+
+
+@pytest.mark.parametrize("window_seconds, max_batch_size, enabled", [(0.005, 100, True), (0, 100, False),
+                                                                       (0.005, 1, False)])
+def test_enabled_requires_a_window_and_a_batch_size(window_seconds, max_batch_size, enabled):
+    async def flush(items):
+        return items
+
+    assert GroupCommit("test_enabled", flush, window_seconds, max_batch_size).enabled is enabled
+
+
+def test_each_submitter_is_attributed_the_queries_of_its_batch():
+    async def flush(items):
+        # Stands in for the MongoDB command listener, which counts commands in the current context.
+        get_query_counter().count += 2
+        return items
+
+    stage = GroupCommit("test_queries", flush, window_seconds=0.01, max_batch_size=10)
+
+    async def submit_tracked(item):
+        with track_queries() as counter:
+            await stage.submit(item)
+        return counter.count
+
+    async def run():
+        return await asyncio.gather(submit_tracked(1), submit_tracked(2))
+
+    assert asyncio.run(run()) == [2, 2]
+
+
+def test_a_flush_is_traced_in_its_own_span():
+    flush_spans = []
+
+    async def flush(items):
+        flush_spans.append(get_current_span())
+        return items
+
+    stage = GroupCommit("test_spans", flush, window_seconds=0.01, max_batch_size=10)
+
+    async def submit_traced(item):
+        with start_span(f"request {item}") as span:
+            await stage.submit(item)
+        return span
+
+    async def run():
+        return await asyncio.gather(submit_traced(1), submit_traced(2))
+
+    requests = asyncio.run(run())
+    [flush_span] = flush_spans
+    assert flush_span.name == "group_commit test_spans"
+    assert flush_span.parent_span_id is None
+    assert flush_span.attributes["group_commit.batch_size"] == 2
+    assert [span.attributes["group_commit.trace_id"] for span in requests] == [flush_span.trace_id] * 2
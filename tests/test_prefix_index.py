@@ -0,0 +1,110 @@
+import pytest
+
+from infrastructure.prefix_index import PrefixIndex, normalize_term
+
+
+def product(key, code, name, word=()):
+    return key, {"code": [code], "name": [name], "word": list(word)}, {"id": key}
+
+
+@pytest.fixture
+def index():
+    index = PrefixIndex(("code", "name", "word"))
+    for key, terms, value in (
+        product("1", "P001", "Blue Pen", ["blue", "pen"]),
+        product("2", "P002", "Red Pencil", ["red", "pencil"]),
+        product("3", "PEN-9", "Stapler", ["stapler"]),
+        product("4", "X100", "Café Crème", ["cafe", "creme"]),
+    ):
+        index.put(key, terms, value)
+    return index
+
+
+def ids(values):
+    return [value["id"] for value in values]
+
+
+def test_normalize_term_folds_accents_case_and_whitespace():
+    assert normalize_term("  Café   Crème ") == "cafe creme"
+    assert normalize_term("STRASSE") == normalize_term("straße")
+
+
+def test_search_matches_prefixes(index):
+    assert ids(index.search("p00", 10)) == ["1", "2"]
+    assert ids(index.search("p001", 10)) == ["1"]
+    assert index.search("zzz", 10) == []
+
+
+def test_search_ignores_accents_and_case(index):
+    assert ids(index.search("CAFÉ", 10)) == ["4"]
+    assert ids(index.search("creme", 10)) == ["4"]
+    assert ids(index.search("crè", 10)) == ["4"]
+
+
+def test_matches_on_earlier_fields_rank_first(index):
+    assert ids(index.search("pen", 10)) == ["3", "1", "2"]
+
+
+def test_within_a_field_terms_rank_alphabetically(index):
+    assert ids(index.search("p", 10)) == ["1", "2", "3"]
+
+
+def test_each_entry_is_returned_once(index):
+    index.put("5", {"code": ["PENCIL-5"], "name": ["Pencil"], "word": ["pencil"]}, {"id": "5"})
+
+    assert ids(index.search("pencil", 10)) == ["5", "2"]
+
+
+def test_search_stops_at_the_limit(index):
+    assert ids(index.search("p", 2)) == ["1", "2"]
+    assert ids(index.search("pen", 1)) == ["3"]
+
+
+def test_blank_queries_match_nothing(index):
+    assert index.search("", 10) == []
+    assert index.search("   ", 10) == []
+
+
+def test_put_replaces_the_terms_of_an_existing_entry(index):
+    index.put("1", {"code": ["Q001"], "name": ["Green Marker"]}, {"id": "1", "name": "Green Marker"})
+
+    assert ids(index.search("blue", 10)) == []
+    assert index.search("green", 10) == [{"id": "1", "name": "Green Marker"}]
+    assert len(index) == 4
+
+
+def test_remove_drops_the_entry_from_every_field(index):
+    index.remove("1")
+
+    assert ids(index.search("p00", 10)) == ["2"]
+    assert ids(index.search("blue", 10)) == []
+    assert len(index) == 3
+
+
+def test_remove_ignores_unknown_keys(index):
+    index.remove("missing")
+
+    assert len(index) == 4
+
+
+def test_build_matches_incremental_puts(index):
+    built = PrefixIndex.build(("code", "name", "word"), [
+        product("1", "P001", "Blue Pen", ["blue", "pen"]),
+        product("2", "P002", "Red Pencil", ["red", "pencil"]),
+        product("3", "PEN-9", "Stapler", ["stapler"]),
+        product("4", "X100", "Café Crème", ["cafe", "creme"]),
+    ])
+
+    for query in ("p", "pen", "caf", "red", "x1"):
+        assert built.search(query, 10) == index.search(query, 10)
+
+
+def test_replace_with_swaps_the_content_and_marks_the_index_loaded(index):
+    assert not index.loaded
+
+    index.replace_with(PrefixIndex.build(index.fields, [product("9", "Z009", "Zither")]))
+
+    assert index.loaded
+    assert len(index) == 1
+    assert ids(index.search("zi", 10)) == ["9"]
+    assert index.search("p", 10) == []
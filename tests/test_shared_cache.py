@@ -0,0 +1,208 @@
+import asyncio
+import importlib.util
+
+import bson
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from infrastructure import shared_cache  # noqa: E402
+from infrastructure.lru_cache import LruCache  # noqa: E402
+
+
+class Worker:
+    """
+    One application worker: its own copy of the `shared_cache` module (so its own backend, caches and
+    origin, as in a separate process), connected to a shared fake Redis server.
+    """
+
+    def __init__(self, server, index: int):
+        spec = importlib.util.spec_from_file_location(f"shared_cache_worker_{index}", shared_cache.__file__)
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.module._backend = self.module.RedisCacheBackend(fakeredis.aioredis.FakeRedis(server=server))
+        self.cache = self.module.TieredCache("product", LruCache(max_entries=100), bson.encode, bson.decode)
+        self.listener = None
+
+    def start(self):
+        self.listener = asyncio.create_task(self.module.listen_for_invalidations(retry_seconds=0.01))
+
+    async def stop(self):
+        self.listener.cancel()
+        await asyncio.gather(self.listener, return_exceptions=True)
+        await self.module.close_shared_cache()
+
+
+async def wait_until(condition, timeout=1.0):
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.001)
+
+
+def run_workers(scenario, count=2):
+    """
+    Runs `scenario(*workers)` once every worker is subscribed to the invalidation channel.
+    """
+    async def run():
+        server = fakeredis.FakeServer()
+        workers = [Worker(server, index) for index in range(count)]
+        client = fakeredis.aioredis.FakeRedis(server=server)
+        channel = f"{shared_cache.settings.cache_key_prefix}invalidations"
+        for worker in workers:
+            worker.start()
+        try:
+            async with asyncio.timeout(1):
+                while (await client.pubsub_numsub(channel))[0][1] < count:
+                    await asyncio.sleep(0.001)
+            await scenario(*workers)
+        finally:
+            for worker in workers:
+                await worker.stop()
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_a_put_drops_the_other_workers_local_copy():
+    async def scenario(a, b):
+        await b.cache.fill("p1", {"name": "Blue Pen"})
+        await a.cache.put("p1", {"name": "Blue Marker"})
+
+        await wait_until(lambda: b.cache.local.get("p1") is None)
+        assert await b.cache.get("p1") == {"name": "Blue Marker"}
+        assert b.cache.stats()["shared_hits"] == 1
+
+    run_workers(scenario)
+
+
+def test_an_invalidation_drops_the_other_workers_local_copy_and_the_shared_value():
+    async def scenario(a, b):
+        await a.cache.fill("p1", {"name": "Blue Pen"})
+        assert await b.cache.get("p1") == {"name": "Blue Pen"}
+
+        await a.cache.invalidate(["p1"])
+
+        await wait_until(lambda: b.cache.local.get("p1") is None)
+        assert await b.cache.get("p1") is None
+        assert await a.cache.get("p1") is None
+
+    run_workers(scenario)
+
+
+def test_a_worker_ignores_its_own_invalidations():
+    async def scenario(a, b):
+        await a.cache.put("p1", {"name": "Blue Pen"})
+        # Messages reach a subscriber in order: once `a` applies the invalidation published by `b` after its
+        # own, it has also received (and skipped) its own.
+        await a.cache.fill("sync", {"name": "Sync"})
+        await b.cache.invalidate(["sync"])
+        await wait_until(lambda: a.cache.local.get("sync") is None)
+
+        assert a.cache.local.get("p1") == {"name": "Blue Pen"}
+
+    run_workers(scenario)
+
+
+def test_invalidations_only_apply_to_the_cache_they_name():
+    async def scenario(a, b):
+        b_documents = b.module.TieredCache("document", LruCache(max_entries=100), bytes, bytes)
+        a.module.TieredCache("document", LruCache(max_entries=100), bytes, bytes)
+        b_documents.local.set("p1", b"document")
+        await b.cache.fill("p1", {"name": "Blue Pen"})
+
+        await a.cache.put("p1", {"name": "Blue Marker"})
+
+        await wait_until(lambda: b.cache.local.get("p1") is None)
+        assert b_documents.local.get("p1") == b"document"
+
+    run_workers(scenario)
+
+
+def test_fill_does_not_overwrite_a_shared_value():
+    async def scenario(a, b):
+        await a.cache.put("p1", {"name": "Blue Marker"})
+        await b.cache.fill("p1", {"name": "Blue Pen (stale)"})
+
+        a.cache.local.clear()
+        assert await a.cache.get("p1") == {"name": "Blue Marker"}
+
+    run_workers(scenario)
+
+
+def test_fill_does_not_invalidate_the_other_workers():
+    async def scenario(a, b):
+        await b.cache.fill("p1", {"name": "Blue Pen"})
+        await a.cache.fill("p1", {"name": "Blue Pen"})
+        await a.cache.fill("sync", {"name": "Sync"})
+        await b.cache.fill("sync", {"name": "Sync"})
+        await a.cache.invalidate(["sync"])
+        await wait_until(lambda: b.cache.local.get("sync") is None)
+
+        assert b.cache.local.get("p1") == {"name": "Blue Pen"}
+
+    run_workers(scenario)
+
+
+def test_put_overwrites_a_shared_value():
+    async def scenario(a, b):
+        await a.cache.fill("p1", {"name": "Blue Pen"})
+        await b.cache.put("p1", {"name": "Blue Marker"})
+
+        await wait_until(lambda: a.cache.local.get("p1") is None)
+        assert await a.cache.get("p1") == {"name": "Blue Marker"}
+
+    run_workers(scenario)
+
+
+def test_get_many_reads_the_local_misses_in_one_shared_request():
+    async def scenario(a, b):
+        await a.cache.fill_many({"p1": {"name": "Blue Pen"}, "p2": {"name": "Red Pencil"}})
+        await b.cache.fill("p1", {"name": "Blue Pen"})
+
+        assert await b.cache.get_many(["p1", "p2", "p3"]) == {"p1": {"name": "Blue Pen"},
+                                                              "p2": {"name": "Red Pencil"}}
+        stats = b.cache.stats()
+        assert (stats["shared_hits"], stats["shared_misses"]) == (1, 1)
+
+    run_workers(scenario)
+
+
+def test_a_failing_shared_backend_behaves_as_an_empty_one():
+    class FailingBackend(shared_cache.CacheBackend):
+        async def get_many(self, keys):
+            raise ConnectionError("down")
+
+        async def set_many(self, items, ttl_seconds=None, only_if_absent=False):
+            raise ConnectionError("down")
+
+        async def delete_many(self, keys):
+            raise ConnectionError("down")
+
+        async def publish(self, channel, message):
+            raise ConnectionError("down")
+
+        async def subscribe(self, channel):
+            raise ConnectionError("down")
+            yield
+
+    async def scenario():
+        worker = Worker(fakeredis.FakeServer(), 99)
+        worker.module._backend = FailingBackend()
+        await worker.cache.put("p1", {"name": "Blue Pen"})
+
+        assert await worker.cache.get("p1") == {"name": "Blue Pen"}
+        assert await worker.cache.get("p2") is None
+        await worker.cache.invalidate(["p1"])
+        assert await worker.cache.get("p1") is None
+        assert worker.cache.stats()["shared_errors"] == 4
+
+    asyncio.run(scenario())
+
+
+def test_a_backend_must_implement_the_whole_interface():
+    class PartialBackend(shared_cache.CacheBackend):
+        async def get_many(self, keys):
+            return [None] * len(keys)
+
+    with pytest.raises(TypeError):
+        PartialBackend()
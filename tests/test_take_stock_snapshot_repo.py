@@ -0,0 +1,117 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+from core.stock.repositories import take_stock_snapshot_repo as take_stock_snapshot_module
+
+PRODUCT = ObjectId()
+T0 = datetime(2024, 11, 20, 10, 0)
+
+
+class Cursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def to_list(self):
+        return self.rows
+
+
+class FakeDocuments:
+    """
+    Nets a fixed list of `(datetime, product, quantity)` movements over the window of the pipeline.
+    """
+
+    def __init__(self, movements):
+        self.movements = movements
+
+    async def aggregate(self, pipeline):
+        window = pipeline[0]['$match']['datetime']
+        totals = {}
+        for moment, product, quantity in self.movements:
+            if moment <= window['$lte'].replace(tzinfo=None) and ('$gt' not in window or moment > window['$gt']):
+                totals[product] = totals.get(product, 0) + quantity
+        return Cursor([{'_id': product, 'quantity': quantity} for product, quantity in totals.items()])
+
+
+class FakeSnapshots:
+    def __init__(self, snapshots, written_concurrently=()):
+        self.snapshots = list(snapshots)
+        self.written_concurrently = list(written_concurrently)
+
+    async def find_one(self, filter, projection, sort):
+        latest = max(self.snapshots, key=lambda snapshot: snapshot['at'], default=None)
+        # Another run writes its snapshots right after this one read the previous snapshot.
+        self.snapshots.extend(self.written_concurrently)
+        return latest
+
+    async def aggregate(self, pipeline):
+        match = pipeline[0]['$match']
+        latest = {}
+        for snapshot in self.snapshots:
+            if snapshot['product'] in match['product']['$in'] and snapshot['at'] <= match['at']['$lte']:
+                if snapshot['product'] not in latest or snapshot['at'] > latest[snapshot['product']]['at']:
+                    latest[snapshot['product']] = snapshot
+        return Cursor([{'_id': product, 'quantity': snapshot['quantity']} for product, snapshot in latest.items()])
+
+    async def bulk_write(self, operations, ordered):
+        upserted = 0
+        for operation in operations:
+            filter, update = operation._filter, operation._doc
+            if not any(snapshot['product'] == filter['product'] and snapshot['at'] == filter['at']
+                       for snapshot in self.snapshots):
+                self.snapshots.append({**filter, 'at': filter['at'].replace(tzinfo=None),
+                                       **update['$setOnInsert']})
+                upserted += 1
+        return type("BulkWriteResult", (), {'upserted_count': upserted})()
+
+    def quantity_at(self, at):
+        return next(snapshot['quantity'] for snapshot in self.snapshots if snapshot['at'] == at)
+
+
+@pytest.fixture
+def collections(monkeypatch):
+    def install(documents, snapshots):
+        monkeypatch.setattr(take_stock_snapshot_module, "get_collection",
+                            lambda entity: snapshots if entity.__name__ == "StockSnapshot" else documents)
+        return snapshots
+
+    return install
+
+
+def test_the_first_snapshot_replays_the_whole_history(collections):
+    snapshots = collections(FakeDocuments([(T0, PRODUCT, 4), (T0 + timedelta(minutes=1), PRODUCT, -1)]),
+                            FakeSnapshots([]))
+
+    written = asyncio.run(take_stock_snapshot_module.take_stock_snapshot_repo(T0 + timedelta(minutes=5)))
+
+    assert written == 1
+    assert snapshots.quantity_at(T0 + timedelta(minutes=5)) == 3
+
+
+def test_a_snapshot_written_by_an_overlapping_run_is_not_added_to_again(collections):
+    t1, t2 = T0 + timedelta(minutes=1), T0 + timedelta(minutes=2)
+    documents = FakeDocuments([(T0 + timedelta(seconds=30), PRODUCT, 2), (T0 + timedelta(seconds=90), PRODUCT, 1)])
+    snapshots = collections(documents, FakeSnapshots(
+        [{'product': PRODUCT, 'at': T0, 'quantity': 5}],
+        written_concurrently=[{'product': PRODUCT, 'at': t1, 'quantity': 7}],
+    ))
+
+    asyncio.run(take_stock_snapshot_module.take_stock_snapshot_repo(t2))
+
+    assert snapshots.quantity_at(t2) == 8
+
+
+def test_an_existing_snapshot_at_the_same_instant_is_left_as_is(collections):
+    t1 = T0 + timedelta(minutes=1)
+    documents = FakeDocuments([(T0 + timedelta(seconds=30), PRODUCT, 2)])
+    snapshots = collections(documents, FakeSnapshots(
+        [{'product': PRODUCT, 'at': T0, 'quantity': 5}],
+        written_concurrently=[{'product': PRODUCT, 'at': t1, 'quantity': 7}],
+    ))
+
+    written = asyncio.run(take_stock_snapshot_module.take_stock_snapshot_repo(t1 + timedelta(microseconds=400)))
+
+    assert written == 0
+    assert [snapshot['quantity'] for snapshot in snapshots.snapshots if snapshot['at'] == t1] == [7]